@@ -1,11 +1,22 @@
 # -*- mode: python ; coding: utf-8 -*-
 
+import glob
+import os
+import sys
+
+# Tabela binária de feriados (tabela_feriados.py): regenerada com a workalendar do
+# ambiente de build e incluída ao lado dos módulos, onde calendario_utils a procura
+sys.path.insert(0, SPECPATH)
+from tabela_feriados import gerar_tabela
+
+gerar_tabela()
+tabelas = [(caminho, '.') for caminho in sorted(glob.glob(os.path.join(SPECPATH, 'feriados_*.bin')))]
 
 a = Analysis(
     ['gui.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=tabelas,
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
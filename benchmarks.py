@@ -0,0 +1,328 @@
+"""
+Suíte de benchmarks dos caminhos críticos de calendário, validação e métricas
+
+Uso:
+    python benchmarks.py --saida resultados.json
+    python benchmarks.py --saida atual.json --baseline baseline.json
+    python benchmarks.py --comparar baseline.json atual.json
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import calendario_utils
+from calendario_utils import (
+    IndiceDiasUteis,
+    calcular_dias_uteis_periodo,
+    calcular_dias_uteis_periodo_lote,
+    mostrar_feriados_periodo
+)
+from calculos_operacionais import calcular_metricas_operacionais
+from ingestao_chamados import agregar_chamados, ler_chamados
+from janelas_moveis import planejar_janelas_moveis
+from simulacao_fila import simular_fila
+from simulacao_risco import simular_risco_dimensionamento
+from validacoes import (
+    LIMITES,
+    validar_dados_completos,
+    validar_dados_lote,
+    validar_data_robusta,
+    validar_datas_lote
+)
+
+# Tamanhos de período medidos (em dias), de 1 dia a 100 anos
+TAMANHOS_PERIODO = [1, 30, 365, 3650, 36500]
+
+# Tamanhos de lote medidos
+TAMANHOS_LOTE = [1000, 10000, 100000]
+
+# Aumento relativo de tempo a partir do qual um resultado é considerado regressão
+TOLERANCIA_PADRAO = 0.20
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+
+def medir(funcao, repeticoes=5):
+    """
+    Mede o tempo de execução de uma função
+
+    Args:
+        funcao (callable): Função sem argumentos a ser medida
+        repeticoes (int): Quantidade de execuções
+
+    Returns:
+        dict: Mediana e mínimo em segundos e número de repetições
+    """
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return {
+        'segundos': statistics.median(tempos),
+        'minimo': min(tempos),
+        'repeticoes': repeticoes
+    }
+
+def limpar_indices():
+    """Descarta os índices de dias úteis em memória (estado frio)"""
+    calendario_utils._indices.clear()
+
+def benchmark_calendario(resultados):
+    """Mede as consultas de período em estado frio e quente"""
+    inicio = datetime.date(LIMITES['ANO_MIN'], 1, 1)
+
+    resultados['calendario.construir_indice_workalendar'] = medir(
+        lambda: IndiceDiasUteis.construir(
+            calendario_utils._criar_calendario(), LIMITES['ANO_MIN'], LIMITES['ANO_MAX']
+        ),
+        repeticoes=3
+    )
+
+    def consulta_fria():
+        limpar_indices()
+        calcular_dias_uteis_periodo(inicio, inicio)
+
+    resultados['calendario.primeira_consulta_fria'] = medir(consulta_fria, repeticoes=3)
+
+    for dias in TAMANHOS_PERIODO:
+        fim = inicio + datetime.timedelta(days=dias - 1)
+        calcular_dias_uteis_periodo(inicio, fim)
+        resultados[f'calendario.dias_uteis_periodo.{dias}d'] = medir(
+            lambda: calcular_dias_uteis_periodo(inicio, fim)
+        )
+        resultados[f'calendario.feriados_periodo.{dias}d'] = medir(
+            lambda: mostrar_feriados_periodo(inicio, fim)
+        )
+
+    # Contagem vetorizada de muitos períodos de até um ano
+    import numpy as np
+    gerador = np.random.default_rng(0)
+    for tamanho in TAMANHOS_LOTE + [1000000]:
+        inicios = np.datetime64(inicio, 'D') + gerador.integers(0, 36000, tamanho)
+        fins = inicios + gerador.integers(0, 366, tamanho)
+        medida = medir(lambda: calcular_dias_uteis_periodo_lote(inicios, fins), repeticoes=3)
+        medida['periodos_por_segundo'] = tamanho / medida['segundos'] if medida['segundos'] > 0 else 0.0
+        resultados[f'calendario.dias_uteis_periodo_lote.{tamanho}'] = medida
+
+def benchmark_validacoes(resultados):
+    """Mede a validação de datas e de formulários completos em lotes"""
+    for tamanho in TAMANHOS_LOTE:
+        datas = [f"{1 + i % 28:02d}/{1 + i % 12:02d}/{2000 + i % 100}" for i in range(tamanho)]
+        resultados[f'validacoes.validar_data_robusta.{tamanho}'] = medir(
+            lambda: [validar_data_robusta(data) for data in datas], repeticoes=3
+        )
+        resultados[f'validacoes.validar_datas_lote.{tamanho}'] = medir(
+            lambda: validar_datas_lote(datas), repeticoes=3
+        )
+
+        linhas = [(str(1 + i % 10000), str(1 + i % 1440), "01/01/2025", "31/12/2025") for i in range(tamanho)]
+        resultados[f'validacoes.validar_dados_completos.{tamanho}'] = medir(
+            lambda: [validar_dados_completos(*linha) for linha in linhas], repeticoes=3
+        )
+        colunas = [list(coluna) for coluna in zip(*linhas)]
+        resultados[f'validacoes.validar_dados_lote.{tamanho}'] = medir(
+            lambda: validar_dados_lote(*colunas), repeticoes=3
+        )
+
+def benchmark_metricas(resultados):
+    """Mede o cálculo de métricas operacionais em lotes"""
+    for tamanho in TAMANHOS_LOTE:
+        cenarios = [(1 + i % 10000, 1 + i % 1440, 1 + i % 260) for i in range(tamanho)]
+        resultados[f'metricas.calcular_metricas_operacionais.{tamanho}'] = medir(
+            lambda: [calcular_metricas_operacionais(*cenario) for cenario in cenarios], repeticoes=3
+        )
+
+def benchmark_ingestao(resultados):
+    """Mede a leitura e o agrupamento em fluxo de exportações de chamados"""
+    with tempfile.TemporaryDirectory() as pasta:
+        for tamanho in TAMANHOS_LOTE:
+            caminho = os.path.join(pasta, f'chamados_{tamanho}.csv')
+            with open(caminho, 'w', encoding='utf-8') as arquivo:
+                arquivo.write("fila,data_abertura,tma\n")
+                for i in range(tamanho):
+                    data = datetime.date(2025, 1, 1) + datetime.timedelta(days=i % 365)
+                    arquivo.write(f"fila{i % 8},{data.isoformat()} {i % 24:02d}:00:00,{1 + i % 60}\n")
+
+            medida = medir(lambda: agregar_chamados(ler_chamados(caminho), 'mes'), repeticoes=3)
+            medida['linhas_por_segundo'] = tamanho / medida['segundos'] if medida['segundos'] > 0 else 0.0
+            resultados[f'ingestao.agregar_chamados_csv.{tamanho}'] = medida
+
+def benchmark_janelas(resultados):
+    """Mede o planejamento de todas as janelas móveis de 30 dias de horizontes crescentes"""
+    calendario_utils.obter_indice_dias_uteis()
+    inicio = datetime.date(LIMITES['ANO_MIN'], 1, 1)
+    for dias in TAMANHOS_PERIODO[2:]:
+        fim = inicio + datetime.timedelta(days=dias - 1)
+        resultados[f'janelas.planejar_janelas_moveis.30d.{dias}d'] = medir(
+            lambda: planejar_janelas_moveis(inicio, fim, 30, 10, 5000)
+        )
+
+def benchmark_simulacao(resultados):
+    """Mede a simulação de Monte Carlo do risco de dimensionamento em um ano"""
+    inicio, fim = datetime.date(2025, 1, 1), datetime.date(2025, 12, 31)
+    volume = {'tipo': 'lognormal', 'media': 1000, 'desvio': 200}
+    tma = {'tipo': 'normal', 'media': 10, 'desvio': 1}
+    for modo, tentativas in (('diario', 10000), ('agregado', 1000000)):
+        medida = medir(lambda: simular_risco_dimensionamento(inicio, fim, volume, tma, tentativas,
+                                                             semente=1, modo=modo), repeticoes=3)
+        medida['tentativas_por_segundo'] = tentativas / medida['segundos'] if medida['segundos'] > 0 else 0.0
+        resultados[f'simulacao.risco_dimensionamento.{modo}.{tentativas}'] = medida
+
+def benchmark_fila(resultados):
+    """Mede a simulação de eventos discretos da fila em um mês (cerca de 230 mil eventos)"""
+    inicio, fim = datetime.date(2025, 12, 1), datetime.date(2025, 12, 31)
+    intervalos = calcular_dias_uteis_periodo(inicio, fim) * 14
+    medida = medir(lambda: simular_fila(inicio, fim, 45, 5, chamadas_por_intervalo=[250.0] * intervalos,
+                                        paciencia_media=90, semente=1), repeticoes=3)
+    resultado = simular_fila(inicio, fim, 45, 5, chamadas_por_intervalo=[250.0] * intervalos,
+                             paciencia_media=90, semente=1)
+    medida['eventos_por_segundo'] = resultado['eventos'] / medida['segundos'] if medida['segundos'] > 0 else 0.0
+    resultados['simulacao.fila.1mes'] = medida
+
+def medir_importacao(modulo, repeticoes=5):
+    """
+    Mede o tempo de importação a frio de um módulo em um novo interpretador
+
+    Args:
+        modulo (str): Nome do módulo
+        repeticoes (int): Quantidade de processos medidos
+
+    Returns:
+        dict: Mediana e mínimo em segundos e número de repetições
+    """
+    codigo = (
+        "import time; inicio = time.perf_counter(); "
+        f"import {modulo}; print(time.perf_counter() - inicio)"
+    )
+    tempos = []
+    for _ in range(repeticoes):
+        saida = subprocess.run(
+            [sys.executable, '-c', codigo], cwd=DIRETORIO,
+            capture_output=True, text=True, check=True
+        )
+        tempos.append(float(saida.stdout.strip().splitlines()[-1]))
+    return {
+        'segundos': statistics.median(tempos),
+        'minimo': min(tempos),
+        'repeticoes': repeticoes
+    }
+
+def benchmark_importacao(resultados):
+    """Mede a importação a frio dos pontos de entrada"""
+    for modulo in ('index', 'interface_gui'):
+        try:
+            resultados[f'importacao.{modulo}'] = medir_importacao(modulo)
+        except subprocess.CalledProcessError as e:
+            print(f"Não foi possível medir a importação de {modulo}: {e.stderr.strip()}")
+
+def executar_benchmarks():
+    """
+    Executa toda a suíte de benchmarks
+
+    Returns:
+        dict: Metadados do ambiente e resultados por benchmark
+    """
+    resultados = {}
+    benchmark_calendario(resultados)
+    benchmark_validacoes(resultados)
+    benchmark_metricas(resultados)
+    benchmark_ingestao(resultados)
+    benchmark_janelas(resultados)
+    benchmark_simulacao(resultados)
+    benchmark_fila(resultados)
+    benchmark_importacao(resultados)
+    return {
+        'metadados': {
+            'python': platform.python_version(),
+            'plataforma': platform.platform(),
+            'data': datetime.datetime.now().isoformat(timespec='seconds')
+        },
+        'resultados': resultados
+    }
+
+def comparar(baseline, atual, tolerancia=TOLERANCIA_PADRAO):
+    """
+    Compara dois relatórios de benchmark
+
+    Args:
+        baseline (dict): Relatório de referência
+        atual (dict): Relatório atual
+        tolerancia (float): Aumento relativo aceito antes de acusar regressão
+
+    Returns:
+        list: Tuplas (nome, segundos_baseline, segundos_atual, razão, regressão)
+    """
+    comparacoes = []
+    for nome, medida in atual['resultados'].items():
+        referencia = baseline['resultados'].get(nome)
+        if referencia is None or referencia['segundos'] <= 0:
+            continue
+        razao = medida['segundos'] / referencia['segundos']
+        comparacoes.append((nome, referencia['segundos'], medida['segundos'], razao, razao > 1 + tolerancia))
+    return comparacoes
+
+def exibir_resultados(relatorio):
+    """Exibe os resultados de um relatório"""
+    print("=== BENCHMARKS ===")
+    for nome, medida in relatorio['resultados'].items():
+        print(f"{nome:<55} {medida['segundos'] * 1000:>12.3f} ms")
+
+def exibir_comparacao(comparacoes):
+    """
+    Exibe a comparação com a baseline
+
+    Returns:
+        int: Quantidade de regressões
+    """
+    print("=== COMPARAÇÃO COM BASELINE ===")
+    regressoes = 0
+    for nome, antes, depois, razao, regressao in comparacoes:
+        marca = "REGRESSÃO" if regressao else ""
+        print(f"{nome:<55} {antes * 1000:>10.3f} -> {depois * 1000:>10.3f} ms  {razao:>6.2f}x  {marca}")
+        regressoes += regressao
+    print(f"Regressões: {regressoes}")
+    return regressoes
+
+def carregar_relatorio(caminho):
+    """Carrega um relatório JSON"""
+    with open(caminho, 'r', encoding='utf-8') as arquivo:
+        return json.load(arquivo)
+
+def main():
+    """Executa a suíte ou compara relatórios pela linha de comando"""
+    parser = argparse.ArgumentParser(description="Benchmarks de calendário, validações e métricas")
+    parser.add_argument('--saida', help="Grava os resultados neste arquivo JSON")
+    parser.add_argument('--baseline', help="Compara os resultados com este arquivo JSON")
+    parser.add_argument('--comparar', nargs=2, metavar=('BASELINE', 'ATUAL'),
+                        help="Apenas compara dois arquivos JSON já gravados")
+    parser.add_argument('--tolerancia', type=float, default=TOLERANCIA_PADRAO,
+                        help="Aumento relativo aceito antes de acusar regressão (padrão: 0.20)")
+    args = parser.parse_args()
+
+    if args.comparar:
+        comparacoes = comparar(carregar_relatorio(args.comparar[0]), carregar_relatorio(args.comparar[1]),
+                               args.tolerancia)
+        sys.exit(1 if exibir_comparacao(comparacoes) else 0)
+
+    relatorio = executar_benchmarks()
+    exibir_resultados(relatorio)
+
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(relatorio, arquivo, indent=2, ensure_ascii=False)
+        print(f"Resultados gravados em: {args.saida}")
+
+    if args.baseline:
+        comparacoes = comparar(carregar_relatorio(args.baseline), relatorio, args.tolerancia)
+        sys.exit(1 if exibir_comparacao(comparacoes) else 0)
+
+if __name__ == "__main__":
+    main()
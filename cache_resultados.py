@@ -0,0 +1,419 @@
+"""
+Módulo de cache em dois níveis para análises de período fora do índice
+
+Dentro da faixa do índice de dias úteis (LIMITES['ANO_MIN'] a
+LIMITES['ANO_MAX']) as consultas de período custam poucos microssegundos e
+não passam pelo cache. Fora dela, calendario_utils percorre o período dia a
+dia consultando a workalendar; esses resultados são guardados em:
+
+    1. memória: LRU com tamanho máximo, por processo
+    2. disco: banco SQLite, compartilhado entre sessões
+
+As chaves incluem a identidade do calendário (com as exceções da empresa
+aplicadas, se houver) e a versão dos dados de feriados (versão da
+workalendar), de modo que uma atualização da biblioteca ou das exceções
+não reaproveita entradas antigas. Processos com versões diferentes podem
+compartilhar o mesmo arquivo: cada um lê apenas as entradas da sua versão.
+
+As gravações em disco são acumuladas e feitas em lote (LOTE_GRAVACAO
+entradas por transação, ou ao fechar o cache). O banco guarda no máximo
+LIMITE_LINHAS_DISCO entradas (as mais antigas são descartadas a cada
+gravação); podar() remove também as entradas de outras versões. Se o banco
+não puder ser aberto ou gravado (ex.: diretório somente leitura), o cache
+passa a usar apenas a memória.
+
+O cache não é usado pelo index.py nem pela interface gráfica, que só aceitam
+datas dentro da faixa do índice.
+"""
+
+import atexit
+import copy
+import datetime
+import json
+import os
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+
+import calendario_utils
+from calendarios import CALENDARIO_PADRAO, resolver_calendario
+
+# Entradas mantidas em memória por padrão
+CAPACIDADE_PADRAO = 4096
+
+# Entradas acumuladas antes de uma gravação em disco
+LOTE_GRAVACAO = 64
+
+# Máximo de entradas mantidas no banco (todas as versões)
+LIMITE_LINHAS_DISCO = 100_000
+
+def diretorio_cache_usuario():
+    """
+    Diretório de cache do usuário para o banco padrão
+
+    Os módulos podem estar em um diretório somente leitura (site-packages ou
+    executável do PyInstaller), por isso o banco fica no diretório de cache
+    do sistema: %LOCALAPPDATA% no Windows, ~/Library/Caches no macOS e
+    $XDG_CACHE_HOME (ou ~/.cache) nos demais.
+
+    Returns:
+        str: Caminho do diretório (não é criado aqui)
+    """
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser(os.path.join('~', 'AppData', 'Local'))
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser(os.path.join('~', 'Library', 'Caches'))
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser(os.path.join('~', '.cache'))
+    return os.path.join(base, 'calculador_headcount')
+
+# Banco padrão, no diretório de cache do usuário
+CAMINHO_PADRAO = os.path.join(diretorio_cache_usuario(), 'cache_resultados.sqlite3')
+
+def versao_dados_feriados():
+    """
+    Versão dos dados de feriados usada nas chaves do cache
+
+    Returns:
+        str: Identificação da versão instalada da workalendar
+    """
+    from tabela_feriados import _versao_workalendar
+    return f"workalendar-{_versao_workalendar() or 'desconhecida'}"
+
+def _codificar(valor):
+    """Converte datas e tuplas em uma forma JSON reversível"""
+    if isinstance(valor, datetime.date):
+        return {'__data__': valor.isoformat()}
+    if isinstance(valor, tuple):
+        return {'__tupla__': [_codificar(item) for item in valor]}
+    if isinstance(valor, list):
+        return [_codificar(item) for item in valor]
+    if isinstance(valor, dict):
+        return {chave: _codificar(item) for chave, item in valor.items()}
+    return valor
+
+def _decodificar(valor):
+    """Inverso de _codificar"""
+    if isinstance(valor, list):
+        return [_decodificar(item) for item in valor]
+    if isinstance(valor, dict):
+        if '__data__' in valor:
+            return datetime.date.fromisoformat(valor['__data__'])
+        if '__tupla__' in valor:
+            return tuple(_decodificar(item) for item in valor['__tupla__'])
+        return {chave: _decodificar(item) for chave, item in valor.items()}
+    return valor
+
+class CacheResultados:
+    """
+    Cache em dois níveis (LRU em memória + SQLite em disco)
+
+    Seguro para uso a partir de várias threads (ex.: o executor da GUI).
+
+    Attributes:
+        capacidade (int): Máximo de entradas em memória
+        caminho (str): Arquivo SQLite, ou None para usar apenas a memória
+            (passa a None se o banco falhar)
+        versao (str): Versão dos dados de feriados incluída nas chaves
+        limite_linhas (int): Máximo de entradas no banco
+        erro_disco (str): Erro que desativou o banco, ou None
+    """
+
+    def __init__(self, capacidade=CAPACIDADE_PADRAO, caminho=CAMINHO_PADRAO, versao=None,
+                 limite_linhas=LIMITE_LINHAS_DISCO):
+        if capacidade < 1:
+            raise ValueError("capacidade deve ser pelo menos 1")
+        self.capacidade = capacidade
+        self.caminho = caminho
+        self.versao = versao_dados_feriados() if versao is None else versao
+        self.limite_linhas = limite_linhas
+        self.erro_disco = None
+        self._memoria = OrderedDict()
+        self._pendentes = []
+        self._conexao = None
+        self._lock = threading.Lock()
+        self.acertos_memoria = 0
+        self.acertos_disco = 0
+        self.faltas = 0
+
+    def _abrir(self):
+        """
+        Abre o banco na primeira consulta (modo WAL, para leitores e gravadores
+        simultâneos); chamado com o lock
+
+        Returns:
+            sqlite3.Connection: Conexão, ou None se o cache usa apenas a memória
+        """
+        if self._conexao is None and self.caminho is not None:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.caminho)), exist_ok=True)
+                self._conexao = sqlite3.connect(self.caminho, check_same_thread=False)
+                self._conexao.execute("PRAGMA journal_mode=WAL")
+                self._conexao.execute(
+                    "CREATE TABLE IF NOT EXISTS resultados ("
+                    "chave TEXT PRIMARY KEY, versao TEXT NOT NULL, valor TEXT NOT NULL)"
+                )
+                self._conexao.commit()
+            except (sqlite3.Error, OSError) as erro:
+                self._desativar_disco(erro)
+        return self._conexao
+
+    def _desativar_disco(self, erro):
+        """Passa a usar apenas a memória após uma falha do banco (chamado com o lock)"""
+        self.erro_disco = str(erro)
+        self.caminho = None
+        self._pendentes = []
+        if self._conexao is not None:
+            try:
+                self._conexao.close()
+            except sqlite3.Error:
+                pass
+            self._conexao = None
+
+    def _descartar_excedentes(self, conexao):
+        """Remove as entradas mais antigas além de limite_linhas e retorna quantas"""
+        # Cada gravação recebe um rowid maior: os menores são os mais antigos
+        return conexao.execute(
+            "DELETE FROM resultados WHERE rowid IN "
+            "(SELECT rowid FROM resultados ORDER BY rowid DESC LIMIT -1 OFFSET ?)",
+            (self.limite_linhas,)
+        ).rowcount
+
+    def _chave_disco(self, chave):
+        """Monta a chave textual do banco (função, calendário, versão, argumentos)"""
+        funcao, calendario, argumentos = chave
+        return json.dumps([funcao, calendario, self.versao, _codificar(list(argumentos))],
+                          ensure_ascii=False, separators=(',', ':'))
+
+    def _guardar_memoria(self, chave, valor):
+        self._memoria[chave] = valor
+        self._memoria.move_to_end(chave)
+        if len(self._memoria) > self.capacidade:
+            self._memoria.popitem(last=False)
+
+    def _gravar_pendentes(self):
+        """
+        Grava as entradas acumuladas em uma única transação, mantendo no
+        máximo limite_linhas no banco (chamado com o lock)
+        """
+        if not self._pendentes:
+            return
+        conexao = self._abrir()
+        if conexao is None:
+            return
+        try:
+            with conexao:
+                conexao.executemany(
+                    "INSERT OR REPLACE INTO resultados (chave, versao, valor) VALUES (?, ?, ?)",
+                    self._pendentes
+                )
+                self._descartar_excedentes(conexao)
+            self._pendentes = []
+        except sqlite3.Error as erro:
+            self._desativar_disco(erro)
+
+    def obter_ou_calcular(self, funcao, calendario, argumentos, calcular):
+        """
+        Retorna o resultado em cache ou calcula e guarda nos dois níveis
+
+        Args:
+            funcao (str): Nome da função (parte da chave)
+            calendario (str): Identidade do calendário (parte da chave)
+            argumentos (tuple): Argumentos da função (datas, números, textos)
+            calcular (callable): Função sem argumentos que calcula o resultado
+
+        Returns:
+            Resultado calculado ou em cache (sempre uma cópia: alterá-lo não
+            afeta as consultas seguintes); resultados None não são guardados
+        """
+        chave = (funcao, calendario, tuple(argumentos))
+
+        with self._lock:
+            if chave in self._memoria:
+                self._memoria.move_to_end(chave)
+                self.acertos_memoria += 1
+                return copy.deepcopy(self._memoria[chave])
+
+            conexao = self._abrir()
+            if conexao is not None:
+                try:
+                    linha = conexao.execute(
+                        "SELECT valor FROM resultados WHERE chave = ? AND versao = ?",
+                        (self._chave_disco(chave), self.versao)
+                    ).fetchone()
+                except sqlite3.Error as erro:
+                    self._desativar_disco(erro)
+                    linha = None
+                if linha is not None:
+                    valor = _decodificar(json.loads(linha[0]))
+                    self._guardar_memoria(chave, valor)
+                    self.acertos_disco += 1
+                    return copy.deepcopy(valor)
+            self.faltas += 1
+
+        # Calcular fora do lock: outras threads podem consultar enquanto isso
+        valor = calcular()
+        if valor is None:
+            return valor
+
+        with self._lock:
+            self._guardar_memoria(chave, copy.deepcopy(valor))
+            if self.caminho is not None:
+                self._pendentes.append((self._chave_disco(chave), self.versao,
+                                        json.dumps(_codificar(valor), ensure_ascii=False)))
+                if len(self._pendentes) >= LOTE_GRAVACAO:
+                    self._gravar_pendentes()
+        return valor
+
+    def estatisticas(self):
+        """
+        Contadores de acertos e faltas
+
+        Returns:
+            dict: acertos_memoria, acertos_disco, faltas, taxa_acerto, entradas_memoria
+            e erro_disco (None enquanto o banco estiver em uso)
+        """
+        with self._lock:
+            consultas = self.acertos_memoria + self.acertos_disco + self.faltas
+            return {
+                'acertos_memoria': self.acertos_memoria,
+                'acertos_disco': self.acertos_disco,
+                'faltas': self.faltas,
+                'taxa_acerto': (self.acertos_memoria + self.acertos_disco) / consultas if consultas else 0.0,
+                'entradas_memoria': len(self._memoria),
+                'erro_disco': self.erro_disco
+            }
+
+    def limpar(self):
+        """Descarta todas as entradas (memória e disco) e zera os contadores"""
+        with self._lock:
+            self._memoria.clear()
+            self._pendentes = []
+            conexao = self._abrir()
+            if conexao is not None:
+                try:
+                    with conexao:
+                        conexao.execute("DELETE FROM resultados")
+                except sqlite3.Error as erro:
+                    self._desativar_disco(erro)
+            self.acertos_memoria = self.acertos_disco = self.faltas = 0
+
+    def podar(self):
+        """
+        Manutenção do banco: remove as entradas de outras versões dos dados
+        de feriados (ex.: após atualizar a workalendar) e as mais antigas
+        além de limite_linhas
+
+        Deve ser chamado quando nenhum processo com outra versão usa o
+        mesmo arquivo.
+
+        Returns:
+            int: Entradas removidas do banco
+        """
+        with self._lock:
+            self._gravar_pendentes()
+            conexao = self._abrir()
+            if conexao is None:
+                return 0
+            try:
+                with conexao:
+                    removidas = conexao.execute(
+                        "DELETE FROM resultados WHERE versao != ?", (self.versao,)
+                    ).rowcount
+                    removidas += self._descartar_excedentes(conexao)
+                return removidas
+            except sqlite3.Error as erro:
+                self._desativar_disco(erro)
+                return 0
+
+    def gravar(self):
+        """Grava em disco as entradas ainda pendentes"""
+        with self._lock:
+            self._gravar_pendentes()
+
+    def fechar(self):
+        """Grava as entradas pendentes e fecha a conexão com o banco"""
+        with self._lock:
+            self._gravar_pendentes()
+            if self._conexao is not None:
+                self._conexao.close()
+                self._conexao = None
+
+# Cache padrão do processo, criado no primeiro uso
+_cache_padrao = None
+_lock_cache = threading.Lock()
+
+def obter_cache():
+    """
+    Obtém o cache padrão do processo (criado na primeira chamada e
+    gravado em disco ao fim do processo)
+
+    Returns:
+        CacheResultados: Cache padrão
+    """
+    global _cache_padrao
+    if _cache_padrao is None:
+        with _lock_cache:
+            if _cache_padrao is None:
+                _cache_padrao = CacheResultados()
+                atexit.register(_fechar_cache_padrao)
+    return _cache_padrao
+
+def _fechar_cache_padrao():
+    """Grava as entradas pendentes do cache padrão ao fim do processo"""
+    if _cache_padrao is not None:
+        _cache_padrao.fechar()
+
+def definir_cache(cache):
+    """
+    Substitui o cache padrão do processo (ex.: só memória, ou outro arquivo)
+
+    Args:
+        cache (CacheResultados): Novo cache padrão
+    """
+    global _cache_padrao
+    with _lock_cache:
+        if _cache_padrao is None:
+            atexit.register(_fechar_cache_padrao)
+        _cache_padrao = cache
+
+def calcular_dias_uteis_periodo(data_inicio, data_fim, calendario=CALENDARIO_PADRAO):
+    """Versão de calendario_utils.calcular_dias_uteis_periodo com cache fora da faixa do índice"""
+    indice = calendario_utils.obter_indice_dias_uteis(calendario)
+    if indice.cobre(data_inicio, data_fim):
+        return indice.contar_dias_uteis(data_inicio, data_fim)
+    calendario = resolver_calendario(calendario)
+    return obter_cache().obter_ou_calcular(
+        'calcular_dias_uteis_periodo', indice.identidade(), (data_inicio, data_fim),
+        lambda: calendario_utils.calcular_dias_uteis_periodo(data_inicio, data_fim, calendario)
+    )
+
+def mostrar_feriados_periodo(data_inicio, data_fim, calendario=CALENDARIO_PADRAO):
+    """Versão de calendario_utils.mostrar_feriados_periodo com cache fora da faixa do índice"""
+    indice = calendario_utils.obter_indice_dias_uteis(calendario)
+    if indice.cobre(data_inicio, data_fim):
+        return indice.listar_feriados(data_inicio, data_fim)
+    calendario = resolver_calendario(calendario)
+    return obter_cache().obter_ou_calcular(
+        'mostrar_feriados_periodo', indice.identidade(), (data_inicio, data_fim),
+        lambda: calendario_utils.mostrar_feriados_periodo(data_inicio, data_fim, calendario)
+    )
+
+def analisar_periodo(data_inicio, data_fim, cancelado=None, progresso=None, calendario=CALENDARIO_PADRAO):
+    """
+    Versão de calendario_utils.analisar_periodo com cache fora da faixa do índice
+
+    Análises canceladas não são guardadas; em um acerto, progresso recebe 1.0.
+    """
+    indice = calendario_utils.obter_indice_dias_uteis(calendario)
+    if indice.cobre(data_inicio, data_fim):
+        return calendario_utils.analisar_periodo(data_inicio, data_fim, cancelado, progresso, calendario)
+    calendario = resolver_calendario(calendario)
+    analise = obter_cache().obter_ou_calcular(
+        'analisar_periodo', indice.identidade(), (data_inicio, data_fim),
+        lambda: calendario_utils.analisar_periodo(data_inicio, data_fim, cancelado, progresso, calendario)
+    )
+    if analise is not None and progresso is not None:
+        progresso(1.0)
+    return analise
@@ -2,7 +2,11 @@
 Módulo para cálculos operacionais e métricas de negócio
 """
 
-def calcular_metricas_operacionais(total_chamados, tma, dias_uteis):
+# Constantes
+HORAS_POR_DIA = 7
+MINUTOS_POR_HORA = 60
+
+def calcular_metricas_operacionais(total_chamados, tma, dias_uteis, minutos_disponiveis=None):
     """
     Calcula as métricas operacionais baseadas nos parâmetros fornecidos
     
@@ -10,17 +14,18 @@ def calcular_metricas_operacionais(total_chamados, tma, dias_uteis):
         total_chamados (int): Total de chamados resolvidos
         tma (int): Tempo médio de atendimento em minutos
         dias_uteis (int): Número de dias úteis no período
+        minutos_disponiveis (int): Minutos de trabalho por pessoa no período (opcional,
+            ver jornada_trabalho); padrão: dias_uteis * HORAS_POR_DIA horas
         
     Returns:
         dict: Dicionário com todas as métricas calculadas
     """
-    # Constantes
-    HORAS_POR_DIA = 7
-    MINUTOS_POR_HORA = 60
-    
     # Cálculos
     tempo_total = total_chamados * tma
-    horas_uteis_mes = dias_uteis * (HORAS_POR_DIA * MINUTOS_POR_HORA)
+    if minutos_disponiveis is None:
+        horas_uteis_mes = dias_uteis * (HORAS_POR_DIA * MINUTOS_POR_HORA)
+    else:
+        horas_uteis_mes = minutos_disponiveis
     capacidade_operacional = horas_uteis_mes / tma
     pessoas_necessarias = int(tempo_total / horas_uteis_mes)
     
@@ -31,6 +36,79 @@ def calcular_metricas_operacionais(total_chamados, tma, dias_uteis):
         'pessoas_necessarias': pessoas_necessarias
     }
 
+def calcular_metricas_operacionais_lote(total_chamados, tma, dias_uteis=None,
+                                        data_inicio=None, data_fim=None, minutos_disponiveis=None):
+    """
+    Calcula as métricas operacionais para vários cenários de uma só vez
+    
+    Versão vetorizada (NumPy) de calcular_metricas_operacionais. Os argumentos
+    podem ser listas, arrays ou escalares (escalares são replicados para
+    todos os cenários). Os dias úteis podem ser informados diretamente ou
+    através de listas de datas de início e fim.
+    
+    Args:
+        total_chamados (array-like): Total de chamados de cada cenário
+        tma (array-like): Tempo médio de atendimento em minutos
+        dias_uteis (array-like): Número de dias úteis de cada cenário
+        data_inicio (array-like): Datas de início (quando dias_uteis não é informado)
+        data_fim (array-like): Datas de fim (quando dias_uteis não é informado)
+        minutos_disponiveis (array-like): Minutos de trabalho por pessoa de cada
+            cenário (opcional; padrão: dias_uteis * HORAS_POR_DIA horas)
+        
+    Todos os valores são tratados como float64, de modo que frações (TMA
+    médio ou P90, jornadas parciais) são mantidas como no cálculo escalar.
+        
+    Returns:
+        dict: Dicionário com um array por métrica, nas mesmas chaves de
+        calcular_metricas_operacionais
+        
+    Raises:
+        ZeroDivisionError: Se algum tma, dias_uteis ou minutos_disponiveis for zero
+    """
+    import numpy as np
+    
+    if dias_uteis is None and minutos_disponiveis is not None:
+        # Os dias úteis só entram no cálculo através dos minutos
+        dias_uteis = np.ones_like(np.asarray(minutos_disponiveis, dtype=np.float64))
+    if dias_uteis is None:
+        if data_inicio is None or data_fim is None:
+            raise ValueError("Informe dias_uteis ou data_inicio e data_fim")
+        from calendario_utils import calcular_dias_uteis_periodo_lote
+        dias_uteis = calcular_dias_uteis_periodo_lote(data_inicio, data_fim)
+    
+    total_chamados, tma, dias_uteis = np.broadcast_arrays(
+        np.asarray(total_chamados, dtype=np.float64),
+        np.asarray(tma, dtype=np.float64),
+        np.asarray(dias_uteis, dtype=np.float64)
+    )
+    
+    if minutos_disponiveis is None:
+        horas_uteis_mes = dias_uteis * (HORAS_POR_DIA * MINUTOS_POR_HORA)
+        origem_horas = 'dias_uteis'
+    else:
+        horas_uteis_mes = np.broadcast_to(np.asarray(minutos_disponiveis, dtype=np.float64),
+                                          dias_uteis.shape)
+        origem_horas = 'minutos_disponiveis'
+    
+    # Mesma falha do cálculo escalar em vez de propagar inf/nan
+    for nome, valores in (('tma', tma), (origem_horas, horas_uteis_mes)):
+        zeros = np.flatnonzero(valores == 0)
+        if len(zeros):
+            raise ZeroDivisionError(f"{nome} deve ser diferente de zero (cenário {zeros[0]})")
+    
+    # Cálculos
+    tempo_total = total_chamados * tma
+    capacidade_operacional = horas_uteis_mes / tma
+    # np.trunc reproduz o int() do cálculo escalar
+    pessoas_necessarias = np.trunc(tempo_total / horas_uteis_mes).astype(np.int64)
+    
+    return {
+        'tempo_total': tempo_total,
+        'horas_uteis_mes': horas_uteis_mes,
+        'capacidade_operacional': capacidade_operacional,
+        'pessoas_necessarias': pessoas_necessarias
+    }
+
 def calcular_percentual_dias_uteis(dias_uteis, total_dias):
     """
     Calcula o percentual de dias úteis
@@ -2,25 +2,530 @@
 Módulo para cálculos de calendário e dias úteis
 """
 
+import bisect
 import datetime
-from workalendar.america import Brazil
+import threading
+from array import array
+from validacoes import LIMITES
+from calculos_operacionais import HORAS_POR_DIA, MINUTOS_POR_HORA
+from calendarios import CALENDARIO_PADRAO, criar_calendario, resolver_calendario
 
-def calcular_dias_uteis_periodo(data_inicio, data_fim):
+# Índices de dias úteis já construídos, por código de calendário
+_indices = {}
+_lock_indices = threading.Lock()
+
+# Expediente: HORAS_POR_DIA horas corridas a partir deste horário
+HORA_INICIO_EXPEDIENTE = 9
+
+
+def _criar_calendario(calendario=CALENDARIO_PADRAO):
+    """
+    Cria o calendário workalendar de um código (ver calendarios.CALENDARIOS)
+
+    A importação da workalendar fica em calendarios.criar_calendario para
+    que consultas atendidas pelas tabelas binárias de feriados não a carreguem.
+
+    Args:
+        calendario (str): Código do calendário (padrão: nacional)
+
+    Returns:
+        workalendar.core.Calendar: Calendário correspondente
+    """
+    return criar_calendario(calendario)
+
+
+class IndiceDiasUteis:
+    """
+    Índice pré-calculado de dias úteis de um calendário
+
+    Guarda um mapa por dia (1 = dia útil) e a contagem acumulada de dias
+    úteis para a faixa de anos coberta, de modo que a quantidade de dias
+    úteis de qualquer período seja obtida com duas consultas e uma subtração.
+    """
+
+    def __init__(self, ordinal_inicio, dias_uteis, acumulado, nomes_feriados, calendario=None,
+                 codigo_calendario=CALENDARIO_PADRAO):
+        """
+        Cria o índice a partir de tabelas já calculadas
+
+        Use IndiceDiasUteis.construir para gerar as tabelas a partir de um
+        calendário. As tabelas podem ser quaisquer buffers indexáveis
+        (bytearray, array, memoryview), o que permite compartilhá-las entre
+        processos.
+
+        Args:
+            ordinal_inicio (int): Ordinal (date.toordinal) do primeiro dia coberto
+            dias_uteis (bytearray): 1 para dia útil, 0 caso contrário, um item por dia
+            acumulado (array): acumulado[i] = dias úteis antes do dia i (len = dias + 1)
+            nomes_feriados (dict): Nome do feriado por ordinal da data
+            calendario (workalendar.core.Calendar): Calendário de origem (opcional)
+            codigo_calendario (str): Código do calendário de origem
+        """
+        self._calendario = calendario
+        self.codigo_calendario = codigo_calendario
+        self.ordinal_inicio = ordinal_inicio
+        self.dias_uteis = dias_uteis
+        self.acumulado = acumulado
+        self.nomes_feriados = nomes_feriados
+        self.ordinais_feriados = sorted(nomes_feriados)
+        self.inicio = datetime.date.fromordinal(ordinal_inicio)
+        self.fim = datetime.date.fromordinal(ordinal_inicio + len(dias_uteis) - 1)
+        self.excecoes = {}
+        # Nome do feriado de origem (ou None) das datas com exceção
+        self._nomes_originais = {}
+        self._arrays = None
+        self._identidade = None
+        self._calendario_numpy = None
+
+    @classmethod
+    def construir(cls, cal, ano_inicio, ano_fim, codigo_calendario=None):
+        """
+        Constrói o índice a partir dos feriados do calendário
+
+        Args:
+            cal (workalendar.core.Calendar): Calendário de origem dos feriados
+            ano_inicio (int): Primeiro ano coberto pelo índice
+            ano_fim (int): Último ano coberto pelo índice
+            codigo_calendario (str): Código do calendário (padrão: nome da classe de cal)
+
+        Returns:
+            IndiceDiasUteis: Índice construído
+        """
+        ordinal_inicio = datetime.date(ano_inicio, 1, 1).toordinal()
+        total_dias = datetime.date(ano_fim, 12, 31).toordinal() - ordinal_inicio + 1
+
+        # Feriados por ordinal (mesma regra de cal.is_holiday: só conta a
+        # data no ano em que o calendário a declara)
+        nomes = {}
+        for ano in range(ano_inicio, ano_fim + 1):
+            for dia, nome in cal.holidays(ano):
+                if dia.year == ano:
+                    nomes.setdefault(dia.toordinal(), []).append(nome)
+        nomes_feriados = {ordinal: " / ".join(lista) for ordinal, lista in nomes.items()}
+
+        # Mapa por dia e contagem acumulada
+        dias_uteis = bytearray(total_dias)
+        acumulado = array('l', [0]) * (total_dias + 1)
+        contagem = 0
+        for i in range(total_dias):
+            ordinal = ordinal_inicio + i
+            # date.weekday() == (ordinal + 6) % 7
+            if (ordinal + 6) % 7 < 5 and ordinal not in nomes_feriados:
+                dias_uteis[i] = 1
+                contagem += 1
+            acumulado[i + 1] = contagem
+
+        if codigo_calendario is None:
+            codigo_calendario = type(cal).__name__
+        return cls(ordinal_inicio, dias_uteis, acumulado, nomes_feriados, cal, codigo_calendario)
+
+    @property
+    def calendario(self):
+        """Calendário workalendar de origem (criado sob demanda se ausente)"""
+        if self._calendario is None:
+            self._calendario = _criar_calendario(self.codigo_calendario)
+        return self._calendario
+
+    def cobre(self, data_inicio, data_fim):
+        """
+        Verifica se o período está inteiramente dentro da faixa do índice
+
+        Args:
+            data_inicio (datetime.date): Data de início do período
+            data_fim (datetime.date): Data de fim do período
+
+        Returns:
+            bool: True se o índice pode responder pelo período
+        """
+        return self.inicio <= data_inicio <= self.fim and self.inicio <= data_fim <= self.fim
+
+    def contar_dias_uteis(self, data_inicio, data_fim):
+        """
+        Conta os dias úteis do período (inclusive) em tempo constante
+
+        Args:
+            data_inicio (datetime.date): Data de início do período
+            data_fim (datetime.date): Data de fim do período
+
+        Returns:
+            int: Número de dias úteis no período
+        """
+        if data_fim < data_inicio:
+            return 0
+        i = data_inicio.toordinal() - self.ordinal_inicio
+        j = data_fim.toordinal() - self.ordinal_inicio
+        return self.acumulado[j + 1] - self.acumulado[i]
+
+    def listar_feriados(self, data_inicio, data_fim):
+        """
+        Lista os feriados do período a partir do índice
+
+        Args:
+            data_inicio (datetime.date): Data de início do período
+            data_fim (datetime.date): Data de fim do período
+
+        Returns:
+            list: Lista de datas dos feriados
+        """
+        ordinais = self.ordinais_feriados
+        i = bisect.bisect_left(ordinais, data_inicio.toordinal())
+        j = bisect.bisect_right(ordinais, data_fim.toordinal())
+        return [datetime.date.fromordinal(ordinal) for ordinal in ordinais[i:j]]
+
+    def eh_dia_util(self, data):
+        """
+        Verifica se a data é dia útil
+
+        Args:
+            data (datetime.date): Data a verificar
+
+        Returns:
+            bool: True se a data é dia útil
+        """
+        return self.dias_uteis[data.toordinal() - self.ordinal_inicio] == 1
+
+    def como_arrays(self):
+        """
+        Retorna as tabelas do índice como arrays NumPy (sem cópia)
+
+        Returns:
+            tuple: (dias_uteis como uint8, acumulado como inteiro)
+        """
+        if self._arrays is None:
+            import numpy as np
+            self._arrays = (
+                np.frombuffer(self.dias_uteis, dtype=np.uint8),
+                np.asarray(memoryview(self.acumulado))
+            )
+        return self._arrays
+
+    def calendario_numpy(self):
+        """
+        Calendário numpy.busdaycalendar equivalente ao índice (criado sob demanda)
+
+        Os feriados do busdaycalendar são os dias de segunda a sexta que não
+        são úteis no índice (feriados e folgas). Dias de fim de semana
+        trabalhados por exceção não podem ser representados pela máscara
+        semanal; nesse caso retorna None.
+
+        Returns:
+            numpy.busdaycalendar: Calendário com máscara de segunda a sexta, ou None
+        """
+        if self._calendario_numpy is None:
+            import numpy as np
+            dias_uteis = self.como_arrays()[0]
+            dia_semana = (np.arange(dias_uteis.size, dtype=np.int64) + self.ordinal_inicio + 6) % 7
+            if ((dias_uteis == 1) & (dia_semana >= 5)).any():
+                return None
+            posicoes = np.flatnonzero((dias_uteis == 0) & (dia_semana < 5))
+            self._calendario_numpy = np.busdaycalendar(
+                weekmask='1111100', holidays=np.datetime64(self.inicio, 'D') + posicoes
+            )
+        return self._calendario_numpy
+
+    def eh_feriado(self, data):
+        """
+        Verifica se a data é feriado
+
+        Args:
+            data (datetime.date): Data a verificar
+
+        Returns:
+            bool: True se a data é feriado
+        """
+        return data.toordinal() in self.nomes_feriados
+
+    def copiar(self):
+        """
+        Cria uma cópia do índice com tabelas próprias e alteráveis
+
+        Necessário antes de aplicar exceções a um índice mapeado em memória
+        (tabela binária ou memória compartilhada), que é somente leitura.
+
+        Returns:
+            IndiceDiasUteis: Cópia independente do índice
+        """
+        acumulado = memoryview(self.acumulado)
+        copia = IndiceDiasUteis(
+            self.ordinal_inicio, bytearray(self.dias_uteis), array(acumulado.format, acumulado),
+            dict(self.nomes_feriados), self._calendario, self.codigo_calendario
+        )
+        copia.excecoes = dict(self.excecoes)
+        copia._nomes_originais = dict(self._nomes_originais)
+        return copia
+
+    def _conferir_excecao(self, data, util, permitir_fim_de_semana):
+        """Valida uma exceção antes de alterar o índice"""
+        if not self.cobre(data, data):
+            raise ValueError(f"Data fora da faixa do índice: {data.strftime('%d/%m/%Y')}")
+        if util and data.weekday() >= 5 and not permitir_fim_de_semana:
+            raise ValueError(f"{data.strftime('%d/%m/%Y')} cai em um fim de semana: dias trabalhados "
+                             f"em sábados e domingos precisam ser permitidos explicitamente")
+
+    def _marcar_excecao(self, data, util, descricao):
+        """Atualiza mapa, feriados e registro de uma exceção; retorna (posição, delta)"""
+        ordinal = data.toordinal()
+        posicao = ordinal - self.ordinal_inicio
+        novo = 1 if util else 0
+        delta = novo - self.dias_uteis[posicao]
+        self.dias_uteis[posicao] = novo
+
+        # Dia trabalhado deixa de ser listado como feriado; folga passa a ser, mantendo
+        # o nome do feriado de origem (ex.: "Natal / Folga da empresa")
+        if ordinal not in self.excecoes:
+            self._nomes_originais[ordinal] = self.nomes_feriados.get(ordinal)
+        if util:
+            if self.nomes_feriados.pop(ordinal, None) is not None:
+                del self.ordinais_feriados[bisect.bisect_left(self.ordinais_feriados, ordinal)]
+        else:
+            if ordinal not in self.nomes_feriados:
+                bisect.insort(self.ordinais_feriados, ordinal)
+            original = self._nomes_originais[ordinal]
+            self.nomes_feriados[ordinal] = f"{original} / {descricao}" if original else descricao
+
+        self.excecoes[ordinal] = (bool(util), descricao)
+        self._identidade = None
+        self._calendario_numpy = None
+        return posicao, delta
+
+    def definir_excecao(self, data, util, descricao, permitir_fim_de_semana=False):
+        """
+        Marca uma data como útil ou não útil, sobrepondo o calendário de origem
+
+        Apenas o trecho do acumulado posterior à data é corrigido (uma soma
+        vetorizada), sem reconstruir o índice; as consultas continuam em
+        tempo constante. As tabelas precisam ser alteráveis (ver copiar).
+
+        Regras:
+            - folga em um feriado: o dia continua listado com o nome do
+              feriado, seguido da descrição ("Natal / Folga da empresa")
+            - dia trabalhado em um feriado: o feriado deixa de ser listado
+            - dia trabalhado em sábado ou domingo: só com permitir_fim_de_semana
+              (evita tornar útil um fim de semana por engano de data)
+
+        Args:
+            data (datetime.date): Data da exceção (dentro da faixa do índice)
+            util (bool): True para dia trabalhado, False para dia de folga
+            descricao (str): Descrição listada junto aos feriados (folgas)
+            permitir_fim_de_semana (bool): Aceita dia trabalhado em sábado ou domingo
+
+        Raises:
+            ValueError: Se a data estiver fora da faixa do índice ou for um fim de
+            semana trabalhado não permitido
+        """
+        self._conferir_excecao(data, util, permitir_fim_de_semana)
+        posicao, delta = self._marcar_excecao(data, util, descricao)
+        if delta:
+            self.como_arrays()[1][posicao + 1:] += delta
+
+    def definir_excecoes(self, excecoes, permitir_fim_de_semana=False):
+        """
+        Aplica várias exceções de uma vez
+
+        O acumulado é recalculado uma única vez, a partir da exceção mais
+        antiga que alterou o mapa de dias úteis.
+
+        Args:
+            excecoes (iterable): Tuplas (data, útil, descrição), como em definir_excecao
+            permitir_fim_de_semana (bool): Aceita dias trabalhados em sábados e domingos
+
+        Returns:
+            int: Quantidade de exceções aplicadas
+
+        Raises:
+            ValueError: Como em definir_excecao; nenhuma exceção é aplicada
+        """
+        import numpy as np
+
+        # Validar todas antes de alterar o índice
+        excecoes = list(excecoes)
+        for data, util, _ in excecoes:
+            self._conferir_excecao(data, util, permitir_fim_de_semana)
+
+        quantidade = 0
+        primeira = None
+        for data, util, descricao in excecoes:
+            posicao, delta = self._marcar_excecao(data, util, descricao)
+            if delta and (primeira is None or posicao < primeira):
+                primeira = posicao
+            quantidade += 1
+
+        if primeira is not None:
+            dias_uteis, acumulado = self.como_arrays()
+            acumulado[primeira + 1:] = acumulado[primeira] + np.cumsum(dias_uteis[primeira:],
+                                                                        dtype=acumulado.dtype)
+        return quantidade
+
+    def identidade(self):
+        """
+        Identifica o calendário e as exceções aplicadas (para chaves de cache)
+
+        Returns:
+            str: Código do calendário, seguido de um resumo das exceções se houver
+        """
+        if self._identidade is None:
+            if not self.excecoes:
+                self._identidade = self.codigo_calendario
+            else:
+                import hashlib
+                texto = repr(sorted(self.excecoes.items())).encode('utf-8')
+                self._identidade = f"{self.codigo_calendario}+{hashlib.sha1(texto).hexdigest()[:12]}"
+        return self._identidade
+
+
+def obter_indice_dias_uteis(calendario=CALENDARIO_PADRAO):
+    """
+    Retorna o índice de dias úteis de um calendário
+
+    O índice cobre os anos de LIMITES['ANO_MIN'] a LIMITES['ANO_MAX'] e é
+    obtido uma única vez por processo e calendário, na primeira chamada: da
+    tabela binária gerada por tabela_feriados.py (mapeada em memória, sem
+    importar a workalendar) ou, se ela estiver ausente ou desatualizada,
+    calculado pela workalendar.
+
+    Args:
+        calendario (str): Código ou sigla do calendário (padrão: nacional)
+
+    Returns:
+        IndiceDiasUteis: Índice de dias úteis
+    """
+    indice = _indices.get(calendario)
+    if indice is None:
+        codigo = resolver_calendario(calendario)
+        with _lock_indices:
+            indice = _indices.get(codigo)
+            if indice is None:
+                from tabela_feriados import carregar_tabela
+                indice = carregar_tabela(calendario=codigo)
+                if indice is None:
+                    indice = IndiceDiasUteis.construir(
+                        _criar_calendario(codigo), LIMITES['ANO_MIN'], LIMITES['ANO_MAX'], codigo
+                    )
+                _indices[codigo] = indice
+            # Siglas e grafias alternativas apontam para o mesmo índice
+            _indices[calendario] = indice
+    return indice
+
+def definir_indice_dias_uteis(indice, calendario=CALENDARIO_PADRAO):
+    """
+    Define o índice de dias úteis usado pelas funções deste módulo
+
+    Permite reaproveitar um índice já construído (por exemplo, publicado
+    em memória compartilhada por outro processo) sem recalcular os feriados.
+
+    Args:
+        indice (IndiceDiasUteis): Índice a ser usado
+        calendario (str): Código do calendário do índice
+    """
+    codigo = resolver_calendario(calendario)
+    with _lock_indices:
+        # Descartar também as siglas que apontavam para o índice anterior
+        anterior = _indices.get(codigo)
+        for chave in [chave for chave, atual in _indices.items() if atual is anterior]:
+            del _indices[chave]
+        _indices[codigo] = indice
+
+def aplicar_excecoes(excecoes, calendario=CALENDARIO_PADRAO, permitir_fim_de_semana=False):
+    """
+    Aplica exceções (folgas, pontos facultativos, feriados trabalhados) a um calendário
+
+    Na primeira aplicação o índice do calendário é copiado, de modo que o
+    índice de origem (tabela binária) continua intacto; as aplicações
+    seguintes alteram a cópia diretamente.
+
+    Args:
+        excecoes (iterable): Tuplas (data, útil, descrição)
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+        permitir_fim_de_semana (bool): Aceita dias trabalhados em sábados e domingos
+            (ver IndiceDiasUteis.definir_excecao)
+
+    Returns:
+        int: Quantidade de exceções aplicadas
+    """
+    indice = obter_indice_dias_uteis(calendario)
+    if not indice.excecoes:
+        indice = indice.copiar()
+    quantidade = indice.definir_excecoes(excecoes, permitir_fim_de_semana)
+    definir_indice_dias_uteis(indice, calendario)
+    return quantidade
+
+def remover_excecoes(calendario=CALENDARIO_PADRAO):
+    """
+    Descarta as exceções de um calendário (o índice é recarregado no próximo uso)
+
+    Args:
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+    """
+    codigo = resolver_calendario(calendario)
+    with _lock_indices:
+        anterior = _indices.get(codigo)
+        if anterior is not None and anterior.excecoes:
+            for chave in [chave for chave, atual in _indices.items() if atual is anterior]:
+                del _indices[chave]
+
+def identidade_calendario(calendario=CALENDARIO_PADRAO):
+    """
+    Identidade do calendário com as exceções aplicadas (ver IndiceDiasUteis.identidade)
+
+    Args:
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+
+    Returns:
+        str: Identidade usada nas chaves de cache
+    """
+    return obter_indice_dias_uteis(calendario).identidade()
+
+def eh_feriado(data, calendario=CALENDARIO_PADRAO):
+    """
+    Verifica se uma data é feriado no calendário
+
+    Args:
+        data (datetime.date): Data a verificar
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+
+    Returns:
+        bool: True se a data é feriado
+    """
+    indice = obter_indice_dias_uteis(calendario)
+    if indice.cobre(data, data):
+        return indice.eh_feriado(data)
+    return indice.calendario.is_holiday(data)
+
+def eh_dia_util(data, calendario=CALENDARIO_PADRAO):
+    """
+    Verifica se uma data é dia útil (não é fim de semana nem feriado)
+
+    Args:
+        data (datetime.date): Data a verificar
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+
+    Returns:
+        bool: True se a data é dia útil
+    """
+    indice = obter_indice_dias_uteis(calendario)
+    if indice.cobre(data, data):
+        return indice.eh_dia_util(data)
+    return data.weekday() < 5 and not indice.calendario.is_holiday(data)
+
+def calcular_dias_uteis_periodo(data_inicio, data_fim, calendario=CALENDARIO_PADRAO):
     """
     Calcula o total de dias úteis em um período específico
-    usando a biblioteca workalendar (considerando feriados brasileiros)
+    usando a biblioteca workalendar (considerando os feriados do calendário)
     
     Args:
         data_inicio (datetime.date): Data de início do período
         data_fim (datetime.date): Data de fim do período
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
         
     Returns:
         int: Número de dias úteis no período
     """
-    # Criar calendário brasileiro (inclui feriados nacionais)
-    cal = Brazil()
+    indice = obter_indice_dias_uteis(calendario)
+    if indice.cobre(data_inicio, data_fim):
+        return indice.contar_dias_uteis(data_inicio, data_fim)
     
-    # Calcular dias úteis manualmente para maior precisão
+    # Fora da faixa do índice: percorrer o período dia a dia
+    cal = indice.calendario
     dias_uteis = 0
     data_atual = data_inicio
     
@@ -32,14 +537,56 @@ def calcular_dias_uteis_periodo(data_inicio, data_fim):
     
     return dias_uteis
 
-def calcular_dias_uteis(mes, ano):
+def calcular_dias_uteis_periodo_lote(datas_inicio, datas_fim, calendario=CALENDARIO_PADRAO):
+    """
+    Versão vetorizada de calcular_dias_uteis_periodo para muitos períodos
+    
+    Os períodos são convertidos em datetime64[D] e contados de uma só vez
+    por numpy.busday_count, com o busdaycalendar montado a partir dos
+    feriados do índice. Se o calendário tiver fins de semana trabalhados
+    por exceção, a contagem usa diretamente o acumulado do índice.
+    
+    Args:
+        datas_inicio (array-like): Datas de início (datetime64, datetime.date ou strings ISO)
+        datas_fim (array-like): Datas de fim, no mesmo formato
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+        
+    Returns:
+        numpy.ndarray: Dias úteis de cada período (int64; 0 se o fim for anterior ao início)
+    """
+    import numpy as np
+    
+    indice = obter_indice_dias_uteis(calendario)
+    inicios, fins = np.broadcast_arrays(np.asarray(datas_inicio, dtype='datetime64[D]'),
+                                        np.asarray(datas_fim, dtype='datetime64[D]'))
+    inicio_indice = np.datetime64(indice.inicio, 'D')
+    fim_indice = np.datetime64(indice.fim, 'D')
+    if inicios.size and (min(inicios.min(), fins.min()) < inicio_indice
+                         or max(inicios.max(), fins.max()) > fim_indice):
+        raise ValueError(
+            f"Datas fora da faixa do calendário ({indice.inicio.strftime('%d/%m/%Y')} "
+            f"a {indice.fim.strftime('%d/%m/%Y')})"
+        )
+    
+    calendario_numpy = indice.calendario_numpy()
+    if calendario_numpy is not None:
+        # busday_count conta [inicio, fim); o período é inclusive
+        contagem = np.busday_count(inicios, fins + 1, busdaycal=calendario_numpy).astype(np.int64)
+    else:
+        acumulado = indice.como_arrays()[1]
+        contagem = (acumulado[(fins - inicio_indice).astype(np.int64) + 1].astype(np.int64)
+                    - acumulado[(inicios - inicio_indice).astype(np.int64)])
+    return np.where(fins < inicios, 0, contagem)
+
+def calcular_dias_uteis(mes, ano, calendario=CALENDARIO_PADRAO):
     """
     Calcula o total de dias úteis em um mês específico
-    usando a biblioteca workalendar (considerando feriados brasileiros)
+    usando a biblioteca workalendar (considerando os feriados do calendário)
     
     Args:
         mes (int): Mês (1-12)
         ano (int): Ano (1900-2100)
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
         
     Returns:
         int: Número de dias úteis no mês
@@ -53,7 +600,7 @@ def calcular_dias_uteis(mes, ano):
     else:
         ultimo_dia = datetime.date(ano, mes + 1, 1) - datetime.timedelta(days=1)
     
-    return calcular_dias_uteis_periodo(primeiro_dia, ultimo_dia)
+    return calcular_dias_uteis_periodo(primeiro_dia, ultimo_dia, calendario)
 
 def validar_data(data_str):
     """
@@ -114,18 +661,24 @@ def validar_mes_ano(mes, ano):
     except ValueError:
         return False, "Data inválida"
 
-def mostrar_feriados_periodo(data_inicio, data_fim):
+def mostrar_feriados_periodo(data_inicio, data_fim, calendario=CALENDARIO_PADRAO):
     """
     Mostra os feriados em um período específico
     
     Args:
         data_inicio (datetime.date): Data de início do período
         data_fim (datetime.date): Data de fim do período
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
         
     Returns:
         list: Lista de datas dos feriados
     """
-    cal = Brazil()
+    indice = obter_indice_dias_uteis(calendario)
+    if indice.cobre(data_inicio, data_fim):
+        return indice.listar_feriados(data_inicio, data_fim)
+    
+    # Fora da faixa do índice: percorrer o período dia a dia
+    cal = indice.calendario
     feriados = []
     data_atual = data_inicio
     
@@ -136,13 +689,14 @@ def mostrar_feriados_periodo(data_inicio, data_fim):
     
     return feriados
 
-def mostrar_feriados_mes(mes, ano):
+def mostrar_feriados_mes(mes, ano, calendario=CALENDARIO_PADRAO):
     """
     Mostra os feriados do mês especificado
     
     Args:
         mes (int): Mês (1-12)
         ano (int): Ano (1900-2100)
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
         
     Returns:
         list: Lista de datas dos feriados
@@ -154,7 +708,7 @@ def mostrar_feriados_mes(mes, ano):
     else:
         ultimo_dia = datetime.date(ano, mes + 1, 1) - datetime.timedelta(days=1)
     
-    return mostrar_feriados_periodo(primeiro_dia, ultimo_dia)
+    return mostrar_feriados_periodo(primeiro_dia, ultimo_dia, calendario)
 
 def obter_total_dias_periodo(data_inicio, data_fim):
     """
@@ -169,6 +723,91 @@ def obter_total_dias_periodo(data_inicio, data_fim):
     """
     return (data_fim - data_inicio).days + 1
 
+def contar_fins_de_semana(data_inicio, data_fim):
+    """
+    Conta os sábados e domingos de um período sem percorrê-lo
+    
+    Args:
+        data_inicio (datetime.date): Data de início do período
+        data_fim (datetime.date): Data de fim do período
+        
+    Returns:
+        int: Número de dias de fim de semana no período (inclusive)
+    """
+    total_dias = (data_fim - data_inicio).days + 1
+    if total_dias <= 0:
+        return 0
+    
+    semanas, resto = divmod(total_dias, 7)
+    dia_semana = data_inicio.weekday()
+    # Cada semana completa tem 2 dias de fim de semana; o resto tem no máximo 6 dias
+    return semanas * 2 + sum(1 for i in range(resto) if (dia_semana + i) % 7 >= 5)
+
+def analisar_periodo(data_inicio, data_fim, cancelado=None, progresso=None,
+                     calendario=CALENDARIO_PADRAO):
+    """
+    Analisa um período em uma única passada (ou consulta ao índice)
+    
+    Substitui as chamadas separadas a calcular_dias_uteis_periodo,
+    mostrar_feriados_periodo e obter_total_dias_periodo.
+    
+    Args:
+        data_inicio (datetime.date): Data de início do período
+        data_fim (datetime.date): Data de fim do período
+        cancelado (threading.Event): Sinal de cancelamento (opcional)
+        progresso (callable): Recebe a fração concluída, de 0.0 a 1.0 (opcional)
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+        
+    Returns:
+        dict: Dicionário com dias_uteis, total_dias, dias_nao_uteis,
+        fins_de_semana e feriados (lista de tuplas (data, nome)),
+        ou None se a análise foi cancelada
+    """
+    total_dias = max(obter_total_dias_periodo(data_inicio, data_fim), 0)
+    indice = obter_indice_dias_uteis(calendario)
+    
+    if indice.cobre(data_inicio, data_fim):
+        dias_uteis = indice.contar_dias_uteis(data_inicio, data_fim)
+        feriados = [(data, indice.nomes_feriados[data.toordinal()])
+                    for data in indice.listar_feriados(data_inicio, data_fim)]
+    else:
+        # Fora da faixa do índice: uma única passada dia a dia
+        cal = indice.calendario
+        nomes_por_ano = {}
+        dias_uteis = 0
+        feriados = []
+        data_atual = data_inicio
+        
+        while data_atual <= data_fim:
+            nomes = nomes_por_ano.get(data_atual.year)
+            if nomes is None:
+                # Cancelamento e progresso verificados uma vez por ano percorrido
+                if cancelado is not None and cancelado.is_set():
+                    return None
+                if progresso is not None:
+                    progresso((data_atual - data_inicio).days / total_dias)
+                nomes = {}
+                for dia, nome in cal.holidays(data_atual.year):
+                    nomes[dia] = f"{nomes[dia]} / {nome}" if dia in nomes else nome
+                nomes_por_ano[data_atual.year] = nomes
+            
+            if data_atual in nomes:
+                feriados.append((data_atual, nomes[data_atual]))
+            elif data_atual.weekday() < 5:
+                dias_uteis += 1
+            data_atual += datetime.timedelta(days=1)
+    
+    if progresso is not None:
+        progresso(1.0)
+    
+    return {
+        'dias_uteis': dias_uteis,
+        'total_dias': total_dias,
+        'dias_nao_uteis': total_dias - dias_uteis,
+        'fins_de_semana': contar_fins_de_semana(data_inicio, data_fim),
+        'feriados': feriados
+    }
+
 def obter_total_dias_mes(mes, ano):
     """
     Obtém o total de dias em um mês
@@ -183,4 +822,311 @@ def obter_total_dias_mes(mes, ano):
     if mes == 12:
         return 31
     else:
-        return (datetime.date(ano, mes + 1, 1) - datetime.date(ano, mes, 1)).days 
\ No newline at end of file
+        return (datetime.date(ano, mes + 1, 1) - datetime.date(ano, mes, 1)).days 
+
+def _segundos_uteis_ate(indice, momento, inicio_expediente):
+    """
+    Segundos úteis entre o início do índice e um momento (datetime.datetime)
+    """
+    jornada = HORAS_POR_DIA * MINUTOS_POR_HORA * 60
+    data = momento.date()
+    if not indice.cobre(data, data):
+        raise ValueError(f"Data fora da faixa do calendário: {data.strftime('%d/%m/%Y')}")
+    
+    posicao = data.toordinal() - indice.ordinal_inicio
+    segundos = indice.acumulado[posicao] * jornada
+    if indice.dias_uteis[posicao]:
+        segundos_do_dia = momento.hour * 3600 + momento.minute * 60 + momento.second
+        segundos += min(max(segundos_do_dia - inicio_expediente, 0), jornada)
+    return segundos
+
+def calcular_minutos_uteis(inicio, fim, hora_inicio_expediente=HORA_INICIO_EXPEDIENTE,
+                           calendario=CALENDARIO_PADRAO):
+    """
+    Calcula os minutos úteis decorridos entre dois momentos
+    
+    Conta apenas o expediente (HORAS_POR_DIA horas a partir de
+    hora_inicio_expediente) dos dias úteis, descontando noites, fins de
+    semana e feriados.
+    
+    Args:
+        inicio (datetime.datetime): Momento inicial (ex.: abertura do chamado)
+        fim (datetime.datetime): Momento final (ex.: fechamento do chamado)
+        hora_inicio_expediente (int): Hora de início do expediente
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+        
+    Returns:
+        float: Minutos úteis (negativo se fim for anterior a inicio)
+    """
+    indice = obter_indice_dias_uteis(calendario)
+    inicio_expediente = hora_inicio_expediente * 3600
+    return (_segundos_uteis_ate(indice, fim, inicio_expediente)
+            - _segundos_uteis_ate(indice, inicio, inicio_expediente)) / 60
+
+def _segundos_uteis_ate_lote(indice, momentos, inicio_expediente):
+    """
+    Versão vetorizada de _segundos_uteis_ate para um array datetime64[s]
+    """
+    import numpy as np
+    
+    dias_uteis, acumulado = indice.como_arrays()
+    jornada = HORAS_POR_DIA * MINUTOS_POR_HORA * 60
+    
+    dias = momentos.astype('datetime64[D]')
+    posicoes = (dias - np.datetime64(indice.inicio, 'D')).astype(np.int64)
+    if posicoes.size and (posicoes.min() < 0 or posicoes.max() >= dias_uteis.size):
+        raise ValueError(
+            f"Datas fora da faixa do calendário ({indice.inicio.strftime('%d/%m/%Y')} "
+            f"a {indice.fim.strftime('%d/%m/%Y')})"
+        )
+    
+    segundos_do_dia = (momentos - dias).astype(np.int64)
+    parcial = np.clip(segundos_do_dia - inicio_expediente, 0, jornada) * dias_uteis[posicoes]
+    return acumulado[posicoes].astype(np.int64) * jornada + parcial
+
+def calcular_minutos_uteis_lote(inicios, fins, hora_inicio_expediente=HORA_INICIO_EXPEDIENTE,
+                                calendario=CALENDARIO_PADRAO):
+    """
+    Calcula os minutos úteis entre pares de momentos, de forma vetorizada
+    
+    Cada momento é convertido em "segundos úteis desde o início do índice"
+    (dias úteis acumulados × jornada + parte do expediente já decorrida no
+    dia), e a duração é a diferença entre os dois valores; o custo é
+    constante por par, independente da distância entre as datas.
+    
+    Args:
+        inicios (array-like): Momentos iniciais (datetime64, datetime.datetime ou strings ISO)
+        fins (array-like): Momentos finais, no mesmo formato
+        hora_inicio_expediente (int): Hora de início do expediente
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+        
+    Returns:
+        numpy.ndarray: Minutos úteis de cada par (float64)
+    """
+    import numpy as np
+    
+    indice = obter_indice_dias_uteis(calendario)
+    inicio_expediente = hora_inicio_expediente * 3600
+    inicios = np.asarray(inicios, dtype='datetime64[s]')
+    fins = np.asarray(fins, dtype='datetime64[s]')
+    
+    segundos = (_segundos_uteis_ate_lote(indice, fins, inicio_expediente)
+                - _segundos_uteis_ate_lote(indice, inicios, inicio_expediente))
+    return segundos / 60
+
+def _posicao(indice, data):
+    """Posição da data nas tabelas do índice (ValueError se fora da faixa)"""
+    if not indice.cobre(data, data):
+        raise ValueError(f"Data fora da faixa do calendário: {data.strftime('%d/%m/%Y')}")
+    return data.toordinal() - indice.ordinal_inicio
+
+def _data_do_dia_util(indice, ordem):
+    """
+    Data do dia útil de número ordem (0 = primeiro dia útil do índice), por busca binária
+    """
+    if ordem < 0 or ordem >= indice.acumulado[-1]:
+        raise ValueError("Resultado fora da faixa do calendário")
+    # Primeira posição p com acumulado[p + 1] > ordem
+    posicao = bisect.bisect_right(indice.acumulado, ordem) - 1
+    return datetime.date.fromordinal(indice.ordinal_inicio + posicao)
+
+def adicionar_dias_uteis(data, quantidade, calendario=CALENDARIO_PADRAO):
+    """
+    Soma (ou subtrai, se negativa) uma quantidade de dias úteis a uma data
+    
+    A data de partida não é contada: adicionar 1 dia útil a uma sexta-feira
+    resulta na segunda-feira seguinte (se não for feriado).
+    
+    Args:
+        data (datetime.date): Data de partida
+        quantidade (int): Dias úteis a somar (negativo para subtrair)
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+        
+    Returns:
+        datetime.date: Data resultante
+    """
+    if quantidade == 0:
+        return data
+    indice = obter_indice_dias_uteis(calendario)
+    posicao = _posicao(indice, data)
+    if quantidade > 0:
+        return _data_do_dia_util(indice, indice.acumulado[posicao + 1] + quantidade - 1)
+    return _data_do_dia_util(indice, indice.acumulado[posicao] + quantidade)
+
+def subtrair_dias_uteis(data, quantidade, calendario=CALENDARIO_PADRAO):
+    """
+    Subtrai uma quantidade de dias úteis de uma data
+    
+    Args:
+        data (datetime.date): Data de partida
+        quantidade (int): Dias úteis a subtrair
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+        
+    Returns:
+        datetime.date: Data resultante
+    """
+    return adicionar_dias_uteis(data, -quantidade, calendario)
+
+def proximo_dia_util(data, incluir_data=False, calendario=CALENDARIO_PADRAO):
+    """
+    Retorna o próximo dia útil
+    
+    Args:
+        data (datetime.date): Data de referência
+        incluir_data (bool): Se True, retorna a própria data quando ela é dia útil
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+        
+    Returns:
+        datetime.date: Próximo dia útil
+    """
+    if incluir_data and eh_dia_util(data, calendario):
+        return data
+    return adicionar_dias_uteis(data, 1, calendario)
+
+def dia_util_anterior(data, incluir_data=False, calendario=CALENDARIO_PADRAO):
+    """
+    Retorna o dia útil anterior
+    
+    Args:
+        data (datetime.date): Data de referência
+        incluir_data (bool): Se True, retorna a própria data quando ela é dia útil
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+        
+    Returns:
+        datetime.date: Dia útil anterior
+    """
+    if incluir_data and eh_dia_util(data, calendario):
+        return data
+    return adicionar_dias_uteis(data, -1, calendario)
+
+def enesimo_dia_util_mes(mes, ano, n, calendario=CALENDARIO_PADRAO):
+    """
+    Retorna o n-ésimo dia útil de um mês
+    
+    Args:
+        mes (int): Mês (1-12)
+        ano (int): Ano
+        n (int): Posição do dia útil (1 = primeiro; -1 = último)
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+        
+    Returns:
+        datetime.date: Data do n-ésimo dia útil
+    """
+    if n == 0:
+        raise ValueError("n deve ser diferente de zero")
+    
+    indice = obter_indice_dias_uteis(calendario)
+    primeiro_dia = datetime.date(ano, mes, 1)
+    ultimo_dia = primeiro_dia + datetime.timedelta(days=obter_total_dias_mes(mes, ano) - 1)
+    inicio = indice.acumulado[_posicao(indice, primeiro_dia)]
+    fim = indice.acumulado[_posicao(indice, ultimo_dia) + 1]
+    
+    ordem = inicio + n - 1 if n > 0 else fim + n
+    if not inicio <= ordem < fim:
+        raise ValueError(f"O mês {mes:02d}/{ano} tem apenas {fim - inicio} dias úteis")
+    return _data_do_dia_util(indice, ordem)
+
+def adicionar_minutos_uteis(momento, minutos, hora_inicio_expediente=HORA_INICIO_EXPEDIENTE,
+                            calendario=CALENDARIO_PADRAO):
+    """
+    Soma minutos úteis a um momento (ex.: prazo de SLA de um chamado)
+    
+    Apenas o expediente dos dias úteis é contado. Quando o prazo cai
+    exatamente no fim de uma jornada, o resultado é o fim do expediente
+    desse dia (e não o início do dia útil seguinte).
+    
+    Args:
+        momento (datetime.datetime): Momento de partida (ex.: abertura do chamado)
+        minutos (float): Minutos úteis a somar (negativo para subtrair)
+        hora_inicio_expediente (int): Hora de início do expediente
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+        
+    Returns:
+        datetime.datetime: Momento resultante
+    """
+    if minutos == 0:
+        return momento
+    
+    indice = obter_indice_dias_uteis(calendario)
+    jornada = HORAS_POR_DIA * MINUTOS_POR_HORA * 60
+    inicio_expediente = hora_inicio_expediente * 3600
+    alvo = _segundos_uteis_ate(indice, momento, inicio_expediente) + minutos * 60
+    
+    ordem, resto = divmod(alvo, jornada)
+    if resto == 0:
+        ordem, resto = ordem - 1, jornada
+    data = _data_do_dia_util(indice, int(ordem))
+    return (datetime.datetime.combine(data, datetime.time())
+            + datetime.timedelta(seconds=inicio_expediente + resto))
+
+def _data_do_dia_util_lote(indice, ordens):
+    """Versão vetorizada de _data_do_dia_util; devolve as posições no índice"""
+    import numpy as np
+    
+    _, acumulado = indice.como_arrays()
+    if ordens.size and (ordens.min() < 0 or ordens.max() >= acumulado[-1]):
+        raise ValueError("Resultado fora da faixa do calendário")
+    return np.searchsorted(acumulado, ordens, side='right') - 1
+
+def adicionar_dias_uteis_lote(datas, quantidades, calendario=CALENDARIO_PADRAO):
+    """
+    Versão vetorizada de adicionar_dias_uteis (busca binária por elemento)
+    
+    Args:
+        datas (array-like): Datas de partida (datetime64, datetime.date ou strings ISO)
+        quantidades (array-like ou int): Dias úteis a somar (negativo para subtrair)
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+        
+    Returns:
+        numpy.ndarray: Datas resultantes (datetime64[D])
+    """
+    import numpy as np
+    
+    indice = obter_indice_dias_uteis(calendario)
+    dias_uteis, acumulado = indice.como_arrays()
+    datas = np.asarray(datas, dtype='datetime64[D]')
+    quantidades = np.broadcast_to(np.asarray(quantidades, dtype=np.int64), datas.shape)
+    
+    inicio_indice = np.datetime64(indice.inicio, 'D')
+    posicoes = (datas - inicio_indice).astype(np.int64)
+    if posicoes.size and (posicoes.min() < 0 or posicoes.max() >= dias_uteis.size):
+        raise ValueError("Datas fora da faixa do calendário")
+    
+    antes = acumulado[posicoes].astype(np.int64)
+    depois = acumulado[posicoes + 1].astype(np.int64)
+    ordens = np.where(quantidades > 0, depois + quantidades - 1, antes + quantidades)
+    resultado = inicio_indice + _data_do_dia_util_lote(indice, ordens)
+    return np.where(quantidades == 0, datas, resultado)
+
+def adicionar_minutos_uteis_lote(momentos, minutos, hora_inicio_expediente=HORA_INICIO_EXPEDIENTE,
+                                 calendario=CALENDARIO_PADRAO):
+    """
+    Versão vetorizada de adicionar_minutos_uteis, para cálculo de SLA em massa
+    
+    Args:
+        momentos (array-like): Momentos de partida (datetime64, datetime.datetime ou strings ISO)
+        minutos (array-like ou float): Minutos úteis a somar (negativo para subtrair)
+        hora_inicio_expediente (int): Hora de início do expediente
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+        
+    Returns:
+        numpy.ndarray: Momentos resultantes (datetime64[s])
+    """
+    import numpy as np
+    
+    indice = obter_indice_dias_uteis(calendario)
+    jornada = HORAS_POR_DIA * MINUTOS_POR_HORA * 60
+    inicio_expediente = hora_inicio_expediente * 3600
+    momentos = np.asarray(momentos, dtype='datetime64[s]')
+    segundos = np.rint(np.broadcast_to(np.asarray(minutos, dtype=np.float64), momentos.shape) * 60).astype(np.int64)
+    
+    alvo = _segundos_uteis_ate_lote(indice, momentos, inicio_expediente) + segundos
+    ordens, restos = np.divmod(alvo, jornada)
+    fim_de_jornada = restos == 0
+    ordens = ordens - fim_de_jornada
+    restos = np.where(fim_de_jornada, jornada, restos)
+    
+    posicoes = _data_do_dia_util_lote(indice, ordens)
+    resultado = (np.datetime64(indice.inicio, 's')
+                 + (posicoes * 86400 + inicio_expediente + restos).astype('timedelta64[s]'))
+    return np.where(segundos == 0, momentos, resultado)
@@ -0,0 +1,159 @@
+"""
+Registro dos calendários de feriados disponíveis (nacional, estaduais e municipais)
+
+O código de cada calendário é o nome da classe correspondente em
+workalendar.america; as siglas das UFs (ex.: 'SP') também são aceitas e
+apontam para o calendário estadual. A workalendar só é importada quando
+um calendário é efetivamente criado.
+"""
+
+# Calendário padrão (feriados nacionais brasileiros)
+CALENDARIO_PADRAO = 'Brazil'
+
+# Código -> (descrição, abrangência)
+CALENDARIOS = {
+    'Brazil': ("Brasil (nacional)", 'nacional'),
+
+    'BrazilAcre': ("Acre", 'estadual'),
+    'BrazilAlagoas': ("Alagoas", 'estadual'),
+    'BrazilAmapa': ("Amapá", 'estadual'),
+    'BrazilAmazonas': ("Amazonas", 'estadual'),
+    'BrazilBahia': ("Bahia", 'estadual'),
+    'BrazilCeara': ("Ceará", 'estadual'),
+    'BrazilDistritoFederal': ("Distrito Federal", 'estadual'),
+    'BrazilEspiritoSanto': ("Espírito Santo", 'estadual'),
+    'BrazilGoias': ("Goiás", 'estadual'),
+    'BrazilMaranhao': ("Maranhão", 'estadual'),
+    'BrazilMatoGrosso': ("Mato Grosso", 'estadual'),
+    'BrazilMatoGrossoDoSul': ("Mato Grosso do Sul", 'estadual'),
+    'BrazilMinasGerais': ("Minas Gerais", 'estadual'),
+    'BrazilPara': ("Pará", 'estadual'),
+    'BrazilParaiba': ("Paraíba", 'estadual'),
+    'BrazilParana': ("Paraná", 'estadual'),
+    'BrazilPernambuco': ("Pernambuco", 'estadual'),
+    'BrazilPiaui': ("Piauí", 'estadual'),
+    'BrazilRioDeJaneiro': ("Rio de Janeiro", 'estadual'),
+    'BrazilRioGrandeDoNorte': ("Rio Grande do Norte", 'estadual'),
+    'BrazilRioGrandeDoSul': ("Rio Grande do Sul", 'estadual'),
+    'BrazilRondonia': ("Rondônia", 'estadual'),
+    'BrazilRoraima': ("Roraima", 'estadual'),
+    'BrazilSantaCatarina': ("Santa Catarina", 'estadual'),
+    'BrazilSaoPauloState': ("São Paulo", 'estadual'),
+    'BrazilSergipe': ("Sergipe", 'estadual'),
+    'BrazilTocantins': ("Tocantins", 'estadual'),
+
+    'BrazilAracajuCity': ("Aracaju (SE)", 'municipal'),
+    'BrazilBelemCity': ("Belém (PA)", 'municipal'),
+    'BrazilBeloHorizonteCity': ("Belo Horizonte (MG)", 'municipal'),
+    'BrazilBoaVistaCity': ("Boa Vista (RR)", 'municipal'),
+    'BrazilCampoGrandeCity': ("Campo Grande (MS)", 'municipal'),
+    'BrazilCariacicaCity': ("Cariacica (ES)", 'municipal'),
+    'BrazilChapecoCity': ("Chapecó (SC)", 'municipal'),
+    'BrazilCuiabaCity': ("Cuiabá (MT)", 'municipal'),
+    'BrazilCuritibaCity': ("Curitiba (PR)", 'municipal'),
+    'BrazilFlorianopolisCity': ("Florianópolis (SC)", 'municipal'),
+    'BrazilFortalezaCity': ("Fortaleza (CE)", 'municipal'),
+    'BrazilGoianiaCity': ("Goiânia (GO)", 'municipal'),
+    'BrazilGuarapariCity': ("Guarapari (ES)", 'municipal'),
+    'BrazilJoaoPessoaCity': ("João Pessoa (PB)", 'municipal'),
+    'BrazilJoinvilleCity': ("Joinville (SC)", 'municipal'),
+    'BrazilMacapaCity': ("Macapá (AP)", 'municipal'),
+    'BrazilMaceioCity': ("Maceió (AL)", 'municipal'),
+    'BrazilManausCity': ("Manaus (AM)", 'municipal'),
+    'BrazilNatalCity': ("Natal (RN)", 'municipal'),
+    'BrazilPalmasCity': ("Palmas (TO)", 'municipal'),
+    'BrazilPortoAlegreCity': ("Porto Alegre (RS)", 'municipal'),
+    'BrazilPortoVelhoCity': ("Porto Velho (RO)", 'municipal'),
+    'BrazilRecifeCity': ("Recife (PE)", 'municipal'),
+    'BrazilRioBrancoCity': ("Rio Branco (AC)", 'municipal'),
+    'BrazilSalvadorCity': ("Salvador (BA)", 'municipal'),
+    'BrazilSaoPauloCity': ("São Paulo (SP)", 'municipal'),
+    'BrazilSerraCity': ("Serra (ES)", 'municipal'),
+    'BrazilSorocabaCity': ("Sorocaba (SP)", 'municipal'),
+    'BrazilTeresinaCity': ("Teresina (PI)", 'municipal'),
+    'BrazilVilaVelhaCity': ("Vila Velha (ES)", 'municipal'),
+    'BrazilVitoriaCity': ("Vitória (ES)", 'municipal')
+}
+
+# Sigla da UF -> código do calendário estadual
+SIGLAS_UF = {
+    'AC': 'BrazilAcre', 'AL': 'BrazilAlagoas', 'AP': 'BrazilAmapa', 'AM': 'BrazilAmazonas',
+    'BA': 'BrazilBahia', 'CE': 'BrazilCeara', 'DF': 'BrazilDistritoFederal',
+    'ES': 'BrazilEspiritoSanto', 'GO': 'BrazilGoias', 'MA': 'BrazilMaranhao',
+    'MT': 'BrazilMatoGrosso', 'MS': 'BrazilMatoGrossoDoSul', 'MG': 'BrazilMinasGerais',
+    'PA': 'BrazilPara', 'PB': 'BrazilParaiba', 'PR': 'BrazilParana', 'PE': 'BrazilPernambuco',
+    'PI': 'BrazilPiaui', 'RJ': 'BrazilRioDeJaneiro', 'RN': 'BrazilRioGrandeDoNorte',
+    'RS': 'BrazilRioGrandeDoSul', 'RO': 'BrazilRondonia', 'RR': 'BrazilRoraima',
+    'SC': 'BrazilSantaCatarina', 'SP': 'BrazilSaoPauloState', 'SE': 'BrazilSergipe',
+    'TO': 'BrazilTocantins', 'BR': CALENDARIO_PADRAO
+}
+
+# Códigos em minúsculas, para aceitar 'brazilsaopaulocity' etc.
+_CODIGOS_MINUSCULOS = {codigo.lower(): codigo for codigo in CALENDARIOS}
+
+def resolver_calendario(codigo):
+    """
+    Converte um código, sigla de UF ou None no código canônico do calendário
+
+    Args:
+        codigo (str): Código (ex.: 'BrazilSaoPauloCity'), sigla ('SP') ou None (padrão)
+
+    Returns:
+        str: Código canônico, chave de CALENDARIOS
+
+    Raises:
+        ValueError: Se o calendário não existe
+    """
+    if codigo is None:
+        return CALENDARIO_PADRAO
+    if codigo in CALENDARIOS:
+        return codigo
+
+    texto = str(codigo).strip()
+    if not texto:
+        return CALENDARIO_PADRAO
+    canonico = SIGLAS_UF.get(texto.upper()) or _CODIGOS_MINUSCULOS.get(texto.lower())
+    if canonico is None:
+        raise ValueError(f"Calendário desconhecido: {texto}")
+    return canonico
+
+def descrever_calendario(codigo):
+    """
+    Retorna a descrição de um calendário
+
+    Args:
+        codigo (str): Código ou sigla do calendário
+
+    Returns:
+        str: Descrição (ex.: "São Paulo (SP)")
+    """
+    return CALENDARIOS[resolver_calendario(codigo)][0]
+
+def listar_calendarios(abrangencia=None):
+    """
+    Lista os calendários registrados
+
+    Args:
+        abrangencia (str): 'nacional', 'estadual' ou 'municipal' (padrão: todos)
+
+    Returns:
+        list: Tuplas (código, descrição), na ordem do registro
+    """
+    return [(codigo, descricao) for codigo, (descricao, tipo) in CALENDARIOS.items()
+            if abrangencia is None or tipo == abrangencia]
+
+def criar_calendario(codigo=CALENDARIO_PADRAO):
+    """
+    Cria o calendário workalendar de um código
+
+    A importação fica aqui para que consultas atendidas pelas tabelas
+    binárias de feriados não carreguem a workalendar.
+
+    Args:
+        codigo (str): Código ou sigla do calendário
+
+    Returns:
+        workalendar.core.Calendar: Calendário correspondente
+    """
+    import workalendar.america
+    return getattr(workalendar.america, resolver_calendario(codigo))()
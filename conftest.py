@@ -0,0 +1,3 @@
+"""
+Configuração do pytest: os módulos do projeto ficam na raiz do repositório
+"""
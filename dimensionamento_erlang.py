@@ -0,0 +1,232 @@
+"""
+Módulo para dimensionamento por intervalo com Erlang C
+
+Complementa a fórmula de carga de trabalho de calcular_metricas_operacionais
+(tempo total / minutos disponíveis), que ignora a variabilidade das chegadas
+e o nível de serviço, calculando os agentes necessários em cada intervalo
+de 15 ou 30 minutos para atingir um nível de serviço e/ou um ASA alvo.
+
+Unidades: TMA e duração do intervalo em minutos (como no restante do
+sistema); tempo alvo do nível de serviço e ASA em segundos.
+"""
+
+import numpy as np
+
+from calculos_operacionais import HORAS_POR_DIA, MINUTOS_POR_HORA, calcular_metricas_operacionais
+
+def calcular_trafego(chamadas, tma, duracao_intervalo=30):
+    """
+    Calcula a intensidade de tráfego (Erlangs) de cada intervalo
+
+    Args:
+        chamadas (array-like): Chegadas por intervalo
+        tma (float ou array-like): Tempo médio de atendimento em minutos
+        duracao_intervalo (int): Duração do intervalo em minutos (15 ou 30)
+
+    Returns:
+        numpy.ndarray: Tráfego oferecido em Erlangs
+    """
+    return np.asarray(chamadas, dtype=np.float64) * np.asarray(tma, dtype=np.float64) / duracao_intervalo
+
+def _erlang_c(agentes, trafego, erlang_b):
+    """Probabilidade de espera (Erlang C) a partir do Erlang B de mesmo número de agentes"""
+    return agentes * erlang_b / (agentes - trafego * (1.0 - erlang_b))
+
+def calcular_agentes_erlang_c(chamadas, tma, duracao_intervalo=30, nivel_servico=0.8,
+                              tempo_alvo=20, asa_alvo=None):
+    """
+    Calcula os agentes necessários por intervalo com o modelo Erlang C
+
+    O Erlang B é obtido pela recorrência B(n) = A·B(n-1) / (n + A·B(n-1)),
+    numericamente estável, e convertido em Erlang C. O cálculo é feito uma
+    vez por par (tráfego, TMA) distinto; os pares avançam juntos, um agente
+    por iteração, ordenados por tráfego: a meta só é verificada nos pares
+    com tráfego menor que n, e os já resolvidos no início da ordem deixam
+    de ser atualizados.
+
+    Args:
+        chamadas (array-like): Chegadas por intervalo (qualquer formato, ex.: filas × intervalos)
+        tma (float ou array-like): Tempo médio de atendimento em minutos
+        duracao_intervalo (int): Duração do intervalo em minutos (15 ou 30)
+        nivel_servico (float): Fração das chamadas atendidas dentro de tempo_alvo
+            (0 a 1, exclusivo); None para não exigir nível de serviço
+        tempo_alvo (float): Tempo alvo do nível de serviço em segundos
+        asa_alvo (float): Tempo médio de espera máximo em segundos (opcional)
+
+    Returns:
+        numpy.ndarray: Agentes necessários por intervalo (int64), no formato de chamadas
+    """
+    if nivel_servico is None and asa_alvo is None:
+        raise ValueError("Informe nivel_servico e/ou asa_alvo")
+    if nivel_servico is not None and not 0 < nivel_servico < 1:
+        raise ValueError("nivel_servico deve estar entre 0 e 1 (exclusivo)")
+    if asa_alvo is not None and asa_alvo <= 0:
+        raise ValueError("asa_alvo deve ser maior que zero")
+
+    chamadas = np.asarray(chamadas, dtype=np.float64)
+    tma = np.broadcast_to(np.asarray(tma, dtype=np.float64), chamadas.shape).ravel()
+    trafego = calcular_trafego(chamadas, tma.reshape(chamadas.shape), duracao_intervalo).ravel()
+    if (tma <= 0).any():
+        raise ValueError("tma deve ser maior que zero")
+
+    # Intervalos com o mesmo par (tráfego, TMA) exigem os mesmos agentes: calcular uma vez
+    trafego_unico, tma_unico, inverso = _pares_unicos(trafego, tma)
+    agentes = _agentes_por_par(trafego_unico, tma_unico, nivel_servico, tempo_alvo, asa_alvo)
+    return agentes[inverso].reshape(chamadas.shape)
+
+def _pares_unicos(trafego, tma):
+    """
+    Obtém os pares (tráfego, TMA) distintos, em ordem crescente de tráfego
+
+    Returns:
+        tuple: (tráfego único, TMA único, índice do par de cada posição original)
+    """
+    if tma.size == 0 or (tma == tma[0]).all():
+        trafego_unico, inverso = np.unique(trafego, return_inverse=True)
+        return trafego_unico, np.full(trafego_unico.shape, tma[0] if tma.size else 0.0), inverso.ravel()
+
+    ordem = np.lexsort((tma, trafego))
+    trafego_ord = trafego[ordem]
+    tma_ord = tma[ordem]
+    novo = np.ones(ordem.size, dtype=bool)
+    novo[1:] = (trafego_ord[1:] != trafego_ord[:-1]) | (tma_ord[1:] != tma_ord[:-1])
+
+    inverso = np.empty(ordem.size, dtype=np.int64)
+    inverso[ordem] = np.cumsum(novo) - 1
+    return trafego_ord[novo], tma_ord[novo], inverso
+
+def _agentes_por_par(trafego, tma, nivel_servico, tempo_alvo, asa_alvo):
+    """Núcleo de calcular_agentes_erlang_c para arrays 1-D de tráfego e TMA"""
+    tempo_alvo_min = tempo_alvo / 60.0
+    asa_alvo_min = None if asa_alvo is None else asa_alvo / 60.0
+
+    agentes = np.zeros(trafego.shape, dtype=np.int64)
+
+    # Intervalos sem tráfego não precisam de agentes; os demais em ordem de tráfego
+    posicoes = np.flatnonzero(trafego > 0)
+    posicoes = posicoes[np.argsort(trafego[posicoes], kind='stable')]
+    trafego_ord = trafego[posicoes]
+    tma_ord = tma[posicoes]
+    total = posicoes.size
+
+    erlang_b = np.ones(total)
+    auxiliar = np.empty(total)
+    pendente = np.ones(total, dtype=bool)
+    inicio = 0  # antes desta posição todos os intervalos já foram resolvidos
+    n = 0
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        while inicio < total:
+            n += 1
+            b = erlang_b[inicio:]
+            aux = auxiliar[inicio:]
+            np.multiply(trafego_ord[inicio:], b, out=aux)
+            np.divide(aux, aux + n, out=b)
+
+            # Só há fila estável com mais agentes que tráfego
+            fim = int(np.searchsorted(trafego_ord, n, side='left'))
+            if fim <= inicio:
+                continue
+
+            trecho = slice(inicio, fim)
+            trafego_trecho = trafego_ord[trecho]
+            tma_trecho = tma_ord[trecho]
+            folga = n - trafego_trecho
+            prob_espera = _erlang_c(n, trafego_trecho, erlang_b[trecho])
+
+            atende = pendente[trecho].copy()
+            if nivel_servico is not None:
+                servico = 1.0 - prob_espera * np.exp(-folga * tempo_alvo_min / tma_trecho)
+                atende &= servico >= nivel_servico
+            if asa_alvo_min is not None:
+                atende &= prob_espera * tma_trecho / folga <= asa_alvo_min
+
+            agentes[posicoes[trecho][atende]] = n
+            pendente[trecho] &= ~atende
+
+            # Avançar o início até o primeiro intervalo ainda pendente
+            ainda_pendentes = np.flatnonzero(pendente[trecho])
+            inicio = fim if ainda_pendentes.size == 0 else inicio + int(ainda_pendentes[0])
+
+    return agentes
+
+def calcular_indicadores_erlang_c(chamadas, tma, agentes, duracao_intervalo=30, tempo_alvo=20):
+    """
+    Calcula nível de serviço, ASA e ocupação esperados para uma escala de agentes
+
+    Args:
+        chamadas (array-like): Chegadas por intervalo
+        tma (float ou array-like): Tempo médio de atendimento em minutos
+        agentes (array-like): Agentes escalados por intervalo
+        duracao_intervalo (int): Duração do intervalo em minutos
+        tempo_alvo (float): Tempo alvo do nível de serviço em segundos
+
+    Returns:
+        dict: Arrays nivel_servico, asa (segundos), prob_espera e ocupacao;
+        intervalos com agentes <= tráfego têm nivel_servico 0 e asa infinito
+    """
+    chamadas = np.asarray(chamadas, dtype=np.float64)
+    tma = np.broadcast_to(np.asarray(tma, dtype=np.float64), chamadas.shape)
+    agentes = np.broadcast_to(np.asarray(agentes, dtype=np.int64), chamadas.shape)
+    trafego = calcular_trafego(chamadas, tma, duracao_intervalo)
+
+    # Erlang B até o maior número de agentes, guardando o valor de cada intervalo no seu n
+    erlang_b = np.ones(chamadas.shape)
+    erlang_b_final = np.ones(chamadas.shape)
+    for n in range(1, int(agentes.max(initial=0)) + 1):
+        erlang_b = trafego * erlang_b / (n + trafego * erlang_b)
+        erlang_b_final = np.where(agentes == n, erlang_b, erlang_b_final)
+
+    estavel = agentes > trafego
+    folga = np.where(estavel, agentes - trafego, 1.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        prob_espera = np.where(estavel, _erlang_c(agentes, trafego, erlang_b_final), 1.0)
+    prob_espera = np.where(trafego == 0, 0.0, prob_espera)
+
+    servico = 1.0 - prob_espera * np.exp(-folga * (tempo_alvo / 60.0) / tma)
+    asa = prob_espera * tma / folga * 60.0
+    ocupacao = np.divide(trafego, agentes, out=np.zeros(chamadas.shape), where=agentes > 0)
+
+    return {
+        'nivel_servico': np.where(estavel | (trafego == 0), servico, 0.0),
+        'asa': np.where(estavel | (trafego == 0), asa, np.inf),
+        'prob_espera': prob_espera,
+        'ocupacao': np.minimum(ocupacao, 1.0)
+    }
+
+def conciliar_com_headcount(agentes, chamadas, tma, dias_uteis, duracao_intervalo=30):
+    """
+    Compara o dimensionamento por intervalo com pessoas_necessarias
+
+    A fórmula de carga de trabalho distribui o tempo total igualmente pelas
+    horas úteis; o Erlang C exige agentes extras nos picos. A conciliação
+    converte as horas-agente do Erlang C em pessoas equivalentes na mesma
+    base (dias_uteis × HORAS_POR_DIA).
+
+    Args:
+        agentes (array-like): Agentes por intervalo (resultado de calcular_agentes_erlang_c)
+        chamadas (array-like): Chegadas por intervalo do período
+        tma (int): Tempo médio de atendimento em minutos
+        dias_uteis (int): Dias úteis do período
+        duracao_intervalo (int): Duração do intervalo em minutos
+
+    Returns:
+        dict: pessoas_necessarias (fórmula atual), pessoas_equivalentes_erlang,
+        pico_agentes, minutos_agente_erlang, horas_uteis_mes e fator_erlang
+        (horas-agente Erlang / tempo total de atendimento)
+    """
+    agentes = np.asarray(agentes, dtype=np.int64)
+    total_chamados = int(round(float(np.sum(chamadas))))
+    metricas = calcular_metricas_operacionais(total_chamados, tma, dias_uteis)
+
+    minutos_agente = int(agentes.sum()) * duracao_intervalo
+    horas_uteis_mes = dias_uteis * (HORAS_POR_DIA * MINUTOS_POR_HORA)
+
+    return {
+        'pessoas_necessarias': metricas['pessoas_necessarias'],
+        'pessoas_equivalentes_erlang': minutos_agente / horas_uteis_mes,
+        'pico_agentes': int(agentes.max(initial=0)),
+        'minutos_agente_erlang': minutos_agente,
+        'horas_uteis_mes': horas_uteis_mes,
+        'fator_erlang': minutos_agente / metricas['tempo_total'] if metricas['tempo_total'] else 0.0
+    }
@@ -0,0 +1,163 @@
+"""
+Módulo de exceções da empresa sobre o calendário de feriados
+
+Folgas concedidas pela empresa, pontos facultativos e feriados trabalhados
+não constam dos calendários oficiais. Este módulo lê essas exceções de um
+arquivo e as aplica ao índice de dias úteis de qualquer calendário
+(ver calendario_utils.aplicar_excecoes), sem reconstruí-lo.
+
+Formato do arquivo (CSV com cabeçalho, ou .json com uma lista de objetos
+com os mesmos campos):
+
+    data,tipo,descricao
+    24/12/2025,folga,Véspera de Natal
+    05/03/2025,facultativo,Quarta-feira de Cinzas
+    20/11/2025,trabalhado,
+    29/11/2025,fim_de_semana_trabalhado,Inventário
+
+Sábados e domingos só podem ser marcados como trabalhados pelo tipo
+fim_de_semana_trabalhado; o tipo trabalhado em um fim de semana é
+rejeitado (provável erro de data). Folgas em feriados mantêm o nome do
+feriado (ver calendario_utils.IndiceDiasUteis.definir_excecao).
+
+Uso:
+    python excecoes_empresa.py excecoes.csv --calendario SP
+"""
+
+import csv
+import datetime
+import json
+import os
+
+from calendario_utils import CALENDARIO_PADRAO, aplicar_excecoes
+from validacoes import validar_data_robusta
+
+# Tipo -> (dia útil?, descrição padrão)
+TIPOS_EXCECAO = {
+    'folga': (False, "Folga da empresa"),
+    'facultativo': (False, "Ponto facultativo"),
+    'trabalhado': (True, "Feriado trabalhado"),
+    'fim_de_semana_trabalhado': (True, "Fim de semana trabalhado")
+}
+
+def _converter_excecao(numero, registro):
+    """
+    Valida um registro do arquivo de exceções
+
+    Args:
+        numero (int): Número do registro (para mensagens de erro)
+        registro (dict): Campos data, tipo e descricao (opcional)
+
+    Returns:
+        tuple: (data, útil, descrição)
+
+    Raises:
+        ValueError: Se a data ou o tipo forem inválidos
+    """
+    texto = str(registro.get('data') or '').strip()
+    # Aceitar também AAAA-MM-DD, validando pelas mesmas regras de DD/MM/AAAA
+    if texto[4:5] == '-':
+        try:
+            texto = datetime.date.fromisoformat(texto).strftime('%d/%m/%Y')
+        except ValueError:
+            raise ValueError(f"Linha {numero}: data inválida: {texto}")
+    valido, mensagem, data = validar_data_robusta(texto)
+    if not valido:
+        raise ValueError(f"Linha {numero}: {mensagem}")
+
+    tipo = str(registro.get('tipo') or '').strip().lower()
+    if tipo not in TIPOS_EXCECAO:
+        raise ValueError(f"Linha {numero}: tipo inválido '{tipo}' (use {', '.join(TIPOS_EXCECAO)})")
+
+    if tipo == 'trabalhado' and data.weekday() >= 5:
+        raise ValueError(f"Linha {numero}: {data.strftime('%d/%m/%Y')} cai em um fim de semana "
+                         f"(use o tipo fim_de_semana_trabalhado)")
+
+    util, descricao_padrao = TIPOS_EXCECAO[tipo]
+    descricao = str(registro.get('descricao') or '').strip()
+    if not util and descricao and tipo == 'facultativo':
+        descricao = f"{descricao_padrao}: {descricao}"
+    return data, util, descricao or descricao_padrao
+
+def ler_excecoes(caminho, delimitador=','):
+    """
+    Lê o arquivo de exceções da empresa
+
+    Args:
+        caminho (str): Arquivo CSV (com cabeçalho) ou .json
+        delimitador (str): Delimitador de colunas do CSV
+
+    Returns:
+        list: Tuplas (data, útil, descrição), na ordem do arquivo
+
+    Raises:
+        ValueError: Se o arquivo tiver colunas ausentes ou registros inválidos
+    """
+    if os.path.splitext(caminho)[1].lower() == '.json':
+        with open(caminho, 'r', encoding='utf-8') as arquivo:
+            registros = json.load(arquivo)
+        if not isinstance(registros, list):
+            raise ValueError("O arquivo JSON de exceções deve conter uma lista de objetos")
+        # Numeração a partir de 1, como os registros do CSV
+        return [_converter_excecao(numero, registro) for numero, registro in enumerate(registros, 1)]
+
+    with open(caminho, 'r', encoding='utf-8', newline='') as arquivo:
+        leitor = csv.DictReader(arquivo, delimiter=delimitador)
+        faltando = [campo for campo in ('data', 'tipo') if campo not in (leitor.fieldnames or [])]
+        if faltando:
+            raise ValueError(f"Colunas ausentes no arquivo de exceções: {', '.join(faltando)}")
+        # Linha 1 é o cabeçalho
+        return [_converter_excecao(numero, registro) for numero, registro in enumerate(leitor, 2)
+                if any((valor or '').strip() for valor in registro.values() if isinstance(valor, str))]
+
+def carregar_excecoes(caminho, calendario=CALENDARIO_PADRAO, delimitador=','):
+    """
+    Lê o arquivo de exceções e o aplica ao calendário
+
+    Args:
+        caminho (str): Arquivo de exceções (ver ler_excecoes)
+        calendario (str): Código ou sigla do calendário de base
+        delimitador (str): Delimitador de colunas do CSV
+
+    Returns:
+        dict: Dicionário com total, folgas (folgas + facultativos) e trabalhados
+    """
+    excecoes = ler_excecoes(caminho, delimitador)
+    # Fins de semana trabalhados já foram conferidos pelo tipo em ler_excecoes
+    aplicar_excecoes(excecoes, calendario, permitir_fim_de_semana=True)
+    trabalhados = sum(1 for _, util, _ in excecoes if util)
+    return {
+        'total': len(excecoes),
+        'folgas': len(excecoes) - trabalhados,
+        'trabalhados': trabalhados
+    }
+
+def main():
+    """Valida um arquivo de exceções e mostra seu efeito em um ano"""
+    import argparse
+    from calendario_utils import calcular_dias_uteis_periodo
+    from calendarios import descrever_calendario
+
+    parser = argparse.ArgumentParser(description="Aplica as exceções da empresa a um calendário de feriados")
+    parser.add_argument('arquivo', help="Arquivo de exceções (CSV ou .json)")
+    parser.add_argument('--calendario', default=CALENDARIO_PADRAO,
+                        help="Sigla da UF ou código do calendário (padrão: Brazil)")
+    parser.add_argument('--ano', type=int, default=datetime.date.today().year,
+                        help="Ano usado no resumo (padrão: ano atual)")
+    parser.add_argument('--delimitador', default=',', help="Delimitador do CSV (padrão: ',')")
+    args = parser.parse_args()
+
+    inicio, fim = datetime.date(args.ano, 1, 1), datetime.date(args.ano, 12, 31)
+    try:
+        dias_antes = calcular_dias_uteis_periodo(inicio, fim, args.calendario)
+        resumo = carregar_excecoes(args.arquivo, args.calendario, args.delimitador)
+    except (OSError, ValueError) as e:
+        parser.exit(1, f"Erro: {e}\n")
+    dias_depois = calcular_dias_uteis_periodo(inicio, fim, args.calendario)
+
+    print(f"Calendário: {descrever_calendario(args.calendario)}")
+    print(f"Exceções aplicadas: {resumo['total']} ({resumo['folgas']} folgas, {resumo['trabalhados']} trabalhados)")
+    print(f"Dias úteis em {args.ano}: {dias_antes} -> {dias_depois}")
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,123 @@
 # Importar módulos
-from calendario_utils import (
-    calcular_dias_uteis_periodo, 
-    validar_data, 
-    mostrar_feriados_periodo, 
-    obter_total_dias_periodo
-)
+import sys
+import threading
+from calendario_utils import CALENDARIO_PADRAO, analisar_periodo, obter_indice_dias_uteis, validar_data
 from calculos_operacionais import calcular_metricas_operacionais
 from interface_usuario import obter_dados_entrada, exibir_resultados, exibir_erro
 
+def executar_lote(caminho_entrada, caminho_saida, delimitador, calendario=CALENDARIO_PADRAO, jornada=None):
+    """
+    Executa o planejamento em lote (modo não interativo)
+    
+    Args:
+        caminho_entrada (str): CSV com fila, total_chamados, tma, data_inicio e data_fim
+        caminho_saida (str): CSV onde os resultados e erros serão gravados
+        delimitador (str): Delimitador de colunas
+        calendario (str): Calendário das linhas sem a coluna calendario
+        jornada (jornada_trabalho.JornadaTrabalho): Jornada de trabalho (opcional)
+    """
+    from planejamento_lote import processar_arquivo_csv
+    
+    try:
+        resumo = processar_arquivo_csv(caminho_entrada, caminho_saida, delimitador, calendario, jornada)
+    except (OSError, ValueError) as e:
+        exibir_erro(str(e))
+        return
+    
+    print("=== PLANEJAMENTO EM LOTE ===")
+    print(f"Linhas processadas: {resumo['total_linhas']}")
+    print(f"Linhas válidas: {resumo['linhas_validas']}")
+    print(f"Linhas com erro: {resumo['linhas_com_erro']}")
+    print(f"Tempo: {resumo['tempo_segundos']:.2f} s ({resumo['linhas_por_segundo']:,.0f} linhas/s)")
+    print(f"Resultados gravados em: {caminho_saida}")
+
+def executar_validacao(caminho_entrada, caminho_erros, delimitador):
+    """
+    Valida um CSV de planejamento e grava a tabela com todas as violações
+    
+    Args:
+        caminho_entrada (str): CSV com fila, total_chamados, tma, data_inicio e data_fim
+        caminho_erros (str): CSV onde os erros serão gravados
+        delimitador (str): Delimitador de colunas
+    """
+    from planejamento_lote import validar_arquivo_csv
+    
+    try:
+        resumo = validar_arquivo_csv(caminho_entrada, caminho_erros, delimitador)
+    except (OSError, ValueError) as e:
+        exibir_erro(str(e))
+        return
+    
+    print("=== VALIDAÇÃO DO ARQUIVO ===")
+    print(f"Linhas: {resumo['total_linhas']}")
+    print(f"Linhas válidas: {resumo['linhas_validas']}")
+    print(f"Linhas com erro: {resumo['linhas_com_erro']} ({resumo['total_erros']} violações)")
+    for regra, quantidade in resumo['contagem_por_regra'].items():
+        if quantidade:
+            print(f"  {regra}: {quantidade}")
+    print(f"Tempo: {resumo['tempo_segundos']:.2f} s")
+    print(f"Erros gravados em: {caminho_erros}")
+
+def ler_argumentos():
+    """
+    Lê os argumentos da linha de comando
+    
+    Returns:
+        argparse.Namespace: Argumentos informados
+    """
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Calculador de Headcount")
+    parser.add_argument('--lote', metavar='ENTRADA_CSV',
+                        help="Processa um CSV (fila, total_chamados, tma, data_inicio, data_fim) sem interação")
+    parser.add_argument('--saida', metavar='SAIDA_CSV', default='resultados_lote.csv',
+                        help="Arquivo de resultados do modo lote (padrão: resultados_lote.csv)")
+    parser.add_argument('--validar', metavar='ENTRADA_CSV',
+                        help="Apenas valida um CSV do modo lote, listando todas as violações de cada linha")
+    parser.add_argument('--erros', metavar='ERROS_CSV', default='erros_validacao.csv',
+                        help="Tabela de erros do modo --validar (padrão: erros_validacao.csv)")
+    parser.add_argument('--delimitador', default=',',
+                        help="Delimitador de colunas do CSV (padrão: ',')")
+    parser.add_argument('--calendario', default=CALENDARIO_PADRAO,
+                        help="Calendário das linhas sem a coluna calendario (sigla da UF ou código; padrão: nacional)")
+    parser.add_argument('--excecoes', metavar='ARQUIVO',
+                        help="Folgas, pontos facultativos e feriados trabalhados da empresa (CSV ou .json), "
+                             "aplicados ao calendário de --calendario")
+    parser.add_argument('--jornada', metavar='ARQUIVO_JSON',
+                        help="Jornada de trabalho (horas por dia da semana, dias parciais e períodos)")
+    return parser.parse_args()
+
 def main():
     """Função principal do programa"""
+    # argparse só é carregado quando há argumentos (modo interativo abre mais rápido)
+    jornada = None
+    if len(sys.argv) > 1:
+        args = ler_argumentos()
+        if args.excecoes:
+            from excecoes_empresa import carregar_excecoes
+            try:
+                resumo = carregar_excecoes(args.excecoes, args.calendario)
+            except (OSError, ValueError) as e:
+                exibir_erro(f"Exceções da empresa: {e}")
+                return
+            print(f"Exceções da empresa aplicadas: {resumo['total']}")
+        if args.jornada:
+            from jornada_trabalho import carregar_jornada
+            try:
+                jornada = carregar_jornada(args.jornada)
+            except (OSError, ValueError) as e:
+                exibir_erro(f"Jornada de trabalho: {e}")
+                return
+        if args.validar:
+            executar_validacao(args.validar, args.erros, args.delimitador)
+            return
+        if args.lote:
+            executar_lote(args.lote, args.saida, args.delimitador, args.calendario, jornada)
+            return
+    
+    # Carregar o calendário em segundo plano enquanto o usuário digita
+    threading.Thread(target=obter_indice_dias_uteis, daemon=True).start()
+    
     # Obter dados de entrada
     dados = obter_dados_entrada()
     if dados is None:
@@ -31,24 +139,24 @@ def main():
         exibir_erro("A data de fim deve ser posterior à data de início")
         return
 
-    # Calcular dias úteis
-    dias_uteis = calcular_dias_uteis_periodo(data_inicio, data_fim)
+    # Analisar o período (dias úteis, feriados e total de dias)
+    analise = analisar_periodo(data_inicio, data_fim, calendario=dados['calendario'])
+    dias_uteis = analise['dias_uteis']
     
-    # Calcular métricas operacionais
+    # Calcular métricas operacionais (minutos da jornada, se informada)
+    minutos = None
+    if jornada is not None:
+        minutos = jornada.minutos_disponiveis(data_inicio, data_fim, dados['calendario'])
     metricas = calcular_metricas_operacionais(
         dados['total_chamados'], 
         dados['tma'], 
-        dias_uteis
+        dias_uteis,
+        minutos
     )
 
-    # Obter feriados do período
-    feriados = mostrar_feriados_periodo(data_inicio, data_fim)
-    
-    # Obter total de dias no período
-    total_dias = obter_total_dias_periodo(data_inicio, data_fim)
-
     # Exibir resultados
-    exibir_resultados(dados, metricas, dias_uteis, feriados, total_dias, data_inicio, data_fim)
+    exibir_resultados(dados, metricas, dias_uteis, analise['feriados'], analise['total_dias'],
+                      data_inicio, data_fim)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
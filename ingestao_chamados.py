@@ -0,0 +1,378 @@
+"""
+Módulo para ingestão em fluxo de exportações de chamados
+
+Lê exportações de chamados (CSV ou JSON Lines) registro a registro, agrupa
+por fila e período (dia, semana, mês ou um período personalizado) e
+acumula apenas a contagem e a soma dos tempos de atendimento de cada grupo.
+O uso de memória depende da quantidade de grupos, não do tamanho do
+arquivo, de modo que exportações maiores que a memória podem ser lidas.
+
+Uso:
+    python ingestao_chamados.py chamados.csv --periodo mes
+    python ingestao_chamados.py chamados.jsonl --periodo personalizado --inicio 01/01/2025 --fim 31/03/2025
+"""
+
+import csv
+import datetime
+import functools
+import json
+import math
+import os
+import time
+
+from calendario_utils import CALENDARIO_PADRAO, calcular_dias_uteis_periodo, obter_total_dias_mes
+from calculos_operacionais import calcular_metricas_operacionais
+from quantis_tma import ResumoQuantis
+
+# Granularidades de período aceitas por agregar_chamados
+PERIODOS = ('dia', 'semana', 'mes', 'personalizado')
+
+# Nomes padrão dos campos na exportação
+CAMPO_FILA = 'fila'
+CAMPO_DATA = 'data_abertura'
+CAMPO_TMA = 'tma'
+
+def ler_chamados_csv(caminho, campo_fila=CAMPO_FILA, campo_data=CAMPO_DATA,
+                     campo_tma=CAMPO_TMA, delimitador=','):
+    """
+    Lê uma exportação CSV de chamados como um gerador
+
+    Args:
+        caminho (str): Caminho do CSV (com cabeçalho)
+        campo_fila (str): Coluna da fila
+        campo_data (str): Coluna da data/hora de abertura (DD/MM/AAAA ou AAAA-MM-DD, com ou sem hora)
+        campo_tma (str): Coluna do tempo de atendimento em minutos
+        delimitador (str): Delimitador de colunas
+
+    Yields:
+        tuple: (fila, texto da data, texto do tempo de atendimento)
+    """
+    with open(caminho, 'r', encoding='utf-8', newline='') as arquivo:
+        leitor = csv.reader(arquivo, delimiter=delimitador)
+        cabecalho = next(leitor, None) or []
+
+        faltando = [campo for campo in (campo_fila, campo_data, campo_tma) if campo not in cabecalho]
+        if faltando:
+            raise ValueError(f"Colunas ausentes no arquivo de chamados: {', '.join(faltando)}")
+
+        # Índices fixos das colunas: mais rápido que montar um dicionário por linha
+        posicao_fila = cabecalho.index(campo_fila)
+        posicao_data = cabecalho.index(campo_data)
+        posicao_tma = cabecalho.index(campo_tma)
+        necessario = max(posicao_fila, posicao_data, posicao_tma)
+
+        for linha in leitor:
+            if len(linha) <= necessario:
+                yield None
+                continue
+            yield linha[posicao_fila], linha[posicao_data], linha[posicao_tma]
+
+def ler_chamados_jsonl(caminho, campo_fila=CAMPO_FILA, campo_data=CAMPO_DATA, campo_tma=CAMPO_TMA):
+    """
+    Lê uma exportação JSON Lines de chamados (um objeto por linha) como um gerador
+
+    Args:
+        caminho (str): Caminho do arquivo
+        campo_fila (str): Campo da fila
+        campo_data (str): Campo da data/hora de abertura
+        campo_tma (str): Campo do tempo de atendimento em minutos
+
+    Yields:
+        tuple: (fila, texto da data, tempo de atendimento), ou None para linhas ilegíveis
+    """
+    with open(caminho, 'r', encoding='utf-8') as arquivo:
+        for linha in arquivo:
+            if not linha.strip():
+                continue
+            try:
+                registro = json.loads(linha)
+                yield registro[campo_fila], registro[campo_data], registro[campo_tma]
+            except (ValueError, KeyError, TypeError):
+                yield None
+
+def ler_chamados(caminho, **opcoes):
+    """
+    Lê uma exportação de chamados escolhendo o leitor pela extensão do arquivo
+
+    Arquivos .jsonl/.ndjson são lidos como JSON Lines; os demais como CSV.
+
+    Args:
+        caminho (str): Caminho do arquivo
+        **opcoes: Nomes dos campos (e delimitador, para CSV)
+
+    Returns:
+        generator: Registros (fila, data, tempo de atendimento)
+    """
+    extensao = os.path.splitext(caminho)[1].lower()
+    if extensao in ('.jsonl', '.ndjson'):
+        opcoes.pop('delimitador', None)
+        return ler_chamados_jsonl(caminho, **opcoes)
+    return ler_chamados_csv(caminho, **opcoes)
+
+@functools.lru_cache(maxsize=4096)
+def _converter_data(texto):
+    """
+    Converte uma data DD/MM/AAAA ou AAAA-MM-DD em datetime.date
+
+    Recebe apenas os 10 primeiros caracteres do texto (a hora, se houver,
+    é cortada por quem chama), de modo que o cache evita reconverter a
+    mesma data, que se repete em milhares de chamados com horas diferentes.
+    """
+    if texto[2:3] == '/':
+        return datetime.date(int(texto[6:10]), int(texto[3:5]), int(texto[0:2]))
+    return datetime.date(int(texto[0:4]), int(texto[5:7]), int(texto[8:10]))
+
+def limites_periodo(data, periodo):
+    """
+    Calcula o início e o fim do período que contém uma data
+
+    Args:
+        data (datetime.date): Data de referência
+        periodo (str): 'dia', 'semana' (segunda a domingo) ou 'mes'
+
+    Returns:
+        tuple: (data_inicio, data_fim)
+    """
+    if periodo == 'dia':
+        return data, data
+    if periodo == 'semana':
+        inicio = data - datetime.timedelta(days=data.weekday())
+        return inicio, inicio + datetime.timedelta(days=6)
+    if periodo == 'mes':
+        inicio = data.replace(day=1)
+        return inicio, data.replace(day=obter_total_dias_mes(data.month, data.year))
+    raise ValueError(f"Período inválido: {periodo}")
+
+def agregar_chamados(registros, periodo='mes', data_inicio=None, data_fim=None, quantis=False):
+    """
+    Agrupa chamados por fila e período em uma única passagem
+
+    Cada grupo guarda apenas [contagem, soma dos tempos de atendimento] e,
+    com quantis=True, um ResumoQuantis dos tempos (alguns KB por grupo)
+    para dimensionar por percentil. Registros ilegíveis (data ou tempo
+    inválidos, tempo negativo) são descartados e contados. No período 'personalizado', só os chamados
+    entre data_inicio e data_fim (inclusive) são considerados e cada fila
+    forma um único grupo.
+
+    Args:
+        registros (iterable): Tuplas (fila, data, tempo de atendimento), ex.: de ler_chamados
+        periodo (str): 'dia', 'semana', 'mes' ou 'personalizado'
+        data_inicio (datetime.date): Início do período personalizado
+        data_fim (datetime.date): Fim do período personalizado
+        quantis (bool): Se True, acompanha a distribuição dos tempos de cada grupo
+
+    Returns:
+        dict: grupos ({(fila, data_inicio, data_fim): [contagem, soma_tma(, resumo)]}),
+        linhas lidas e linhas descartadas
+    """
+    if periodo not in PERIODOS:
+        raise ValueError(f"Período inválido: {periodo} (use {', '.join(PERIODOS)})")
+    personalizado = periodo == 'personalizado'
+    if personalizado and (data_inicio is None or data_fim is None):
+        raise ValueError("Informe data_inicio e data_fim para o período personalizado")
+
+    grupos = {}
+    # Limites do período de cada data já vista (as datas se repetem muito)
+    periodos_por_data = {}
+    linhas = descartadas = 0
+
+    for registro in registros:
+        linhas += 1
+        try:
+            fila, texto_data, texto_tma = registro
+            if isinstance(texto_data, str):
+                texto_data = texto_data.strip()
+            # Só a data entra na chave do cache (a hora muda a cada chamado)
+            data = _converter_data(texto_data[:10])
+            tma = float(texto_tma)
+        except (TypeError, ValueError, IndexError):
+            descartadas += 1
+            continue
+        if not (tma >= 0 and math.isfinite(tma)):
+            descartadas += 1
+            continue
+
+        if personalizado:
+            if not data_inicio <= data <= data_fim:
+                continue
+            chave = (fila, data_inicio, data_fim)
+        else:
+            limites = periodos_por_data.get(data)
+            if limites is None:
+                limites = periodos_por_data[data] = limites_periodo(data, periodo)
+            chave = (fila, limites[0], limites[1])
+
+        grupo = grupos.get(chave)
+        if grupo is None:
+            grupo = grupos[chave] = [0, 0.0, ResumoQuantis()] if quantis else [0, 0.0]
+        grupo[0] += 1
+        grupo[1] += tma
+        if quantis:
+            grupo[2].adicionar(tma)
+
+    return {
+        'grupos': grupos,
+        'linhas': linhas,
+        'descartadas': descartadas
+    }
+
+def mesclar_agregacoes(agregacoes):
+    """
+    Combina agregações de arquivos ou shards diferentes sem reler os dados
+
+    Contagens e somas são adicionadas e os resumos de quantis mesclados;
+    os grupos com a mesma chave (fila, data_inicio, data_fim) se juntam.
+
+    Args:
+        agregacoes (iterable): Resultados de agregar_chamados (mesmo período)
+
+    Returns:
+        dict: Agregação combinada, no formato de agregar_chamados
+    """
+    grupos = {}
+    linhas = descartadas = 0
+    for agregacao in agregacoes:
+        linhas += agregacao['linhas']
+        descartadas += agregacao['descartadas']
+        for chave, grupo in agregacao['grupos'].items():
+            atual = grupos.get(chave)
+            if atual is None:
+                atual = grupos[chave] = [0, 0.0] + ([ResumoQuantis()] if len(grupo) > 2 else [])
+            atual[0] += grupo[0]
+            atual[1] += grupo[1]
+            if len(atual) > 2 and len(grupo) > 2:
+                atual[2].mesclar(grupo[2])
+    return {
+        'grupos': grupos,
+        'linhas': linhas,
+        'descartadas': descartadas
+    }
+
+def calcular_metricas_por_grupo(agregacao, percentil=None, calendario=CALENDARIO_PADRAO):
+    """
+    Calcula as métricas operacionais de cada grupo (fila × período)
+
+    O TMA de cada grupo é a média dos tempos de atendimento (em minutos,
+    não arredondada) ou, com percentil, o percentil estimado pelo resumo de
+    quantis (ex.: 0.9 para dimensionar pelo P90), e alimenta diretamente
+    calcular_metricas_operacionais.
+
+    Args:
+        agregacao (dict): Resultado de agregar_chamados
+        percentil (float): Quantil do TMA (0 a 1); exige agregar_chamados(quantis=True)
+        calendario (str): Código do calendário usado nos dias úteis
+
+    Returns:
+        list: Um dicionário por grupo, ordenado por fila e data de início,
+        com fila, data_inicio, data_fim, total_chamados, tma, tma_medio,
+        dias_uteis e as métricas (None quando o período não tem dias úteis)
+    """
+    resultados = []
+    for (fila, data_inicio, data_fim), grupo in sorted(
+            agregacao['grupos'].items(), key=lambda item: (str(item[0][0]), item[0][1])):
+        contagem, soma_tma = grupo[0], grupo[1]
+        tma_medio = soma_tma / contagem
+        if percentil is None:
+            tma = tma_medio
+        elif len(grupo) > 2:
+            tma = grupo[2].quantil(percentil)
+        else:
+            raise ValueError("Percentil exige agregar_chamados com quantis=True")
+        dias_uteis = calcular_dias_uteis_periodo(data_inicio, data_fim, calendario)
+        resultado = {
+            'fila': fila,
+            'data_inicio': data_inicio,
+            'data_fim': data_fim,
+            'total_chamados': contagem,
+            'tma': tma,
+            'tma_medio': tma_medio,
+            'dias_uteis': dias_uteis,
+            'metricas': None
+        }
+        if dias_uteis > 0 and tma > 0:
+            resultado['metricas'] = calcular_metricas_operacionais(contagem, tma, dias_uteis)
+        resultados.append(resultado)
+    return resultados
+
+def ingerir_arquivo(caminho, periodo='mes', data_inicio=None, data_fim=None, percentil=None,
+                    calendario=CALENDARIO_PADRAO, **opcoes):
+    """
+    Lê, agrupa e calcula as métricas de uma exportação de chamados
+
+    Args:
+        caminho (str): Caminho do CSV ou JSON Lines
+        periodo (str): 'dia', 'semana', 'mes' ou 'personalizado'
+        data_inicio (datetime.date): Início do período personalizado
+        data_fim (datetime.date): Fim do período personalizado
+        percentil (float): Dimensionar pelo percentil do TMA em vez da média (ex.: 0.9)
+        calendario (str): Código do calendário usado nos dias úteis
+        **opcoes: Nomes dos campos e delimitador (ver ler_chamados)
+
+    Returns:
+        dict: resultados (de calcular_metricas_por_grupo), linhas, descartadas,
+        tempo_segundos e linhas_por_segundo
+    """
+    inicio = time.perf_counter()
+    agregacao = agregar_chamados(ler_chamados(caminho, **opcoes), periodo, data_inicio, data_fim,
+                                 quantis=percentil is not None)
+    resultados = calcular_metricas_por_grupo(agregacao, percentil, calendario)
+    tempo = time.perf_counter() - inicio
+
+    return {
+        'resultados': resultados,
+        'linhas': agregacao['linhas'],
+        'descartadas': agregacao['descartadas'],
+        'tempo_segundos': tempo,
+        'linhas_por_segundo': agregacao['linhas'] / tempo if tempo > 0 else 0.0
+    }
+
+def main():
+    """Ingere uma exportação de chamados pela linha de comando"""
+    import argparse
+    from validacoes import validar_data_robusta
+
+    parser = argparse.ArgumentParser(description="Volume e TMA por fila e período a partir de uma exportação de chamados")
+    parser.add_argument('arquivo', help="Exportação de chamados (CSV ou .jsonl)")
+    parser.add_argument('--periodo', choices=PERIODOS, default='mes', help="Agrupamento (padrão: mes)")
+    parser.add_argument('--inicio', help="Início do período personalizado (DD/MM/AAAA)")
+    parser.add_argument('--fim', help="Fim do período personalizado (DD/MM/AAAA)")
+    parser.add_argument('--campo-fila', default=CAMPO_FILA, help="Campo da fila")
+    parser.add_argument('--campo-data', default=CAMPO_DATA, help="Campo da data de abertura")
+    parser.add_argument('--campo-tma', default=CAMPO_TMA, help="Campo do tempo de atendimento (minutos)")
+    parser.add_argument('--delimitador', default=',', help="Delimitador do CSV (padrão: ',')")
+    parser.add_argument('--percentil', type=float,
+                        help="Dimensionar pelo percentil do TMA em vez da média (ex.: 0.9 para P90)")
+    parser.add_argument('--calendario', default=CALENDARIO_PADRAO,
+                        help="Sigla da UF ou código do calendário (padrão: Brazil)")
+    args = parser.parse_args()
+    if args.percentil is not None and not 0 < args.percentil < 1:
+        parser.error("--percentil deve estar entre 0 e 1")
+
+    datas = []
+    for texto in (args.inicio, args.fim):
+        if texto is None:
+            datas.append(None)
+            continue
+        valido, mensagem, data = validar_data_robusta(texto)
+        if not valido:
+            parser.error(mensagem)
+        datas.append(data)
+
+    resumo = ingerir_arquivo(
+        args.arquivo, args.periodo, datas[0], datas[1], args.percentil, args.calendario,
+        campo_fila=args.campo_fila, campo_data=args.campo_data,
+        campo_tma=args.campo_tma, delimitador=args.delimitador
+    )
+
+    print(f"{'Fila':<20} {'Início':<10} {'Fim':<10} {'Chamados':>9} {'TMA':>8} {'Dias úteis':>10} {'Pessoas':>8}")
+    for resultado in resumo['resultados']:
+        metricas = resultado['metricas']
+        pessoas = metricas['pessoas_necessarias'] if metricas else '-'
+        print(f"{str(resultado['fila']):<20} {resultado['data_inicio'].strftime('%d/%m/%Y'):<10} "
+              f"{resultado['data_fim'].strftime('%d/%m/%Y'):<10} {resultado['total_chamados']:>9} "
+              f"{resultado['tma']:>8.2f} {resultado['dias_uteis']:>10} {pessoas:>8}")
+    print(f"\nLinhas lidas: {resumo['linhas']} | Descartadas: {resumo['descartadas']} | "
+          f"{resumo['linhas_por_segundo']:,.0f} linhas/s")
+
+if __name__ == "__main__":
+    main()
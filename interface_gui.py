@@ -5,11 +5,9 @@ Módulo para interface gráfica (GUI) usando tkinter
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import datetime
-from calendario_utils import (
-    calcular_dias_uteis_periodo, 
-    mostrar_feriados_periodo, 
-    obter_total_dias_periodo
-)
+import threading
+from calendario_utils import analisar_periodo, obter_indice_dias_uteis
+from calendarios import CALENDARIO_PADRAO, CALENDARIOS, listar_calendarios
 from calculos_operacionais import (
     calcular_metricas_operacionais, 
     calcular_percentual_dias_uteis, 
@@ -17,19 +15,50 @@ from calculos_operacionais import (
 )
 from validacoes import validar_dados_completos, obter_mensagens_ajuda
 
+# Pausa na digitação antes do recálculo automático
+ATRASO_RECALCULO_MS = 300
+
 class CalculoOperacionalGUI:
-    def __init__(self, root):
+    def __init__(self, root, aquecer_calendario=True):
         self.root = root
         self.root.title("Calculador de Headcount - V1.1")
         self.root.geometry("800x700")
         self.root.resizable(True, True)
         
+        # Cálculos rodam em segundo plano para não travar a janela
+        # (executor criado no primeiro uso, para não pesar na abertura)
+        self._executor = None
+        self.geracao_calculo = 0
+        self.cancelamento_atual = None
+        self.progresso_calculo = 0.0
+        
+        # Recalculo ao vivo: agendamento pendente e última análise de período
+        self.recalculo_agendado = None
+        self.periodo_em_cache = None
+        self.analise_em_cache = None
+        
         # Configurar estilo
         self.setup_styles()
         
         # Criar interface
         self.criar_interface()
         
+        # Carregar o calendário em segundo plano assim que a janela for desenhada
+        if aquecer_calendario:
+            self.root.after_idle(self.aquecer_calendario)
+        
+    @property
+    def executor(self):
+        """Executor (uma thread) dos cálculos em segundo plano"""
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        return self._executor
+        
+    def aquecer_calendario(self):
+        """Carrega o índice de dias úteis na thread de trabalho antes do primeiro cálculo"""
+        self.executor.submit(obter_indice_dias_uteis)
+        
     def setup_styles(self):
         """Configura estilos para a interface"""
         style = ttk.Style()
@@ -72,6 +101,9 @@ class CalculoOperacionalGUI:
         # Botões
         self.criar_botoes(main_frame)
         
+        # Progresso do cálculo
+        self.criar_barra_status(main_frame)
+        
     def criar_frame_entrada(self, parent):
         """Cria o frame de entrada de dados"""
         frame = ttk.LabelFrame(parent, text="Dados de Entrada", padding="10")
@@ -100,6 +132,28 @@ class CalculoOperacionalGUI:
         self.entry_data_fim.grid(row=3, column=1, sticky=(tk.W, tk.E), padx=(10, 0), pady=2)
         self.entry_data_fim.insert(0, "31/01/2025")
         
+        # Calendário de feriados (nacional, estadual ou municipal); aceita também a sigla da UF
+        ttk.Label(frame, text="Calendário de feriados:").grid(row=4, column=0, sticky=tk.W, pady=2)
+        self.codigos_por_rotulo = {f"{descricao} [{codigo}]": codigo for codigo, descricao in listar_calendarios()}
+        self.combo_calendario = ttk.Combobox(frame, width=30, values=list(self.codigos_por_rotulo))
+        self.combo_calendario.grid(row=4, column=1, sticky=(tk.W, tk.E), padx=(10, 0), pady=2)
+        self.combo_calendario.set(self.rotulo_calendario(CALENDARIO_PADRAO))
+        self.combo_calendario.bind('<<ComboboxSelected>>', self.agendar_recalculo)
+        
+        # Recalcular automaticamente enquanto o usuário digita
+        for entry in (self.entry_chamados, self.entry_tma, self.entry_data_inicio, self.entry_data_fim,
+                      self.combo_calendario):
+            entry.bind('<KeyRelease>', self.agendar_recalculo)
+        
+    def rotulo_calendario(self, codigo):
+        """Texto exibido no seletor para um código de calendário"""
+        return f"{CALENDARIOS[codigo][0]} [{codigo}]"
+        
+    def calendario_selecionado(self):
+        """Código do calendário escolhido (ou o texto digitado, ex.: a sigla da UF)"""
+        texto = self.combo_calendario.get().strip()
+        return self.codigos_por_rotulo.get(texto, texto)
+        
     def criar_frame_resultados(self, parent):
         """Cria o frame de resultados"""
         frame = ttk.LabelFrame(parent, text="Resultados", padding="10")
@@ -149,6 +203,10 @@ class CalculoOperacionalGUI:
         btn_calcular = ttk.Button(frame, text="Calcular", command=self.calcular)
         btn_calcular.pack(side=tk.LEFT, padx=(0, 10))
         
+        # Botão cancelar (habilitado apenas durante um cálculo)
+        self.btn_cancelar = ttk.Button(frame, text="Cancelar", command=self.cancelar, state=tk.DISABLED)
+        self.btn_cancelar.pack(side=tk.LEFT, padx=(0, 10))
+        
         # Botão limpar
         btn_limpar = ttk.Button(frame, text="Limpar", command=self.limpar)
         btn_limpar.pack(side=tk.LEFT, padx=(0, 10))
@@ -161,6 +219,18 @@ class CalculoOperacionalGUI:
         btn_sair = ttk.Button(frame, text="Sair", command=self.root.quit)
         btn_sair.pack(side=tk.LEFT)
         
+    def criar_barra_status(self, parent):
+        """Cria a barra de progresso e a mensagem de status"""
+        frame = ttk.Frame(parent)
+        frame.grid(row=6, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
+        frame.columnconfigure(1, weight=1)
+        
+        self.status = tk.StringVar()
+        ttk.Label(frame, textvariable=self.status, width=30).grid(row=0, column=0, sticky=tk.W)
+        
+        self.barra_progresso = ttk.Progressbar(frame, mode='determinate', maximum=100)
+        self.barra_progresso.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(10, 0))
+        
     def validar_entrada(self):
         """Valida os dados de entrada usando validações robustas"""
         try:
@@ -172,7 +242,8 @@ class CalculoOperacionalGUI:
             
             # Validar todos os dados de uma vez
             valido, mensagem, dados_validados = validar_dados_completos(
-                total_chamados_str, tma_str, data_inicio_str, data_fim_str
+                total_chamados_str, tma_str, data_inicio_str, data_fim_str,
+                self.calendario_selecionado()
             )
             
             if not valido:
@@ -186,54 +257,195 @@ class CalculoOperacionalGUI:
             return False, None
             
     def calcular(self):
-        """Executa os cálculos"""
+        """Executa os cálculos (botão Calcular)"""
         # Validar entrada
         valido, dados = self.validar_entrada()
         if not valido:
             return
-            
-        try:
-            # Calcular dias úteis
-            dias_uteis = calcular_dias_uteis_periodo(dados['data_inicio'], dados['data_fim'])
-            
-            # Calcular métricas operacionais
-            metricas = calcular_metricas_operacionais(
-                dados['total_chamados'],
-                dados['tma'],
-                dias_uteis
-            )
-            
-            # Calcular métricas adicionais
-            total_dias = obter_total_dias_periodo(dados['data_inicio'], dados['data_fim'])
-            percentual = calcular_percentual_dias_uteis(dias_uteis, total_dias)
-            
-            # Atualizar resultados
-            self.resultado_dias_uteis.set(f"{dias_uteis} dias")
-            self.resultado_tempo_total.set(formatar_tempo_minutos(metricas['tempo_total']))
-            self.resultado_capacidade.set(f"{metricas['capacidade_operacional']:.0f} chamados por período")
-            self.resultado_pessoas.set(f"{int(metricas['pessoas_necessarias'])} pessoas")
-            self.resultado_percentual.set(f"{percentual:.1f}%")
-            
-            # Mostrar feriados
-            self.mostrar_feriados(dados['data_inicio'], dados['data_fim'])
-            
+        
+        self.iniciar_calculo(dados, silencioso=False)
+        
+    def agendar_recalculo(self, event=None):
+        """Agenda o recálculo ao vivo, descartando o agendamento anterior (debounce)"""
+        if self.recalculo_agendado is not None:
+            self.root.after_cancel(self.recalculo_agendado)
+        self.recalculo_agendado = self.root.after(ATRASO_RECALCULO_MS, self.recalcular_ao_vivo)
+        
+    def recalcular_ao_vivo(self):
+        """Recalcula os resultados após uma pausa na digitação, sem janelas de aviso"""
+        self.recalculo_agendado = None
+        
+        valido, mensagem, dados = validar_dados_completos(
+            self.entry_chamados.get(), self.entry_tma.get(),
+            self.entry_data_inicio.get(), self.entry_data_fim.get(),
+            self.calendario_selecionado()
+        )
+        if not valido:
+            self.status.set(mensagem)
+            return
+        
+        self.iniciar_calculo(dados, silencioso=True)
+        
+    def iniciar_calculo(self, dados, silencioso):
+        """
+        Calcula os resultados, reaproveitando a análise do período quando as datas não mudaram
+        
+        Args:
+            dados (dict): Dados validados
+            silencioso (bool): True para não exibir a janela de sucesso (recálculo ao vivo)
+        """
+        # Um novo cálculo cancela o anterior; o resultado antigo será descartado
+        if self.cancelamento_atual is not None:
+            self.cancelamento_atual.set()
+            self.cancelamento_atual = None
+        self.geracao_calculo += 1
+        
+        # Mesmo período e calendário: só as métricas (baratas) precisam ser recalculadas
+        periodo = (dados['data_inicio'], dados['data_fim'], dados['calendario'])
+        if periodo == self.periodo_em_cache:
+            self.btn_cancelar.config(state=tk.DISABLED)
+            try:
+                resultado = self.calcular_metricas(dados, self.analise_em_cache)
+            except Exception as e:
+                self.mostrar_erro_calculo(e, silencioso)
+                return
+            self.barra_progresso['value'] = 100
+            self.status.set("Cálculo concluído")
+            self.exibir_resultados(resultado, atualizar_feriados=False)
+            if not silencioso:
+                messagebox.showinfo("Sucesso", "Cálculos realizados com sucesso!")
+            return
+        
+        self.cancelamento_atual = threading.Event()
+        self.progresso_calculo = 0.0
+        
+        futuro = self.executor.submit(self.executar_calculo, dados, self.cancelamento_atual)
+        
+        self.status.set("Calculando...")
+        self.barra_progresso['value'] = 0
+        self.btn_cancelar.config(state=tk.NORMAL)
+        self.root.after(50, self.verificar_calculo, futuro, self.geracao_calculo, periodo, silencioso)
+        
+    def executar_calculo(self, dados, cancelado):
+        """
+        Executa os cálculos (roda na thread de trabalho, sem acessar widgets)
+        
+        Returns:
+            dict: Análise do período, métricas e percentual, ou None se cancelado
+        """
+        def atualizar_progresso(fracao):
+            self.progresso_calculo = fracao
+        
+        # Analisar o período (dias úteis, feriados e total de dias)
+        analise = analisar_periodo(dados['data_inicio'], dados['data_fim'],
+                                   cancelado, atualizar_progresso, dados['calendario'])
+        if analise is None or cancelado.is_set():
+            return None
+        
+        return self.calcular_metricas(dados, analise)
+        
+    def calcular_metricas(self, dados, analise):
+        """
+        Calcula as métricas operacionais para uma análise de período já pronta
+        
+        Returns:
+            dict: Análise do período, métricas e percentual
+        """
+        # Calcular métricas operacionais
+        metricas = calcular_metricas_operacionais(
+            dados['total_chamados'],
+            dados['tma'],
+            analise['dias_uteis']
+        )
+        
+        # Calcular métricas adicionais
+        percentual = calcular_percentual_dias_uteis(analise['dias_uteis'], analise['total_dias'])
+        
+        return {'analise': analise, 'metricas': metricas, 'percentual': percentual}
+        
+    def verificar_calculo(self, futuro, geracao, periodo, silencioso):
+        """Acompanha o cálculo em segundo plano a partir da thread da interface"""
+        # Resultado de um cálculo substituído ou cancelado: descartar
+        if geracao != self.geracao_calculo:
+            return
+        
+        if not futuro.done():
+            self.barra_progresso['value'] = self.progresso_calculo * 100
+            self.root.after(50, self.verificar_calculo, futuro, geracao, periodo, silencioso)
+            return
+        
+        self.btn_cancelar.config(state=tk.DISABLED)
+        self.cancelamento_atual = None
+        
+        erro = futuro.exception()
+        if erro is not None:
+            self.mostrar_erro_calculo(erro, silencioso)
+            return
+        
+        resultado = futuro.result()
+        if resultado is None:
+            return
+        
+        # Guardar a análise para recálculos com o mesmo período
+        self.periodo_em_cache = periodo
+        self.analise_em_cache = resultado['analise']
+        
+        self.barra_progresso['value'] = 100
+        self.status.set("Cálculo concluído")
+        self.exibir_resultados(resultado)
+        
+        if not silencioso:
             messagebox.showinfo("Sucesso", "Cálculos realizados com sucesso!")
-            
-        except Exception as e:
-            messagebox.showerror("Erro", f"Erro durante os cálculos: {str(e)}")
-            
-    def mostrar_feriados(self, data_inicio, data_fim):
-        """Mostra os feriados no período"""
+        
+    def mostrar_erro_calculo(self, erro, silencioso):
+        """Informa um erro de cálculo (na barra de status durante o recálculo ao vivo)"""
+        self.barra_progresso['value'] = 0
+        if silencioso:
+            self.status.set(f"Erro durante os cálculos: {str(erro)}")
+        else:
+            self.status.set("")
+            messagebox.showerror("Erro", f"Erro durante os cálculos: {str(erro)}")
+        
+    def exibir_resultados(self, resultado, atualizar_feriados=True):
+        """Atualiza os campos de resultado com um cálculo concluído"""
+        analise = resultado['analise']
+        metricas = resultado['metricas']
+        
+        # Atualizar resultados
+        self.resultado_dias_uteis.set(f"{analise['dias_uteis']} dias")
+        self.resultado_tempo_total.set(formatar_tempo_minutos(metricas['tempo_total']))
+        self.resultado_capacidade.set(f"{metricas['capacidade_operacional']:.0f} chamados por período")
+        self.resultado_pessoas.set(f"{int(metricas['pessoas_necessarias'])} pessoas")
+        self.resultado_percentual.set(f"{resultado['percentual']:.1f}%")
+        
+        # Mostrar feriados (inalterados quando o período é o mesmo)
+        if atualizar_feriados:
+            self.mostrar_feriados(analise['feriados'])
+        
+    def cancelar(self):
+        """Cancela o cálculo em andamento"""
+        if self.recalculo_agendado is not None:
+            self.root.after_cancel(self.recalculo_agendado)
+            self.recalculo_agendado = None
+        if self.cancelamento_atual is not None:
+            self.cancelamento_atual.set()
+            self.cancelamento_atual = None
+        # Mudar a geração faz o resultado pendente ser descartado
+        self.geracao_calculo += 1
+        self.btn_cancelar.config(state=tk.DISABLED)
+        self.barra_progresso['value'] = 0
+        self.status.set("Cálculo cancelado")
+        
+    def mostrar_feriados(self, feriados):
+        """Mostra os feriados no período (lista de tuplas (data, nome))"""
         try:
-            feriados = mostrar_feriados_periodo(data_inicio, data_fim)
-            
             # Limpar área de texto
             self.text_feriados.delete(1.0, tk.END)
             
             if feriados:
                 self.text_feriados.insert(tk.END, f"Feriados encontrados ({len(feriados)}):\n\n")
-                for feriado in feriados:
-                    self.text_feriados.insert(tk.END, f"• {feriado.strftime('%d/%m/%Y')} ({feriado.strftime('%A')})\n")
+                for feriado, nome in feriados:
+                    self.text_feriados.insert(tk.END, f"• {feriado.strftime('%d/%m/%Y')} ({feriado.strftime('%A')}) - {nome}\n")
             else:
                 self.text_feriados.insert(tk.END, "Nenhum feriado encontrado no período.")
                 
@@ -243,12 +455,17 @@ class CalculoOperacionalGUI:
             
     def limpar(self):
         """Limpa todos os campos"""
+        # Descartar um cálculo em andamento
+        self.cancelar()
+        self.status.set("")
+        
         self.entry_chamados.delete(0, tk.END)
         self.entry_tma.delete(0, tk.END)
         self.entry_data_inicio.delete(0, tk.END)
         self.entry_data_inicio.insert(0, "01/01/2025")
         self.entry_data_fim.delete(0, tk.END)
         self.entry_data_fim.insert(0, "31/01/2025")
+        self.combo_calendario.set(self.rotulo_calendario(CALENDARIO_PADRAO))
         
         # Limpar resultados
         self.resultado_dias_uteis.set("")
@@ -278,11 +495,15 @@ class CalculoOperacionalGUI:
 📊 **Período:**
 • {periodo}
 
+🗓️ **Calendário de Feriados:**
+• {calendario}
+
 💡 **Dicas:**
 • Use apenas números nos campos numéricos
 • Datas devem estar no formato DD/MM/AAAA
 • O sistema valida automaticamente todos os campos
-• Períodos muito longos podem demorar para calcular""".format(**mensagens)
+• Os resultados são atualizados automaticamente enquanto você digita
+• O cálculo roda em segundo plano; use Cancelar para interrompê-lo""".format(**mensagens)
         
         messagebox.showinfo("Ajuda - Limites do Sistema", ajuda_texto)
 
@@ -290,7 +511,12 @@ def main():
     """Função principal para iniciar a GUI"""
     root = tk.Tk()
     app = CalculoOperacionalGUI(root)
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        app.cancelar()
+        if app._executor is not None:
+            app._executor.shutdown(wait=False)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -3,6 +3,10 @@ Inputs / Interface
 
 """
 
+from validacoes import validar_dados_completos, obter_mensagens_ajuda
+from calculos_operacionais import calcular_percentual_dias_uteis, calcular_dias_nao_uteis
+from calendarios import descrever_calendario
+
 def obter_dados_entrada():
     """
     Obtém os dados de entrada do usuário com validações robustas
@@ -11,8 +15,6 @@ def obter_dados_entrada():
         dict: Dicionário com os dados informados ou None se inválido
     """
     try:
-        from validacoes import validar_dados_completos, obter_mensagens_ajuda
-        
         # Mostrar limites
         mensagens = obter_mensagens_ajuda()
         print("📋 LIMITES DO SISTEMA:")
@@ -20,6 +22,7 @@ def obter_dados_entrada():
         print(f"• {mensagens['tma']}")
         print(f"• {mensagens['data']}")
         print(f"• {mensagens['periodo']}")
+        print(f"• Calendário: {mensagens['calendario']}")
         print()
         
         # Obter dados
@@ -29,10 +32,11 @@ def obter_dados_entrada():
         print("\nInforme o período para análise:")
         data_inicio_str = input("Data de início (DD/MM/AAAA): ")
         data_fim_str = input("Data de fim (DD/MM/AAAA): ")
+        calendario_str = input("Calendário de feriados (Enter para nacional): ")
         
         # Validar todos os dados
         valido, mensagem, dados_validados = validar_dados_completos(
-            total_chamados_str, tma_str, data_inicio_str, data_fim_str
+            total_chamados_str, tma_str, data_inicio_str, data_fim_str, calendario_str
         )
         
         if not valido:
@@ -44,12 +48,10 @@ def obter_dados_entrada():
             'total_chamados': dados_validados['total_chamados'],
             'tma': dados_validados['tma'],
             'data_inicio_str': data_inicio_str,
-            'data_fim_str': data_fim_str
+            'data_fim_str': data_fim_str,
+            'calendario': dados_validados['calendario']
         }
         
-    except ImportError:
-        print("Erro: Módulo de validações não encontrado.")
-        return None
     except Exception as e:
         print(f"Erro inesperado: {str(e)}")
         return None
@@ -62,7 +64,7 @@ def exibir_resultados(dados, metricas, dias_uteis, feriados, total_dias, data_in
         dados (dict): Dados de entrada
         metricas (dict): Métricas calculadas
         dias_uteis (int): Número de dias úteis
-        feriados (list): Lista de feriados
+        feriados (list): Lista de tuplas (data, nome) dos feriados
         total_dias (int): Total de dias no período
         data_inicio (datetime.date): Data de início
         data_fim (datetime.date): Data de fim
@@ -72,6 +74,8 @@ def exibir_resultados(dados, metricas, dias_uteis, feriados, total_dias, data_in
     print(f"Total de chamados: {dados['total_chamados']}")
     print(f"Tempo médio de atendimento: {dados['tma']} minutos")
     print(f"Período: {data_inicio.strftime('%d/%m/%Y')} a {data_fim.strftime('%d/%m/%Y')}")
+    if 'calendario' in dados:
+        print(f"Calendário: {descrever_calendario(dados['calendario'])}")
     print(f"Dias úteis no período: {dias_uteis}")
     print(f"Tempo total necessário: {metricas['tempo_total']} minutos")
     print(f"Tempo útil no período: {metricas['horas_uteis_mes']} minutos")
@@ -81,14 +85,12 @@ def exibir_resultados(dados, metricas, dias_uteis, feriados, total_dias, data_in
     # Feriados
     if feriados:
         print(f"\nFeriados no período:")
-        for feriado in feriados:
-            print(f"  - {feriado.strftime('%d/%m/%Y')} ({feriado.strftime('%A')})")
+        for feriado, nome in feriados:
+            print(f"  - {feriado.strftime('%d/%m/%Y')} ({feriado.strftime('%A')}) - {nome}")
     else:
         print(f"\nNenhum feriado no período")
     
     # Análise adicional
-    from calculos_operacionais import calcular_percentual_dias_uteis, calcular_dias_nao_uteis
-    
     dias_nao_uteis = calcular_dias_nao_uteis(total_dias, dias_uteis)
     percentual = calcular_percentual_dias_uteis(dias_uteis, total_dias)
     
@@ -0,0 +1,210 @@
+"""
+Módulo de planejamento de capacidade em janelas móveis
+
+Calcula dias úteis, minutos disponíveis e headcount de todas as janelas de
+N dias de um horizonte (deslocadas de um em um dia) em uma única passada:
+as contagens de cada janela são diferenças de somas acumuladas, de modo
+que o custo é linear no tamanho do horizonte, independentemente de N.
+
+Neste modo não há o limite de LIMITES['PERIODO_MAX_DIAS']: o horizonte e
+as janelas podem ter qualquer tamanho dentro da faixa do índice de dias
+úteis (LIMITES['ANO_MIN'] a LIMITES['ANO_MAX']).
+
+Uso:
+    python janelas_moveis.py --inicio 01/01/2025 --fim 31/12/2026 --janela 30 --chamados 5000 --tma 10
+"""
+
+import csv
+
+from calculos_operacionais import HORAS_POR_DIA, MINUTOS_POR_HORA
+from calendario_utils import CALENDARIO_PADRAO, obter_indice_dias_uteis
+
+# Colunas do resultado, na ordem de gravação
+COLUNAS_JANELAS = (
+    'data_inicio', 'data_fim', 'dias_uteis', 'minutos_disponiveis', 'total_chamados',
+    'tempo_total', 'capacidade_operacional', 'pessoas_necessarias'
+)
+
+def planejar_janelas_moveis(data_inicio, data_fim, tamanho_dias, tma, total_chamados=None,
+                            chamados_por_dia=None, calendario=CALENDARIO_PADRAO, jornada=None,
+                            passo_dias=1):
+    """
+    Calcula as métricas de todas as janelas de tamanho_dias dias do horizonte
+
+    O volume de cada janela é total_chamados (o mesmo para todas) ou a
+    soma de chamados_por_dia nos dias da janela. As métricas seguem
+    calcular_metricas_operacionais linha a linha; janelas sem minutos
+    disponíveis ficam com capacidade_operacional e pessoas_necessarias 0.
+
+    Args:
+        data_inicio (datetime.date): Início do horizonte
+        data_fim (datetime.date): Fim do horizonte (última data da última janela)
+        tamanho_dias (int): Tamanho de cada janela em dias
+        tma (int): Tempo médio de atendimento em minutos
+        total_chamados (int): Volume de chamados de cada janela
+        chamados_por_dia (array-like): Volume de cada dia do horizonte (alternativa a total_chamados)
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+        jornada (jornada_trabalho.JornadaTrabalho): Jornada para os minutos disponíveis
+            (padrão: HORAS_POR_DIA em cada dia útil)
+        passo_dias (int): Deslocamento entre janelas consecutivas
+
+    Returns:
+        dict: Um array NumPy por coluna (chaves de COLUNAS_JANELAS); as datas
+        são datetime64[D]
+
+    Raises:
+        ValueError: Se os parâmetros forem inválidos ou o horizonte estiver
+        fora da faixa do índice
+    """
+    import numpy as np
+
+    if tamanho_dias < 1 or passo_dias < 1:
+        raise ValueError("O tamanho da janela e o passo devem ser de pelo menos 1 dia")
+    if tma <= 0:
+        raise ValueError("tma deve ser maior que zero")
+    if (total_chamados is None) == (chamados_por_dia is None):
+        raise ValueError("Informe total_chamados ou chamados_por_dia")
+
+    indice = obter_indice_dias_uteis(calendario)
+    if not indice.cobre(data_inicio, data_fim):
+        raise ValueError(f"Horizonte fora da faixa do calendário ({indice.inicio.strftime('%d/%m/%Y')} "
+                         f"a {indice.fim.strftime('%d/%m/%Y')})")
+
+    total_dias = (data_fim - data_inicio).days + 1
+    janelas = total_dias - tamanho_dias + 1
+    if janelas < 1:
+        raise ValueError(f"O horizonte ({total_dias} dias) é menor que a janela ({tamanho_dias} dias)")
+
+    # Somas acumuladas restritas ao horizonte: janela k = acumulado[k + N] - acumulado[k]
+    i = data_inicio.toordinal() - indice.ordinal_inicio
+    acumulado = indice.como_arrays()[1][i:i + total_dias + 1].astype(np.int64)
+    dias_uteis = acumulado[tamanho_dias:] - acumulado[:janelas]
+
+    if jornada is None:
+        minutos = dias_uteis * (HORAS_POR_DIA * MINUTOS_POR_HORA)
+    else:
+        acumulado_minutos = jornada.tabela(calendario)[2][i:i + total_dias + 1]
+        minutos = acumulado_minutos[tamanho_dias:] - acumulado_minutos[:janelas]
+
+    if chamados_por_dia is None:
+        volumes = np.full(janelas, total_chamados, dtype=np.int64)
+    else:
+        chamados_por_dia = np.asarray(chamados_por_dia, dtype=np.int64)
+        if chamados_por_dia.shape != (total_dias,):
+            raise ValueError(f"chamados_por_dia deve ter um valor por dia do horizonte ({total_dias})")
+        acumulado_volumes = np.zeros(total_dias + 1, dtype=np.int64)
+        np.cumsum(chamados_por_dia, out=acumulado_volumes[1:])
+        volumes = acumulado_volumes[tamanho_dias:] - acumulado_volumes[:janelas]
+
+    # Mesmas operações de calcular_metricas_operacionais, sem dividir por zero
+    tempo_total = volumes * tma
+    com_minutos = minutos > 0
+    divisor = np.where(com_minutos, minutos, 1)
+    capacidade = np.where(com_minutos, minutos / tma, 0.0)
+    pessoas = np.where(com_minutos, np.trunc(tempo_total / divisor), 0).astype(np.int64)
+
+    inicios = np.datetime64(data_inicio, 'D') + np.arange(janelas)
+    resultado = {
+        'data_inicio': inicios,
+        'data_fim': inicios + (tamanho_dias - 1),
+        'dias_uteis': dias_uteis,
+        'minutos_disponiveis': minutos,
+        'total_chamados': volumes,
+        'tempo_total': tempo_total,
+        'capacidade_operacional': capacidade,
+        'pessoas_necessarias': pessoas
+    }
+    if passo_dias > 1:
+        resultado = {coluna: valores[::passo_dias] for coluna, valores in resultado.items()}
+    return resultado
+
+def resumir_janelas(resultado):
+    """
+    Resume o resultado de planejar_janelas_moveis
+
+    Args:
+        resultado (dict): Colunas retornadas por planejar_janelas_moveis
+
+    Returns:
+        dict: Dicionário com janelas, pessoas mínima/máxima/média e as
+        datas de início da janela de maior headcount
+    """
+    pessoas = resultado['pessoas_necessarias']
+    if len(pessoas) == 0:
+        return {'janelas': 0, 'pessoas_min': 0, 'pessoas_max': 0, 'pessoas_media': 0.0, 'pico': None}
+    pico = int(pessoas.argmax())
+    return {
+        'janelas': len(pessoas),
+        'pessoas_min': int(pessoas.min()),
+        'pessoas_max': int(pessoas[pico]),
+        'pessoas_media': float(pessoas.mean()),
+        'pico': resultado['data_inicio'][pico].item()
+    }
+
+def gravar_janelas_csv(resultado, caminho, delimitador=','):
+    """
+    Grava o resultado de planejar_janelas_moveis em um CSV
+
+    Args:
+        resultado (dict): Colunas retornadas por planejar_janelas_moveis
+        caminho (str): Arquivo de saída
+        delimitador (str): Delimitador de colunas
+    """
+    with open(caminho, 'w', encoding='utf-8', newline='') as arquivo:
+        escritor = csv.writer(arquivo, delimiter=delimitador)
+        escritor.writerow(COLUNAS_JANELAS)
+        colunas = [resultado[coluna].tolist() for coluna in COLUNAS_JANELAS]
+        colunas[0] = [data.strftime('%d/%m/%Y') for data in colunas[0]]
+        colunas[1] = [data.strftime('%d/%m/%Y') for data in colunas[1]]
+        colunas[6] = [f"{capacidade:.2f}" for capacidade in colunas[6]]
+        escritor.writerows(zip(*colunas))
+
+def main():
+    """Planeja as janelas móveis de um horizonte pela linha de comando"""
+    import argparse
+    import time
+    from validacoes import validar_data_robusta
+
+    parser = argparse.ArgumentParser(description="Headcount de todas as janelas móveis de N dias de um horizonte")
+    parser.add_argument('--inicio', required=True, help="Início do horizonte (DD/MM/AAAA)")
+    parser.add_argument('--fim', required=True, help="Fim do horizonte (DD/MM/AAAA)")
+    parser.add_argument('--janela', type=int, default=30, help="Tamanho de cada janela em dias (padrão: 30)")
+    parser.add_argument('--chamados', type=int, required=True, help="Volume de chamados de cada janela")
+    parser.add_argument('--tma', type=int, required=True, help="Tempo médio de atendimento em minutos")
+    parser.add_argument('--calendario', default=CALENDARIO_PADRAO,
+                        help="Sigla da UF ou código do calendário (padrão: Brazil)")
+    parser.add_argument('--jornada', metavar='ARQUIVO_JSON', help="Jornada de trabalho (ver jornada_trabalho.py)")
+    parser.add_argument('--saida', metavar='SAIDA_CSV', help="Grava todas as janelas neste CSV")
+    args = parser.parse_args()
+
+    datas = []
+    for texto in (args.inicio, args.fim):
+        valido, mensagem, data = validar_data_robusta(texto)
+        if not valido:
+            parser.error(mensagem)
+        datas.append(data)
+
+    try:
+        jornada = None
+        if args.jornada:
+            from jornada_trabalho import carregar_jornada
+            jornada = carregar_jornada(args.jornada)
+        inicio = time.perf_counter()
+        resultado = planejar_janelas_moveis(datas[0], datas[1], args.janela, args.tma, args.chamados,
+                                            calendario=args.calendario, jornada=jornada)
+        tempo = time.perf_counter() - inicio
+    except (OSError, ValueError) as e:
+        parser.exit(1, f"Erro: {e}\n")
+
+    resumo = resumir_janelas(resultado)
+    print("=== JANELAS MÓVEIS ===")
+    print(f"Janelas de {args.janela} dias: {resumo['janelas']:,} ({tempo * 1000:.1f} ms)")
+    print(f"Pessoas necessárias: mínimo {resumo['pessoas_min']}, máximo {resumo['pessoas_max']}, "
+          f"média {resumo['pessoas_media']:.1f}")
+    print(f"Janela de maior headcount começa em {resumo['pico'].strftime('%d/%m/%Y')}")
+    if args.saida:
+        gravar_janelas_csv(resultado, args.saida)
+        print(f"Resultados gravados em: {args.saida}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+"""
+Módulo de jornada de trabalho ponderada (horas por dia da semana e dias parciais)
+
+calcular_metricas_operacionais considera, por padrão, HORAS_POR_DIA horas
+em cada dia útil. JornadaTrabalho descreve jornadas diferentes:
+
+    - horas por dia da semana (ex.: meio expediente aos sábados)
+    - dias parciais, em horas (ex.: Quarta-feira de Cinzas só à tarde)
+    - jornadas específicas para períodos (ex.: horário de fim de ano)
+
+Para cada calendário é montada uma vez a contagem acumulada de minutos
+disponíveis (faixa do índice de dias úteis, LIMITES['ANO_MIN'] a
+LIMITES['ANO_MAX']), de modo que os minutos de qualquer período sejam
+obtidos com duas consultas e uma subtração.
+
+Exemplo de arquivo de jornada (JSON):
+
+    {
+        "horas_por_dia_semana": [7, 7, 7, 7, 7, 4, 0],
+        "horas_quarta_feira_cinzas": 4,
+        "dias_parciais": {"24/12/2025": 3.5},
+        "periodos": [
+            {"inicio": "15/12/2025", "fim": "31/12/2025", "horas_por_dia_semana": [6, 6, 6, 6, 6, 0, 0]}
+        ]
+    }
+"""
+
+import threading
+
+from calculos_operacionais import HORAS_POR_DIA, MINUTOS_POR_HORA, calcular_metricas_operacionais
+from calendario_utils import CALENDARIO_PADRAO, obter_indice_dias_uteis
+from calendarios import resolver_calendario
+from validacoes import validar_data_robusta
+
+# Segunda a domingo, como date.weekday()
+DIAS_SEMANA = ('segunda', 'terça', 'quarta', 'quinta', 'sexta', 'sábado', 'domingo')
+
+# Jornada padrão: HORAS_POR_DIA de segunda a sexta
+HORAS_POR_DIA_SEMANA_PADRAO = (HORAS_POR_DIA,) * 5 + (0, 0)
+
+def _converter_horas(horas, descricao):
+    """Converte horas (int ou float) em minutos inteiros, validando a faixa de um dia"""
+    try:
+        minutos = int(round(float(horas) * MINUTOS_POR_HORA))
+    except (TypeError, ValueError):
+        raise ValueError(f"{descricao}: horas inválidas: {horas}")
+    if not 0 <= minutos <= 24 * MINUTOS_POR_HORA:
+        raise ValueError(f"{descricao}: horas devem estar entre 0 e 24")
+    return minutos
+
+def _converter_semana(horas_por_dia_semana, descricao):
+    """Converte as horas de segunda a domingo em uma tupla de 7 minutos"""
+    horas_por_dia_semana = list(horas_por_dia_semana)
+    if len(horas_por_dia_semana) != 7:
+        raise ValueError(f"{descricao}: informe as horas dos 7 dias da semana (segunda a domingo)")
+    return tuple(_converter_horas(horas, f"{descricao} ({dia})")
+                 for dia, horas in zip(DIAS_SEMANA, horas_por_dia_semana))
+
+class JornadaTrabalho:
+    """
+    Jornada de trabalho com horas por dia da semana, dias parciais e períodos específicos
+
+    Regras para os minutos disponíveis de um dia, em ordem de prioridade:
+        1. dias parciais (valem inclusive sobre feriados)
+        2. feriados e folgas do calendário: 0
+        3. dias trabalhados por exceção (ver excecoes_empresa) sem horas
+           na jornada do dia da semana: horas_dia_trabalhado
+        4. horas do dia da semana (do período específico, se houver)
+
+    Com os valores padrão, os minutos de um período são iguais a
+    dias_uteis * HORAS_POR_DIA * MINUTOS_POR_HORA.
+    """
+
+    def __init__(self, horas_por_dia_semana=HORAS_POR_DIA_SEMANA_PADRAO, dias_parciais=None,
+                 periodos=None, horas_quarta_feira_cinzas=None, horas_dia_trabalhado=HORAS_POR_DIA):
+        """
+        Cria a jornada
+
+        Args:
+            horas_por_dia_semana (sequence): Horas de segunda a domingo
+            dias_parciais (dict): Horas disponíveis por data (datetime.date)
+            periodos (list): Tuplas (data_inicio, data_fim, horas_por_dia_semana), prevalecendo
+                a última em caso de sobreposição
+            horas_quarta_feira_cinzas (float): Horas na Quarta-feira de Cinzas de todos os anos
+                (ex.: 4 para expediente só à tarde); None = dia normal
+            horas_dia_trabalhado (float): Horas de um dia trabalhado por exceção cujo
+                dia da semana não tem horas na jornada
+        """
+        self.minutos_por_dia_semana = _converter_semana(horas_por_dia_semana, "Jornada")
+        self.minutos_dias_parciais = {
+            data: _converter_horas(horas, f"Dia parcial {data.strftime('%d/%m/%Y')}")
+            for data, horas in (dias_parciais or {}).items()
+        }
+        self.periodos = []
+        for data_inicio, data_fim, horas in (periodos or []):
+            if data_fim < data_inicio:
+                raise ValueError(f"Período {data_inicio.strftime('%d/%m/%Y')}: a data de fim deve "
+                                 f"ser posterior à data de início")
+            self.periodos.append((data_inicio, data_fim, _converter_semana(
+                horas, f"Período {data_inicio.strftime('%d/%m/%Y')}")))
+        self.minutos_quarta_feira_cinzas = (
+            None if horas_quarta_feira_cinzas is None
+            else _converter_horas(horas_quarta_feira_cinzas, "Quarta-feira de Cinzas")
+        )
+        self.minutos_dia_trabalhado = _converter_horas(horas_dia_trabalhado, "Dia trabalhado")
+        self._tabelas = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def de_dicionario(cls, configuracao):
+        """
+        Cria a jornada a partir de um dicionário (ex.: JSON carregado)
+
+        Datas no formato DD/MM/AAAA. Chaves aceitas: horas_por_dia_semana,
+        dias_parciais, periodos (lista de objetos com inicio, fim e
+        horas_por_dia_semana), horas_quarta_feira_cinzas e horas_dia_trabalhado.
+
+        Args:
+            configuracao (dict): Configuração da jornada
+
+        Returns:
+            JornadaTrabalho: Jornada configurada
+
+        Raises:
+            ValueError: Se alguma data ou quantidade de horas for inválida
+        """
+        def converter_data(texto, descricao):
+            valido, mensagem, data = validar_data_robusta(str(texto))
+            if not valido:
+                raise ValueError(f"{descricao}: {mensagem}")
+            return data
+
+        dias_parciais = {converter_data(texto, "Dia parcial"): horas
+                         for texto, horas in (configuracao.get('dias_parciais') or {}).items()}
+        periodos = [(converter_data(periodo.get('inicio', ''), "Início do período"),
+                     converter_data(periodo.get('fim', ''), "Fim do período"),
+                     periodo.get('horas_por_dia_semana', HORAS_POR_DIA_SEMANA_PADRAO))
+                    for periodo in (configuracao.get('periodos') or [])]
+        return cls(
+            configuracao.get('horas_por_dia_semana', HORAS_POR_DIA_SEMANA_PADRAO),
+            dias_parciais, periodos,
+            configuracao.get('horas_quarta_feira_cinzas'),
+            configuracao.get('horas_dia_trabalhado', HORAS_POR_DIA)
+        )
+
+    def _montar_tabela(self, indice):
+        """
+        Calcula os minutos de cada dia do índice e a contagem acumulada
+
+        Args:
+            indice (calendario_utils.IndiceDiasUteis): Índice do calendário
+
+        Returns:
+            tuple: (minutos por dia, acumulado com len = dias + 1), arrays int64
+        """
+        import numpy as np
+
+        dias_uteis = indice.como_arrays()[0]
+        total_dias = len(dias_uteis)
+        dia_semana = (np.arange(total_dias, dtype=np.int64) + indice.ordinal_inicio + 6) % 7
+
+        minutos = np.asarray(self.minutos_por_dia_semana, dtype=np.int64)[dia_semana]
+        for data_inicio, data_fim, minutos_semana in self.periodos:
+            i = max(data_inicio.toordinal() - indice.ordinal_inicio, 0)
+            j = min(data_fim.toordinal() - indice.ordinal_inicio + 1, total_dias)
+            if i < j:
+                minutos[i:j] = np.asarray(minutos_semana, dtype=np.int64)[dia_semana[i:j]]
+
+        # Feriados e folgas (inclusive em dias com jornada, como sábados)
+        feriados = np.asarray(indice.ordinais_feriados, dtype=np.int64) - indice.ordinal_inicio
+        feriados = feriados[(feriados >= 0) & (feriados < total_dias)]
+        minutos[feriados[dias_uteis[feriados] == 0]] = 0
+
+        # Dias trabalhados por exceção em dias sem jornada (ex.: domingo); dias úteis
+        # com 0 horas na jornada (semana de 4 dias, recesso) continuam com 0
+        trabalhados = np.asarray([ordinal for ordinal, (util, _) in indice.excecoes.items() if util],
+                                 dtype=np.int64) - indice.ordinal_inicio
+        trabalhados = trabalhados[(trabalhados >= 0) & (trabalhados < total_dias)]
+        trabalhados = trabalhados[minutos[trabalhados] == 0]
+        minutos[trabalhados] = self.minutos_dia_trabalhado
+
+        parciais = dict(self.minutos_dias_parciais)
+        if self.minutos_quarta_feira_cinzas is not None:
+            cal = indice.calendario
+            for ano in range(indice.inicio.year, indice.fim.year + 1):
+                parciais.setdefault(cal.get_ash_wednesday(ano), self.minutos_quarta_feira_cinzas)
+        for data, minutos_dia in parciais.items():
+            if indice.cobre(data, data):
+                minutos[data.toordinal() - indice.ordinal_inicio] = minutos_dia
+
+        acumulado = np.zeros(total_dias + 1, dtype=np.int64)
+        np.cumsum(minutos, out=acumulado[1:])
+        return minutos, acumulado
+
+    def tabela(self, calendario=CALENDARIO_PADRAO):
+        """
+        Minutos por dia e acumulado do calendário (montados no primeiro uso)
+
+        A tabela é remontada se o índice do calendário mudar (ex.: exceções
+        da empresa aplicadas depois).
+
+        Args:
+            calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+
+        Returns:
+            tuple: (índice de dias úteis, minutos por dia, acumulado)
+        """
+        indice = obter_indice_dias_uteis(calendario)
+        chave = resolver_calendario(calendario)
+        tabela = self._tabelas.get(chave)
+        if tabela is None or tabela[0] is not indice or tabela[1] != indice.identidade():
+            with self._lock:
+                tabela = self._tabelas.get(chave)
+                if tabela is None or tabela[0] is not indice or tabela[1] != indice.identidade():
+                    minutos, acumulado = self._montar_tabela(indice)
+                    tabela = (indice, indice.identidade(), minutos, acumulado)
+                    self._tabelas[chave] = tabela
+        return tabela[0], tabela[2], tabela[3]
+
+    def minutos_disponiveis(self, data_inicio, data_fim, calendario=CALENDARIO_PADRAO):
+        """
+        Minutos disponíveis no período (inclusive) em tempo constante
+
+        Args:
+            data_inicio (datetime.date): Data de início do período
+            data_fim (datetime.date): Data de fim do período
+            calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+
+        Returns:
+            int: Minutos de trabalho disponíveis por pessoa no período
+
+        Raises:
+            ValueError: Se o período estiver fora da faixa do índice
+        """
+        if data_fim < data_inicio:
+            return 0
+        indice, _, acumulado = self.tabela(calendario)
+        if not indice.cobre(data_inicio, data_fim):
+            raise ValueError(f"Período fora da faixa da jornada ({indice.inicio.strftime('%d/%m/%Y')} "
+                             f"a {indice.fim.strftime('%d/%m/%Y')})")
+        i = data_inicio.toordinal() - indice.ordinal_inicio
+        j = data_fim.toordinal() - indice.ordinal_inicio
+        return int(acumulado[j + 1] - acumulado[i])
+
+    def minutos_do_dia(self, data, calendario=CALENDARIO_PADRAO):
+        """
+        Minutos disponíveis em uma data
+
+        Args:
+            data (datetime.date): Data a consultar
+            calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+
+        Returns:
+            int: Minutos de trabalho disponíveis na data
+        """
+        return self.minutos_disponiveis(data, data, calendario)
+
+    def calcular_metricas(self, total_chamados, tma, data_inicio, data_fim, calendario=CALENDARIO_PADRAO):
+        """
+        Calcula as métricas operacionais do período com os minutos desta jornada
+
+        Args:
+            total_chamados (int): Total de chamados do período
+            tma (int): Tempo médio de atendimento em minutos
+            data_inicio (datetime.date): Data de início do período
+            data_fim (datetime.date): Data de fim do período
+            calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+
+        Returns:
+            dict: Métricas de calcular_metricas_operacionais
+        """
+        from calendario_utils import calcular_dias_uteis_periodo
+
+        return calcular_metricas_operacionais(
+            total_chamados, tma, calcular_dias_uteis_periodo(data_inicio, data_fim, calendario),
+            self.minutos_disponiveis(data_inicio, data_fim, calendario)
+        )
+
+def carregar_jornada(caminho):
+    """
+    Carrega uma jornada de um arquivo JSON (ver JornadaTrabalho.de_dicionario)
+
+    Args:
+        caminho (str): Caminho do arquivo JSON
+
+    Returns:
+        JornadaTrabalho: Jornada configurada
+    """
+    import json
+
+    with open(caminho, 'r', encoding='utf-8') as arquivo:
+        configuracao = json.load(arquivo)
+    if not isinstance(configuracao, dict):
+        raise ValueError("O arquivo de jornada deve conter um objeto JSON")
+    return JornadaTrabalho.de_dicionario(configuracao)
@@ -0,0 +1,225 @@
+"""
+Módulo para planejamento em lote a partir de arquivos CSV
+"""
+
+import contextlib
+import csv
+import itertools
+import time
+
+from calendario_utils import CALENDARIO_PADRAO, calcular_dias_uteis_periodo
+from calendarios import resolver_calendario
+from calculos_operacionais import calcular_metricas_operacionais
+from validacoes import REGRAS_VALIDACAO, validar_dados_completos, validar_dados_lote
+
+# Colunas esperadas no arquivo de entrada
+COLUNAS_ENTRADA = ['fila', 'total_chamados', 'tma', 'data_inicio', 'data_fim']
+
+# Coluna opcional com o código do calendário de cada linha (ex.: SP, BrazilSaoPauloCity)
+COLUNA_CALENDARIO = 'calendario'
+
+# Colunas da tabela de erros gravada por validar_arquivo_csv
+COLUNAS_ERROS = ['linha', 'campo', 'codigo', 'mensagem']
+
+# Linhas validadas de cada vez por validar_arquivo_csv
+TAMANHO_BLOCO_VALIDACAO = 100_000
+
+# Colunas gravadas no arquivo de saída
+COLUNAS_SAIDA = [
+    'linha', 'fila', 'status', 'mensagem',
+    'total_chamados', 'tma', 'data_inicio', 'data_fim', 'calendario',
+    'dias_uteis', 'tempo_total', 'horas_uteis_mes',
+    'capacidade_operacional', 'pessoas_necessarias'
+]
+
+def processar_linha(numero_linha, registro, calendario=CALENDARIO_PADRAO, jornada=None):
+    """
+    Valida e calcula as métricas de uma linha do arquivo de entrada
+
+    Args:
+        numero_linha (int): Número da linha no arquivo (para relatório de erros)
+        registro (dict): Linha lida do CSV (colunas de COLUNAS_ENTRADA e,
+            opcionalmente, COLUNA_CALENDARIO)
+        calendario (str): Calendário usado quando a linha não informa um
+        jornada (jornada_trabalho.JornadaTrabalho): Jornada usada para os minutos
+            disponíveis (padrão: HORAS_POR_DIA em cada dia útil)
+
+    Returns:
+        list: Valores da linha de saída, na ordem de COLUNAS_SAIDA
+    """
+    campos = {coluna: (registro.get(coluna) or '').strip() for coluna in COLUNAS_ENTRADA}
+    campos[COLUNA_CALENDARIO] = (registro.get(COLUNA_CALENDARIO) or '').strip() or calendario
+
+    valido, mensagem, dados = validar_dados_completos(
+        campos['total_chamados'], campos['tma'],
+        campos['data_inicio'], campos['data_fim'],
+        campos[COLUNA_CALENDARIO]
+    )
+    if not valido:
+        return [
+            numero_linha, campos['fila'], 'erro', mensagem,
+            campos['total_chamados'], campos['tma'],
+            campos['data_inicio'], campos['data_fim'], campos[COLUNA_CALENDARIO],
+            '', '', '', '', ''
+        ]
+
+    dias_uteis = calcular_dias_uteis_periodo(dados['data_inicio'], dados['data_fim'], dados['calendario'])
+    minutos = None
+    if jornada is not None:
+        minutos = jornada.minutos_disponiveis(dados['data_inicio'], dados['data_fim'], dados['calendario'])
+    if (dias_uteis if minutos is None else minutos) == 0:
+        return [
+            numero_linha, campos['fila'], 'erro', "Período sem dias úteis",
+            dados['total_chamados'], dados['tma'],
+            campos['data_inicio'], campos['data_fim'], dados['calendario'],
+            dias_uteis, '', '', '', ''
+        ]
+
+    metricas = calcular_metricas_operacionais(dados['total_chamados'], dados['tma'], dias_uteis, minutos)
+    return [
+        numero_linha, campos['fila'], 'ok', '',
+        dados['total_chamados'], dados['tma'],
+        campos['data_inicio'], campos['data_fim'], dados['calendario'],
+        dias_uteis, metricas['tempo_total'], metricas['horas_uteis_mes'],
+        f"{metricas['capacidade_operacional']:.2f}", metricas['pessoas_necessarias']
+    ]
+
+def processar_arquivo_csv(caminho_entrada, caminho_saida, delimitador=',', calendario=CALENDARIO_PADRAO,
+                          jornada=None):
+    """
+    Processa um arquivo CSV de planejamento linha a linha
+
+    As linhas são lidas, calculadas e gravadas uma a uma, de modo que o uso
+    de memória não depende do tamanho do arquivo. Linhas inválidas são
+    gravadas com status "erro" e a mensagem da validação.
+
+    Args:
+        caminho_entrada (str): Caminho do CSV de entrada (com cabeçalho)
+        caminho_saida (str): Caminho do CSV de resultados
+        delimitador (str): Delimitador de colunas dos dois arquivos
+        calendario (str): Calendário das linhas sem a coluna calendario
+        jornada (jornada_trabalho.JornadaTrabalho): Jornada de trabalho (opcional)
+
+    Returns:
+        dict: Resumo com total de linhas, linhas válidas, erros, tempo e
+        linhas por segundo
+    """
+    # Calendário padrão inválido: falhar antes de abrir os arquivos
+    calendario = resolver_calendario(calendario)
+    inicio = time.perf_counter()
+    total = validas = erros = 0
+
+    with open(caminho_entrada, 'r', encoding='utf-8', newline='') as entrada, \
+            open(caminho_saida, 'w', encoding='utf-8', newline='') as saida:
+        leitor = csv.DictReader(entrada, delimiter=delimitador)
+
+        faltando = [coluna for coluna in COLUNAS_ENTRADA if coluna not in (leitor.fieldnames or [])]
+        if faltando:
+            raise ValueError(f"Colunas ausentes no arquivo de entrada: {', '.join(faltando)}")
+
+        escritor = csv.writer(saida, delimiter=delimitador)
+        escritor.writerow(COLUNAS_SAIDA)
+
+        # Linha 1 é o cabeçalho
+        for numero_linha, registro in enumerate(leitor, start=2):
+            linha_saida = processar_linha(numero_linha, registro, calendario, jornada)
+            escritor.writerow(linha_saida)
+            total += 1
+            if linha_saida[2] == 'ok':
+                validas += 1
+            else:
+                erros += 1
+
+    tempo = time.perf_counter() - inicio
+    return {
+        'total_linhas': total,
+        'linhas_validas': validas,
+        'linhas_com_erro': erros,
+        'tempo_segundos': tempo,
+        'linhas_por_segundo': total / tempo if tempo > 0 else 0.0
+    }
+
+def _ler_blocos(leitor, posicoes, tamanho_bloco):
+    """
+    Lê as colunas de posicoes em blocos de até tamanho_bloco linhas
+
+    Args:
+        leitor (csv.reader): Leitor posicionado após o cabeçalho
+        posicoes (list): Posição de cada coluna no cabeçalho
+        tamanho_bloco (int): Máximo de linhas por bloco
+
+    Yields:
+        list: Uma lista de textos por coluna
+    """
+    while True:
+        linhas = list(itertools.islice(leitor, tamanho_bloco))
+        if not linhas:
+            return
+        # Mesmo tratamento de processar_linha (campos ausentes viram vazios)
+        yield [[linha[posicao].strip() if posicao < len(linha) else '' for linha in linhas]
+               for posicao in posicoes]
+
+def validar_arquivo_csv(caminho_entrada, caminho_erros=None, delimitador=',',
+                        tamanho_bloco=TAMANHO_BLOCO_VALIDACAO):
+    """
+    Valida todas as linhas de um CSV de planejamento, sem calcular as métricas
+
+    As colunas são validadas em blocos de tamanho_bloco linhas
+    (validacoes.validar_dados_lote), de modo que o uso de memória não
+    depende do tamanho do arquivo, e todas as violações de cada linha são
+    reportadas, não só a primeira.
+
+    Args:
+        caminho_entrada (str): Caminho do CSV de entrada (com cabeçalho)
+        caminho_erros (str): CSV onde a tabela de erros será gravada (opcional)
+        delimitador (str): Delimitador de colunas dos dois arquivos
+        tamanho_bloco (int): Linhas validadas de cada vez
+
+    Returns:
+        dict: Resumo com total de linhas, linhas válidas, linhas com erro,
+        total de erros, contagem por regra e tempo
+    """
+    inicio = time.perf_counter()
+    total = validas = total_erros = 0
+    contagem_por_regra = dict.fromkeys(REGRAS_VALIDACAO, 0)
+
+    with open(caminho_entrada, 'r', encoding='utf-8', newline='') as entrada:
+        leitor = csv.reader(entrada, delimiter=delimitador)
+        cabecalho = next(leitor, None) or []
+        faltando = [coluna for coluna in COLUNAS_ENTRADA if coluna not in cabecalho]
+        if faltando:
+            raise ValueError(f"Colunas ausentes no arquivo de entrada: {', '.join(faltando)}")
+
+        nomes = COLUNAS_ENTRADA[1:] + ([COLUNA_CALENDARIO] if COLUNA_CALENDARIO in cabecalho else [])
+        posicoes = [cabecalho.index(nome) for nome in nomes]
+
+        with (open(caminho_erros, 'w', encoding='utf-8', newline='') if caminho_erros is not None
+              else contextlib.nullcontext()) as saida:
+            escritor = None
+            if saida is not None:
+                escritor = csv.writer(saida, delimiter=delimitador)
+                escritor.writerow(COLUNAS_ERROS)
+
+            for colunas in _ler_blocos(leitor, posicoes, tamanho_bloco):
+                resultado = validar_dados_lote(*colunas)
+                erros = resultado['erros']
+                # Linha 1 é o cabeçalho
+                linhas_arquivo = erros['indice'] + (total + 2)
+                if escritor is not None:
+                    escritor.writerows(zip(linhas_arquivo.tolist(), erros['campo'], erros['codigo'],
+                                           erros['mensagem']))
+
+                total += len(resultado['validas'])
+                validas += int(resultado['validas'].sum())
+                total_erros += len(linhas_arquivo)
+                for regra, quantidade in resultado['contagem_por_regra'].items():
+                    contagem_por_regra[regra] += quantidade
+
+    return {
+        'total_linhas': total,
+        'linhas_validas': validas,
+        'linhas_com_erro': total - validas,
+        'total_erros': total_erros,
+        'contagem_por_regra': contagem_por_regra,
+        'tempo_segundos': time.perf_counter() - inicio
+    }
@@ -0,0 +1,274 @@
+"""
+Módulo para percentis de TMA com um resumo de quantis mesclável (t-digest)
+
+A média do tempo de atendimento esconde a cauda longa que provoca os
+erros de dimensionamento. O ResumoQuantis acompanha a distribuição dos
+tempos de atendimento em fluxo, com memória limitada (alguns KB por fila),
+e permite dimensionar pelo P80/P90. Resumos de filas, arquivos ou períodos
+diferentes podem ser mesclados sem reler os dados brutos.
+
+O algoritmo é o t-digest com mesclagem (Dunning): os valores são agrupados
+em centróides (média, peso) cujo tamanho máximo é limitado pela função de
+escala k(q) = δ/2π · asen(2q - 1), que mantém centróides pequenos nas
+caudas, onde estão os percentis que interessam.
+"""
+
+import math
+import struct
+from array import array
+from itertools import chain
+
+# Compressão padrão (δ): no máximo cerca de δ centróides, ~1,6 KB serializado
+COMPRESSAO_PADRAO = 100
+
+# Cabeçalho da serialização: assinatura, compressão, mínimo, máximo, quantidade de centróides
+_FORMATO_CABECALHO = '<4sdddI'
+_ASSINATURA = b'TDG1'
+
+class ResumoQuantis:
+    """
+    Resumo de quantis mesclável (t-digest) dos tempos de atendimento
+
+    Attributes:
+        compressao (float): Parâmetro δ; maior = mais preciso e maior
+        minimo (float): Menor valor adicionado
+        maximo (float): Maior valor adicionado
+    """
+
+    __slots__ = ('compressao', 'minimo', 'maximo', '_medias', '_pesos', '_peso_centroides',
+                 '_buffer_valores', '_buffer_pesos', '_peso_buffer', '_tamanho_buffer')
+
+    def __init__(self, compressao=COMPRESSAO_PADRAO):
+        if compressao < 10:
+            raise ValueError("compressao deve ser pelo menos 10")
+        self.compressao = float(compressao)
+        self.minimo = math.inf
+        self.maximo = -math.inf
+        # Centróides e buffer em arrays de float (8 bytes por valor, sem objetos Python)
+        self._medias = array('d')
+        self._pesos = array('d')
+        self._peso_centroides = 0.0
+        self._buffer_valores = array('d')
+        self._buffer_pesos = array('d')
+        self._peso_buffer = 0.0
+        self._tamanho_buffer = int(compressao)
+
+    @property
+    def peso_total(self):
+        """Peso total (quantidade de valores, se todos têm peso 1)"""
+        return self._peso_centroides + self._peso_buffer
+
+    def __len__(self):
+        self._compactar()
+        return len(self._medias)
+
+    def adicionar(self, valor, peso=1.0):
+        """
+        Adiciona um valor ao resumo
+
+        Args:
+            valor (float): Tempo de atendimento
+            peso (float): Peso do valor (padrão: 1)
+        """
+        if valor != valor:
+            raise ValueError("Valor inválido (NaN)")
+        if peso <= 0:
+            return
+        if valor < self.minimo:
+            self.minimo = valor
+        if valor > self.maximo:
+            self.maximo = valor
+        self._buffer_valores.append(valor)
+        self._buffer_pesos.append(peso)
+        self._peso_buffer += peso
+        if len(self._buffer_valores) >= self._tamanho_buffer:
+            self._compactar()
+
+    def adicionar_lote(self, valores):
+        """
+        Adiciona vários valores de peso 1
+
+        Args:
+            valores (iterable): Tempos de atendimento
+        """
+        for valor in valores:
+            self.adicionar(valor)
+
+    def mesclar(self, outro):
+        """
+        Incorpora outro resumo a este (ex.: shards ou períodos diferentes)
+
+        Args:
+            outro (ResumoQuantis): Resumo a mesclar (não é alterado)
+
+        Returns:
+            ResumoQuantis: Este resumo, para encadeamento
+        """
+        outro._compactar()
+        if not outro._medias:
+            return self
+        self.minimo = min(self.minimo, outro.minimo)
+        self.maximo = max(self.maximo, outro.maximo)
+        self._buffer_valores.extend(outro._medias)
+        self._buffer_pesos.extend(outro._pesos)
+        self._peso_buffer += outro._peso_centroides
+        self._compactar()
+        return self
+
+    def _limite_peso(self, acumulado, total):
+        """Peso acumulado máximo do centróide que começa em acumulado (função de escala k1)"""
+        escala = self.compressao / (2 * math.pi)
+        k = escala * math.asin(2 * acumulado / total - 1) + 1
+        if k >= escala * math.pi / 2:
+            return total
+        return total * (math.sin(k / escala) + 1) / 2
+
+    def _compactar(self):
+        """Mescla o buffer com os centróides existentes em uma passagem ordenada"""
+        if not self._buffer_valores:
+            return
+
+        pontos = sorted(zip(chain(self._buffer_valores, self._medias), chain(self._buffer_pesos, self._pesos)))
+        total = self._peso_centroides + self._peso_buffer
+
+        medias = array('d')
+        pesos = array('d')
+        media, peso = pontos[0]
+        acumulado = 0.0
+        limite = self._limite_peso(0.0, total)
+
+        for valor, peso_valor in pontos[1:]:
+            if acumulado + peso + peso_valor <= limite:
+                # Média ponderada incremental
+                peso += peso_valor
+                media += (valor - media) * peso_valor / peso
+            else:
+                medias.append(media)
+                pesos.append(peso)
+                acumulado += peso
+                limite = self._limite_peso(acumulado, total)
+                media, peso = valor, peso_valor
+        medias.append(media)
+        pesos.append(peso)
+
+        self._medias = medias
+        self._pesos = pesos
+        self._peso_centroides = total
+        self._buffer_valores = array('d')
+        self._buffer_pesos = array('d')
+        self._peso_buffer = 0.0
+
+    def quantil(self, q):
+        """
+        Estima o quantil q da distribuição
+
+        Args:
+            q (float): Quantil entre 0 e 1 (ex.: 0.9 para o P90)
+
+        Returns:
+            float: Valor estimado
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q deve estar entre 0 e 1")
+        self._compactar()
+        if not self._medias:
+            raise ValueError("Resumo vazio")
+        if q == 0:
+            return self.minimo
+        if q == 1:
+            return self.maximo
+
+        medias = self._medias
+        pesos = self._pesos
+        alvo = q * self._peso_centroides
+
+        # Antes do centro do primeiro centróide ou depois do centro do último: interpolar com os extremos
+        if alvo <= pesos[0] / 2:
+            return self.minimo + (medias[0] - self.minimo) * alvo / (pesos[0] / 2)
+        if alvo >= self._peso_centroides - pesos[-1] / 2:
+            restante = self._peso_centroides - alvo
+            return self.maximo - (self.maximo - medias[-1]) * restante / (pesos[-1] / 2)
+
+        # Interpolação linear entre os centros de dois centróides vizinhos
+        acumulado = pesos[0] / 2
+        for i in range(len(medias) - 1):
+            passo = (pesos[i] + pesos[i + 1]) / 2
+            if alvo <= acumulado + passo:
+                return medias[i] + (medias[i + 1] - medias[i]) * (alvo - acumulado) / passo
+            acumulado += passo
+        return medias[-1]
+
+    def quantis(self, qs):
+        """
+        Estima vários quantis
+
+        Args:
+            qs (iterable): Quantis entre 0 e 1
+
+        Returns:
+            dict: {q: valor}
+        """
+        return {q: self.quantil(q) for q in qs}
+
+    def media(self):
+        """Média exata dos valores adicionados"""
+        self._compactar()
+        if not self._medias:
+            raise ValueError("Resumo vazio")
+        return sum(m * p for m, p in zip(self._medias, self._pesos)) / self._peso_centroides
+
+    def serializar(self):
+        """
+        Serializa o resumo em bytes (para gravar ou enviar entre processos)
+
+        Returns:
+            bytes: Representação compacta (16 bytes por centróide + cabeçalho)
+        """
+        self._compactar()
+        return (struct.pack(_FORMATO_CABECALHO, _ASSINATURA, self.compressao,
+                            self.minimo, self.maximo, len(self._medias))
+                + self._medias.tobytes()
+                + self._pesos.tobytes())
+
+    @classmethod
+    def desserializar(cls, dados):
+        """
+        Reconstrói um resumo serializado com serializar()
+
+        Args:
+            dados (bytes): Bytes do resumo
+
+        Returns:
+            ResumoQuantis: Resumo reconstruído
+        """
+        try:
+            assinatura, compressao, minimo, maximo, quantidade = struct.unpack_from(_FORMATO_CABECALHO, dados)
+        except struct.error:
+            raise ValueError("Resumo de quantis inválido")
+        inicio = struct.calcsize(_FORMATO_CABECALHO)
+        if assinatura != _ASSINATURA or len(dados) != inicio + 16 * quantidade:
+            raise ValueError("Resumo de quantis inválido")
+
+        resumo = cls(compressao)
+        resumo.minimo = minimo
+        resumo.maximo = maximo
+        resumo._medias = array('d', dados[inicio:inicio + 8 * quantidade])
+        resumo._pesos = array('d', dados[inicio + 8 * quantidade:])
+        resumo._peso_centroides = math.fsum(resumo._pesos)
+        return resumo
+
+def mesclar_resumos(resumos, compressao=COMPRESSAO_PADRAO):
+    """
+    Mescla vários resumos em um novo resumo
+
+    Args:
+        resumos (iterable): Resumos a mesclar
+        compressao (float): Compressão do resumo resultante
+
+    Returns:
+        ResumoQuantis: Resumo combinado
+    """
+    combinado = ResumoQuantis(compressao)
+    for resumo in resumos:
+        combinado.mesclar(resumo)
+    return combinado
@@ -0,0 +1,112 @@
+"""
+Relatório de tempo de inicialização baseado em python -X importtime
+
+Uso:
+    python relatorio_inicializacao.py
+    python relatorio_inicializacao.py --modulos index --top 20
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+# Orçamento de importação a frio por ponto de entrada, em milissegundos
+ORCAMENTO_MS = {
+    'index': 60,
+    'interface_gui': 120
+}
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+
+# Linha do -X importtime: "import time:  self [us] | cumulative | nome"
+_LINHA_IMPORTTIME = re.compile(r'^import time:\s+(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)')
+
+def medir_importacao(modulo):
+    """
+    Importa um módulo em um novo interpretador com -X importtime
+
+    Args:
+        modulo (str): Nome do módulo
+
+    Returns:
+        list: Tuplas (nome, próprio_us, acumulado_us, nível) na ordem de conclusão
+    """
+    saida = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {modulo}'],
+        cwd=DIRETORIO, capture_output=True, text=True, check=True
+    )
+    registros = []
+    for linha in saida.stderr.splitlines():
+        correspondencia = _LINHA_IMPORTTIME.match(linha)
+        if correspondencia:
+            proprio, acumulado, recuo, nome = correspondencia.groups()
+            registros.append((nome, int(proprio), int(acumulado), (len(recuo) - 1) // 2))
+    return registros
+
+def gerar_relatorio(modulo, repeticoes=3):
+    """
+    Gera o relatório de inicialização de um ponto de entrada
+
+    A importação é repetida e a execução mais rápida é usada, para reduzir
+    o ruído do sistema.
+
+    Args:
+        modulo (str): Nome do módulo
+        repeticoes (int): Quantidade de execuções
+
+    Returns:
+        dict: Total em ms, orçamento em ms e registros da execução mais rápida
+    """
+    melhor = None
+    for _ in range(repeticoes):
+        registros = medir_importacao(modulo)
+        total = next(acumulado for nome, _, acumulado, nivel in reversed(registros)
+                     if nome == modulo and nivel == 0)
+        if melhor is None or total < melhor[0]:
+            melhor = (total, registros)
+
+    return {
+        'modulo': modulo,
+        'total_ms': melhor[0] / 1000,
+        'orcamento_ms': ORCAMENTO_MS.get(modulo),
+        'registros': melhor[1]
+    }
+
+def exibir_relatorio(relatorio, top=15):
+    """
+    Exibe o relatório de inicialização
+
+    Returns:
+        bool: True se o ponto de entrada está dentro do orçamento
+    """
+    print(f"=== INICIALIZAÇÃO: {relatorio['modulo']} ===")
+    orcamento = relatorio['orcamento_ms']
+    dentro = orcamento is None or relatorio['total_ms'] <= orcamento
+    texto_orcamento = f" (orçamento: {orcamento} ms)" if orcamento is not None else ""
+    print(f"Total: {relatorio['total_ms']:.1f} ms{texto_orcamento}{'' if dentro else '  ACIMA DO ORÇAMENTO'}")
+
+    print(f"{'Módulo':<45} {'Próprio':>10} {'Acumulado':>11}")
+    mais_lentos = sorted(relatorio['registros'], key=lambda registro: registro[2], reverse=True)
+    for nome, proprio, acumulado, nivel in mais_lentos[:top]:
+        print(f"{'  ' * nivel + nome:<45} {proprio / 1000:>8.1f}ms {acumulado / 1000:>9.1f}ms")
+    print()
+    return dentro
+
+def main():
+    """Exibe o relatório de inicialização dos pontos de entrada"""
+    parser = argparse.ArgumentParser(description="Relatório de tempo de inicialização (-X importtime)")
+    parser.add_argument('--modulos', nargs='+', default=list(ORCAMENTO_MS),
+                        help="Módulos a medir (padrão: index e interface_gui)")
+    parser.add_argument('--top', type=int, default=15, help="Quantidade de módulos listados")
+    args = parser.parse_args()
+
+    dentro_do_orcamento = True
+    for modulo in args.modulos:
+        dentro_do_orcamento &= exibir_relatorio(gerar_relatorio(modulo), args.top)
+
+    sys.exit(0 if dentro_do_orcamento else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,433 @@
+"""
+Módulo de simulação de eventos discretos da fila de atendimento
+
+Valida um headcount (calcular_metricas_operacionais) ou uma escala por
+intervalo (dimensionamento_erlang) simulando chamada a chamada: espera,
+abandono e ocupação dos agentes.
+
+A simulação corre no eixo do tempo útil de calendario_utils: apenas o
+expediente dos dias úteis do período existe (HORAS_POR_DIA horas a partir
+de HORA_INICIO_EXPEDIENTE). Chegadas fora do expediente entram na fila na
+abertura seguinte, e a fila que sobra no fim do dia continua no dia útil
+seguinte. Depois do fim do período não há agentes: as chamadas que ainda
+estiverem na fila são contadas como abandonadas (com paciência) ou não
+atendidas.
+
+Para suportar dezenas de milhões de eventos por execução, os dados das
+chamadas ficam em arrays pré-alocados (convertidos em listas em blocos),
+os atendimentos em curso são um heap de instantes de término (float) e a
+fila guarda apenas o índice da chamada; nenhum objeto é criado por
+evento. O abandono é avaliado quando a chamada chegaria ao atendimento
+(fila FIFO), sem eventos próprios no heap.
+
+Unidades: TMA em minutos (como no restante do sistema); espera, paciência
+e tempo alvo em segundos.
+
+Uso:
+    python simulacao_fila.py --inicio 01/12/2025 --fim 31/12/2025 --chamados 60000 --tma 6 --paciencia 120
+"""
+
+import heapq
+import math
+import time
+from collections import deque
+
+import numpy as np
+
+from calculos_operacionais import HORAS_POR_DIA, MINUTOS_POR_HORA, calcular_metricas_operacionais
+from calendario_utils import (
+    CALENDARIO_PADRAO,
+    HORA_INICIO_EXPEDIENTE,
+    calcular_dias_uteis_periodo,
+    calcular_minutos_uteis_lote
+)
+
+# Chamadas convertidas em listas Python por vez no laço de eventos
+TAMANHO_BLOCO = 1000000
+
+def segundos_uteis_chegadas(momentos, data_inicio, hora_inicio_expediente=HORA_INICIO_EXPEDIENTE,
+                            calendario=CALENDARIO_PADRAO):
+    """
+    Converte momentos de chegada em segundos úteis desde o início do período
+
+    Args:
+        momentos (array-like): Momentos de chegada (datetime64, datetime.datetime ou strings ISO)
+        data_inicio (datetime.date): Início do período
+        hora_inicio_expediente (int): Hora de início do expediente
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+
+    Returns:
+        numpy.ndarray: Segundos úteis de cada chegada (float64)
+    """
+    origem = np.datetime64(data_inicio, 's')
+    return calcular_minutos_uteis_lote(origem, momentos, hora_inicio_expediente, calendario) * 60
+
+def gerar_chegadas(chamadas_por_intervalo, duracao_intervalo=30, gerador=None):
+    """
+    Sorteia chegadas de Poisson a partir do volume esperado de cada intervalo
+
+    Args:
+        chamadas_por_intervalo (array-like): Chamadas esperadas em cada intervalo
+            do tempo útil do período, em ordem (ex.: dias úteis × intervalos do dia)
+        duracao_intervalo (int): Duração do intervalo em minutos
+        gerador (numpy.random.Generator): Gerador de números aleatórios
+
+    Returns:
+        numpy.ndarray: Instantes de chegada em segundos úteis, ordenados
+    """
+    gerador = gerador or np.random.default_rng()
+    taxas = np.asarray(chamadas_por_intervalo, dtype=np.float64).ravel()
+    contagens = gerador.poisson(taxas)
+    duracao = duracao_intervalo * 60.0
+    # Instantes uniformes dentro de cada intervalo; a ordenação por intervalo vem do repeat
+    chegadas = np.repeat(np.arange(taxas.size) * duracao, contagens)
+    chegadas += gerador.random(chegadas.size) * duracao
+    chegadas.sort()
+    return chegadas
+
+def _simular(chegadas, duracoes, prazos, limites, agentes_por_trecho, tamanho_bloco):
+    """
+    Laço de eventos: chegadas (em ordem), términos de atendimento (heap) e
+    mudanças de escala (limites), com fila FIFO e abandono avaliado na saída da fila
+
+    Args:
+        chegadas (numpy.ndarray): Instantes de chegada, ordenados (segundos)
+        duracoes (numpy.ndarray): Tempo de atendimento de cada chamada (segundos)
+        prazos (numpy.ndarray): Instante de abandono de cada chamada (inf = não abandona)
+        limites (list): Instantes em que a escala muda, crescentes
+        agentes_por_trecho (list): Agentes antes do primeiro limite e após cada limite
+        tamanho_bloco (int): Chamadas convertidas em listas por vez
+
+    Returns:
+        tuple: (espera, abandonou, atendimentos); espera é NaN para as não atendidas
+    """
+    total = chegadas.size
+    espera = np.full(total, np.nan)
+    abandonou = np.zeros(total, dtype=np.bool_)
+    heappush, heappop = heapq.heappush, heapq.heappop
+    infinito = math.inf
+
+    ocupados = []
+    fila = deque()
+    trecho = 0
+    agentes = agentes_por_trecho[0]
+    proximo_limite = limites[0] if limites else infinito
+    atendimentos = 0
+
+    # Dados do bloco atual; chamadas de blocos anteriores ainda na fila usam os arrays
+    base = 0
+    bloco_chegadas = bloco_duracoes = bloco_prazos = []
+    bloco_espera = []
+    bloco_abandonou = bytearray()
+
+    def atender(momento):
+        """Tira chamadas da fila enquanto houver agente livre em momento"""
+        nonlocal atendimentos
+        while fila and len(ocupados) < agentes:
+            j = fila.popleft()
+            if j >= base:
+                k = j - base
+                if bloco_prazos[k] <= momento:
+                    bloco_espera[k] = bloco_prazos[k] - bloco_chegadas[k]
+                    bloco_abandonou[k] = 1
+                    continue
+                bloco_espera[k] = momento - bloco_chegadas[k]
+                heappush(ocupados, momento + bloco_duracoes[k])
+            else:
+                prazo, chegada = float(prazos[j]), float(chegadas[j])
+                if prazo <= momento:
+                    espera[j] = prazo - chegada
+                    abandonou[j] = True
+                    continue
+                espera[j] = momento - chegada
+                heappush(ocupados, momento + float(duracoes[j]))
+            atendimentos += 1
+
+    def avancar(ate):
+        """Processa términos e mudanças de escala até o instante ate"""
+        nonlocal trecho, agentes, proximo_limite
+        while True:
+            proximo_termino = ocupados[0] if ocupados else infinito
+            if proximo_termino <= proximo_limite:
+                if proximo_termino > ate:
+                    return
+                heappop(ocupados)
+                momento = proximo_termino
+            else:
+                if proximo_limite > ate:
+                    return
+                momento = proximo_limite
+                trecho += 1
+                agentes = agentes_por_trecho[trecho]
+                proximo_limite = limites[trecho] if trecho < len(limites) else infinito
+            if fila:
+                atender(momento)
+
+    for base in range(0, total, tamanho_bloco):
+        fim = min(base + tamanho_bloco, total)
+        bloco_chegadas = chegadas[base:fim].tolist()
+        bloco_duracoes = duracoes[base:fim].tolist()
+        bloco_prazos = prazos[base:fim].tolist()
+        bloco_espera = [infinito] * (fim - base)
+        bloco_abandonou = bytearray(fim - base)
+
+        for k, chegada in enumerate(bloco_chegadas):
+            # Caminho rápido: nenhum evento pendente antes desta chegada
+            if (ocupados and ocupados[0] <= chegada) or proximo_limite <= chegada:
+                avancar(chegada)
+            if not fila and len(ocupados) < agentes:
+                bloco_espera[k] = 0.0
+                heappush(ocupados, chegada + bloco_duracoes[k])
+                atendimentos += 1
+            else:
+                fila.append(base + k)
+
+        # Chamadas ainda na fila ficam com inf no bloco e são gravadas direto nos arrays
+        resultado = np.array(bloco_espera)
+        resultado[resultado == infinito] = np.nan
+        espera[base:fim] = resultado
+        abandonou[base:fim] = np.frombuffer(bloco_abandonou, dtype=np.bool_)
+    base = total
+
+    # Esvaziar a fila com os agentes restantes da escala
+    while fila and (ocupados or proximo_limite < infinito):
+        avancar(min(ocupados[0] if ocupados else infinito, proximo_limite))
+
+    # Sem agentes até o fim: quem tem paciência abandona; os demais não são atendidos
+    for j in fila:
+        if prazos[j] < infinito:
+            espera[j] = prazos[j] - chegadas[j]
+            abandonou[j] = True
+    return espera, abandonou, atendimentos
+
+def simular_fila(data_inicio, data_fim, agentes, tma, chegadas=None, chamadas_por_intervalo=None,
+                 duracoes=None, paciencia_media=None, duracao_intervalo=30, tempo_alvo=20,
+                 semente=None, calendario=CALENDARIO_PADRAO, hora_inicio_expediente=HORA_INICIO_EXPEDIENTE,
+                 tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Simula a fila de atendimento do período com uma escala de agentes
+
+    Args:
+        data_inicio (datetime.date): Data de início do período
+        data_fim (datetime.date): Data de fim do período
+        agentes (int ou array-like): Headcount fixo (ex.: pessoas_necessarias de
+            calcular_metricas_operacionais) ou agentes por intervalo do tempo útil,
+            com formato (dias úteis, intervalos do dia) ou achatado
+        tma (float): Tempo médio de atendimento em minutos (tempos exponenciais)
+        chegadas (array-like): Momentos de chegada (datetime64, datetime.datetime ou strings ISO)
+        chamadas_por_intervalo (array-like): Alternativa a chegadas: chamadas esperadas por
+            intervalo, no formato da escala por intervalo (chegadas de Poisson)
+        duracoes (array-like): Tempo de atendimento de cada chamada em minutos (substitui
+            o sorteio pelo tma)
+        paciencia_media (float): Paciência média em segundos (exponencial); None = sem abandono
+        duracao_intervalo (int): Duração do intervalo em minutos
+        tempo_alvo (float): Tempo alvo do nível de serviço em segundos
+        semente (int): Semente para resultados reproduzíveis
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+        hora_inicio_expediente (int): Hora de início do expediente
+        tamanho_bloco (int): Chamadas convertidas em listas por vez no laço de eventos
+
+    Returns:
+        dict: Dicionário com chamadas, atendidas, abandonadas, nao_atendidas,
+        taxa_abandono, nivel_servico (atendidas em até tempo_alvo / chamadas),
+        asa e espera_p90 (segundos, das atendidas), ocupacao, por_intervalo
+        (arrays chamadas, abandonadas, asa e agentes), espera e abandonou (por
+        chamada), eventos, tempo_segundos e eventos_por_segundo
+
+    Raises:
+        ValueError: Se os parâmetros forem inválidos ou houver chegadas fora do período
+    """
+    if (chegadas is None) == (chamadas_por_intervalo is None):
+        raise ValueError("Informe chegadas ou chamadas_por_intervalo")
+    if tma <= 0 or duracao_intervalo <= 0:
+        raise ValueError("tma e duracao_intervalo devem ser maiores que zero")
+
+    jornada = HORAS_POR_DIA * MINUTOS_POR_HORA
+    if jornada % duracao_intervalo:
+        raise ValueError(f"duracao_intervalo deve dividir a jornada de {jornada} minutos")
+    dias_uteis = calcular_dias_uteis_periodo(data_inicio, data_fim, calendario)
+    intervalos = dias_uteis * (jornada // duracao_intervalo)
+    if intervalos == 0:
+        raise ValueError("Período sem dias úteis")
+    horizonte = intervalos * duracao_intervalo * 60.0
+
+    escala = np.asarray(agentes, dtype=np.int64)
+    if escala.ndim == 0:
+        escala = np.full(intervalos, int(escala), dtype=np.int64)
+    escala = escala.ravel()
+    if escala.size != intervalos or escala.min() < 0:
+        raise ValueError(f"A escala deve ter {intervalos} intervalos ({dias_uteis} dias úteis) "
+                         f"com agentes não negativos")
+
+    gerador = np.random.default_rng(semente)
+    if chegadas is None:
+        taxas = np.asarray(chamadas_por_intervalo, dtype=np.float64)
+        if taxas.size != intervalos:
+            raise ValueError(f"chamadas_por_intervalo deve ter {intervalos} intervalos")
+        instantes = gerar_chegadas(taxas, duracao_intervalo, gerador)
+    else:
+        instantes = segundos_uteis_chegadas(chegadas, data_inicio, hora_inicio_expediente, calendario)
+        ordem = np.argsort(instantes, kind='stable')
+        instantes = instantes[ordem]
+        if instantes.size and (instantes[0] < 0 or instantes[-1] >= horizonte):
+            raise ValueError("Há chegadas fora do expediente do período")
+
+    total = instantes.size
+    if duracoes is None:
+        tempos = gerador.exponential(tma * 60.0, total)
+    else:
+        tempos = np.asarray(duracoes, dtype=np.float64) * 60.0
+        if tempos.shape != (total,):
+            raise ValueError("duracoes deve ter um valor por chegada")
+        if chegadas is not None:
+            tempos = tempos[ordem]
+    if paciencia_media is None:
+        prazos = np.full(total, np.inf)
+    else:
+        prazos = instantes + gerador.exponential(paciencia_media, total)
+
+    # Trechos de escala constante (intervalos consecutivos iguais são fundidos), terminando sem agentes
+    mudancas = np.flatnonzero(np.diff(escala)) + 1
+    limites = (mudancas * (duracao_intervalo * 60.0)).tolist() + [horizonte]
+    agentes_por_trecho = escala[np.concatenate(([0], mudancas))].tolist() + [0]
+
+    inicio = time.perf_counter()
+    espera, abandonou, atendidas = _simular(instantes, tempos, prazos, limites, agentes_por_trecho,
+                                            tamanho_bloco)
+    tempo = time.perf_counter() - inicio
+
+    abandonadas = int(abandonou.sum())
+    atendida = ~abandonou & ~np.isnan(espera)
+    esperas_atendidas = espera[atendida]
+
+    # Ocupação: tempo em atendimento dentro do período / tempo de agente escalado
+    inicios_atendimento = instantes[atendida] + esperas_atendidas
+    ocupado = np.clip(np.minimum(inicios_atendimento + tempos[atendida], horizonte) - inicios_atendimento,
+                      0, None).sum()
+    disponivel = float(escala.sum()) * duracao_intervalo * 60.0
+
+    # Indicadores por intervalo de chegada
+    intervalo = np.minimum((instantes // (duracao_intervalo * 60.0)).astype(np.int64), intervalos - 1)
+    chamadas_intervalo = np.bincount(intervalo, minlength=intervalos)
+    atendidas_intervalo = np.bincount(intervalo[atendida], minlength=intervalos)
+    soma_espera = np.bincount(intervalo[atendida], weights=esperas_atendidas, minlength=intervalos)
+
+    eventos = total + 2 * atendidas + abandonadas + len(limites)
+    return {
+        'chamadas': total,
+        'atendidas': atendidas,
+        'abandonadas': abandonadas,
+        'nao_atendidas': total - atendidas - abandonadas,
+        'taxa_abandono': abandonadas / total if total else 0.0,
+        'nivel_servico': float((esperas_atendidas <= tempo_alvo).sum() / total) if total else 1.0,
+        'asa': float(esperas_atendidas.mean()) if atendidas else 0.0,
+        'espera_p90': float(np.percentile(esperas_atendidas, 90)) if atendidas else 0.0,
+        'ocupacao': float(ocupado / disponivel) if disponivel else 0.0,
+        'por_intervalo': {
+            'chamadas': chamadas_intervalo,
+            'abandonadas': np.bincount(intervalo[abandonou], minlength=intervalos),
+            'asa': np.divide(soma_espera, atendidas_intervalo, out=np.zeros(intervalos),
+                             where=atendidas_intervalo > 0),
+            'agentes': escala
+        },
+        'espera': espera,
+        'abandonou': abandonou,
+        'eventos': eventos,
+        'tempo_segundos': tempo,
+        'eventos_por_segundo': eventos / tempo if tempo > 0 else 0.0
+    }
+
+def agentes_por_headcount(total_chamados, tma, data_inicio, data_fim, calendario=CALENDARIO_PADRAO):
+    """
+    Headcount fixo do período pela fórmula de calcular_metricas_operacionais
+
+    Args:
+        total_chamados (int): Total de chamados do período
+        tma (float): Tempo médio de atendimento em minutos
+        data_inicio (datetime.date): Data de início do período
+        data_fim (datetime.date): Data de fim do período
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+
+    Returns:
+        int: Pessoas necessárias
+    """
+    dias_uteis = calcular_dias_uteis_periodo(data_inicio, data_fim, calendario)
+    return calcular_metricas_operacionais(total_chamados, tma, dias_uteis)['pessoas_necessarias']
+
+def _converter_momento(texto):
+    """Converte DD/MM/AAAA[ HH:MM[:SS]] ou AAAA-MM-DD[ HH:MM[:SS]] em texto ISO"""
+    texto = texto.strip()
+    if texto[2:3] == '/':
+        texto = f"{texto[6:10]}-{texto[3:5]}-{texto[0:2]}{texto[10:]}"
+    return texto.replace(' ', 'T')
+
+def main():
+    """Simula a fila pela linha de comando"""
+    import argparse
+    from validacoes import validar_data_robusta
+
+    parser = argparse.ArgumentParser(description="Simulação de eventos discretos da fila de atendimento")
+    parser.add_argument('--inicio', required=True, help="Data de início (DD/MM/AAAA)")
+    parser.add_argument('--fim', required=True, help="Data de fim (DD/MM/AAAA)")
+    origem = parser.add_mutually_exclusive_group(required=True)
+    origem.add_argument('--chamados', type=int, help="Total de chamados do período (chegadas de Poisson uniformes)")
+    origem.add_argument('--arquivo', metavar='ARQUIVO',
+                        help="Exportação de chamados (ver ingestao_chamados.py): chegadas e tempos reais")
+    parser.add_argument('--tma', type=float, help="TMA em minutos (obrigatório com --chamados)")
+    parser.add_argument('--agentes', type=int,
+                        help="Headcount fixo (padrão: pessoas_necessarias de calcular_metricas_operacionais)")
+    parser.add_argument('--paciencia', type=float, help="Paciência média em segundos (padrão: sem abandono)")
+    parser.add_argument('--intervalo', type=int, default=30, help="Duração do intervalo em minutos (padrão: 30)")
+    parser.add_argument('--tempo-alvo', type=float, default=20, help="Tempo alvo do nível de serviço em segundos")
+    parser.add_argument('--semente', type=int, default=None, help="Semente para resultados reproduzíveis")
+    parser.add_argument('--calendario', default=CALENDARIO_PADRAO,
+                        help="Sigla da UF ou código do calendário (padrão: Brazil)")
+    args = parser.parse_args()
+
+    datas = []
+    for texto in (args.inicio, args.fim):
+        valido, mensagem, data = validar_data_robusta(texto)
+        if not valido:
+            parser.error(mensagem)
+        datas.append(data)
+    if args.chamados is not None and args.tma is None:
+        parser.error("--tma é obrigatório com --chamados")
+
+    try:
+        opcoes = {}
+        if args.arquivo:
+            from ingestao_chamados import ler_chamados
+            registros = [registro for registro in ler_chamados(args.arquivo) if registro is not None]
+            opcoes['chegadas'] = np.array([_converter_momento(data) for _, data, _ in registros],
+                                          dtype='datetime64[s]')
+            opcoes['duracoes'] = np.array([float(tma) for _, _, tma in registros])
+            total_chamados = len(registros)
+            tma = float(opcoes['duracoes'].mean()) if total_chamados else 1.0
+        else:
+            total_chamados, tma = args.chamados, args.tma
+            dias_uteis = calcular_dias_uteis_periodo(datas[0], datas[1], args.calendario)
+            intervalos = dias_uteis * (HORAS_POR_DIA * MINUTOS_POR_HORA // args.intervalo)
+            opcoes['chamadas_por_intervalo'] = np.full(intervalos, total_chamados / max(intervalos, 1))
+
+        agentes = args.agentes
+        if agentes is None:
+            agentes = agentes_por_headcount(total_chamados, tma, datas[0], datas[1], args.calendario)
+        resultado = simular_fila(datas[0], datas[1], agentes, tma, paciencia_media=args.paciencia,
+                                 duracao_intervalo=args.intervalo, tempo_alvo=args.tempo_alvo,
+                                 semente=args.semente, calendario=args.calendario, **opcoes)
+    except (OSError, ValueError) as e:
+        parser.exit(1, f"Erro: {e}\n")
+
+    print("=== SIMULAÇÃO DA FILA ===")
+    print(f"Agentes: {agentes}")
+    print(f"Chamadas: {resultado['chamadas']:,} (atendidas {resultado['atendidas']:,}, "
+          f"abandonadas {resultado['abandonadas']:,}, não atendidas {resultado['nao_atendidas']:,})")
+    print(f"Nível de serviço ({args.tempo_alvo:g} s): {resultado['nivel_servico']:.1%}")
+    print(f"ASA: {resultado['asa']:.1f} s (P90 {resultado['espera_p90']:.1f} s)")
+    print(f"Taxa de abandono: {resultado['taxa_abandono']:.1%}")
+    print(f"Ocupação: {resultado['ocupacao']:.1%}")
+    print(f"Eventos: {resultado['eventos']:,} em {resultado['tempo_segundos']:.2f} s "
+          f"({resultado['eventos_por_segundo']:,.0f} eventos/s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+"""
+Módulo de simulação de Monte Carlo do risco de dimensionamento
+
+calcular_metricas_operacionais devolve um único número de pessoas
+necessárias. Esta simulação sorteia o volume e o TMA de cada dia útil do
+período a partir de distribuições configuráveis (ou de resíduos
+históricos), calcula as pessoas necessárias de cada tentativa com a mesma
+fórmula (tempo total / minutos disponíveis por pessoa) e resume a
+distribuição: percentis, média e probabilidade de subdimensionamento de
+um headcount planejado.
+
+Os sorteios são vetorizados (NumPy, blocos de tentativas × dias úteis) e
+execuções grandes são divididas em shards processados em paralelo. Cada
+shard tem sua própria semente, derivada de uma semente única por
+numpy.random.SeedSequence: o resultado depende apenas da semente e do
+tamanho do shard, não da quantidade de processos.
+
+Especificação de uma distribuição (dict):
+    {'tipo': 'constante', 'valor': v}
+    {'tipo': 'normal', 'media': m, 'desvio': d}
+    {'tipo': 'lognormal', 'media': m, 'desvio': d}      (média e desvio da variável)
+    {'tipo': 'poisson', 'media': m}
+    {'tipo': 'triangular', 'minimo': a, 'moda': c, 'maximo': b}
+    {'tipo': 'residuos', 'media': m, 'residuos': [r1, r2, ...]}
+        (m * (1 + r), com r sorteado com reposição entre os resíduos relativos históricos)
+
+Uso:
+    python simulacao_risco.py --inicio 01/01/2025 --fim 31/12/2025 --chamados 250000 --tma 10 --cv-volume 0.2
+"""
+
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from calculos_operacionais import HORAS_POR_DIA, MINUTOS_POR_HORA, calcular_metricas_operacionais
+from calendario_utils import CALENDARIO_PADRAO, calcular_dias_uteis_periodo
+
+# Tipos de distribuição aceitos
+TIPOS_DISTRIBUICAO = ('constante', 'normal', 'lognormal', 'poisson', 'triangular', 'residuos')
+
+# Modos de simulação: sorteio por dia útil ou do total do período
+MODOS_SIMULACAO = ('diario', 'agregado')
+
+# Percentis reportados por padrão
+PERCENTIS_PADRAO = (50, 80, 90, 95, 99)
+
+# Tentativas por shard (unidade de paralelismo e de derivação das sementes)
+TAMANHO_SHARD_PADRAO = 100000
+
+# Máximo de sorteios (tentativas × dias úteis) por bloco dentro de um shard
+SORTEIOS_POR_BLOCO = 2000000
+
+def validar_distribuicao(especificacao):
+    """
+    Confere a especificação de uma distribuição
+
+    Args:
+        especificacao (dict): Especificação (ver docstring do módulo)
+
+    Raises:
+        ValueError: Se o tipo for desconhecido ou faltarem parâmetros
+    """
+    obrigatorios = {
+        'constante': ('valor',),
+        'normal': ('media', 'desvio'),
+        'lognormal': ('media', 'desvio'),
+        'poisson': ('media',),
+        'triangular': ('minimo', 'moda', 'maximo'),
+        'residuos': ('media', 'residuos')
+    }
+    tipo = especificacao.get('tipo')
+    if tipo not in obrigatorios:
+        raise ValueError(f"Distribuição desconhecida: {tipo} (use {', '.join(TIPOS_DISTRIBUICAO)})")
+    faltando = [parametro for parametro in obrigatorios[tipo] if parametro not in especificacao]
+    if faltando:
+        raise ValueError(f"Distribuição {tipo}: parâmetros ausentes: {', '.join(faltando)}")
+    if tipo == 'residuos' and len(especificacao['residuos']) == 0:
+        raise ValueError("Distribuição residuos: informe pelo menos um resíduo")
+    if tipo == 'lognormal' and especificacao['media'] <= 0:
+        raise ValueError("Distribuição lognormal: a média deve ser maior que zero")
+
+def sortear(gerador, especificacao, formato):
+    """
+    Sorteia valores não negativos de uma distribuição
+
+    Args:
+        gerador (numpy.random.Generator): Gerador de números aleatórios
+        especificacao (dict): Especificação da distribuição
+        formato (tuple): Formato do array sorteado
+
+    Returns:
+        numpy.ndarray: Valores sorteados (float64), truncados em zero
+    """
+    tipo = especificacao['tipo']
+    if tipo == 'constante':
+        return np.full(formato, float(especificacao['valor']))
+    if tipo == 'normal':
+        valores = gerador.normal(especificacao['media'], especificacao['desvio'], formato)
+    elif tipo == 'lognormal':
+        # Parâmetros da normal subjacente a partir da média e do desvio da variável
+        media, desvio = especificacao['media'], especificacao['desvio']
+        sigma2 = math.log1p((desvio / media) ** 2)
+        valores = gerador.lognormal(math.log(media) - sigma2 / 2, math.sqrt(sigma2), formato)
+    elif tipo == 'poisson':
+        valores = gerador.poisson(especificacao['media'], formato).astype(np.float64)
+    elif tipo == 'triangular':
+        valores = gerador.triangular(especificacao['minimo'], especificacao['moda'],
+                                     especificacao['maximo'], formato)
+    else:
+        residuos = np.asarray(especificacao['residuos'], dtype=np.float64)
+        valores = especificacao['media'] * (1.0 + residuos[gerador.integers(0, residuos.size, formato)])
+    return np.maximum(valores, 0.0, out=valores)
+
+def momentos_distribuicao(especificacao):
+    """
+    Calcula a média e a variância de uma distribuição (sem considerar o truncamento em zero)
+
+    Args:
+        especificacao (dict): Especificação da distribuição
+
+    Returns:
+        tuple: (média, variância)
+    """
+    tipo = especificacao['tipo']
+    if tipo == 'constante':
+        return float(especificacao['valor']), 0.0
+    if tipo in ('normal', 'lognormal'):
+        return float(especificacao['media']), float(especificacao['desvio']) ** 2
+    if tipo == 'poisson':
+        return float(especificacao['media']), float(especificacao['media'])
+    if tipo == 'triangular':
+        a, c, b = especificacao['minimo'], especificacao['moda'], especificacao['maximo']
+        return (a + b + c) / 3, (a * a + b * b + c * c - a * b - a * c - b * c) / 18
+    residuos = np.asarray(especificacao['residuos'], dtype=np.float64)
+    media = float(especificacao['media'])
+    return media * (1.0 + float(residuos.mean())), media * media * float(residuos.var())
+
+def calcular_residuos(valores_historicos, valores_previstos=None):
+    """
+    Calcula resíduos relativos históricos para a distribuição 'residuos'
+
+    Args:
+        valores_historicos (array-like): Valores observados (ex.: chamados por dia útil)
+        valores_previstos (array-like): Valores previstos para os mesmos dias
+            (padrão: a média dos observados)
+
+    Returns:
+        numpy.ndarray: Resíduos relativos (observado / previsto - 1)
+    """
+    observados = np.asarray(valores_historicos, dtype=np.float64)
+    previstos = (np.full_like(observados, observados.mean()) if valores_previstos is None
+                 else np.asarray(valores_previstos, dtype=np.float64))
+    return observados / previstos - 1.0
+
+def _simular_shard(parametros):
+    """
+    Simula um shard de tentativas e devolve o histograma de pessoas necessárias
+
+    Args:
+        parametros (tuple): (SeedSequence, tentativas, dias úteis, distribuição do
+            volume diário, distribuição do TMA, minutos disponíveis por pessoa, modo)
+
+    Returns:
+        numpy.ndarray: Contagem de tentativas por quantidade de pessoas (índice = pessoas)
+    """
+    semente, tentativas, dias_uteis, volume, tma, minutos_disponiveis, modo = parametros
+    gerador = np.random.default_rng(semente)
+    if modo == 'agregado':
+        # Soma de dias_uteis produtos independentes: normal com a mesma média e variância
+        media_volume, variancia_volume = momentos_distribuicao(volume)
+        media_tma, variancia_tma = momentos_distribuicao(tma)
+        media_dia = media_volume * media_tma
+        variancia_dia = (variancia_volume + media_volume ** 2) * (variancia_tma + media_tma ** 2) - media_dia ** 2
+        bloco = SORTEIOS_POR_BLOCO
+    else:
+        bloco = max(1, SORTEIOS_POR_BLOCO // max(dias_uteis, 1))
+    histograma = np.zeros(1, dtype=np.int64)
+
+    for inicio in range(0, tentativas, bloco):
+        quantidade = min(bloco, tentativas - inicio)
+        if modo == 'agregado':
+            tempo_total = gerador.normal(dias_uteis * media_dia, math.sqrt(dias_uteis * variancia_dia), quantidade)
+            np.maximum(tempo_total, 0.0, out=tempo_total)
+        else:
+            # Tempo total de cada tentativa: soma de volume × TMA de cada dia útil
+            formato = (quantidade, dias_uteis)
+            tempo_total = np.einsum('ij,ij->i', sortear(gerador, volume, formato),
+                                    sortear(gerador, tma, formato))
+        # Mesma fórmula (e truncamento) de calcular_metricas_operacionais
+        pessoas = (tempo_total / minutos_disponiveis).astype(np.int64)
+        contagem = np.bincount(pessoas)
+        if contagem.size > histograma.size:
+            contagem[:histograma.size] += histograma
+            histograma = contagem
+        else:
+            histograma[:contagem.size] += contagem
+    return histograma
+
+def _percentil_histograma(acumulado, total, percentil):
+    """Percentil (método inverted_cdf de numpy.percentile) a partir do histograma acumulado"""
+    return int(np.searchsorted(acumulado, math.ceil(percentil / 100 * total - 1e-9), side='left'))
+
+def simular_risco_dimensionamento(data_inicio, data_fim, volume_diario, tma, tentativas=100000,
+                                  pessoas_planejadas=None, semente=None, processos=1,
+                                  tamanho_shard=TAMANHO_SHARD_PADRAO, percentis=PERCENTIS_PADRAO,
+                                  calendario=CALENDARIO_PADRAO, jornada=None, modo='diario'):
+    """
+    Simula a distribuição de pessoas necessárias no período
+
+    Em cada tentativa são sorteados o volume e o TMA de cada dia útil do
+    período; as pessoas necessárias são o tempo total dividido pelos
+    minutos disponíveis por pessoa (truncado, como em
+    calcular_metricas_operacionais).
+
+    Args:
+        data_inicio (datetime.date): Data de início do período
+        data_fim (datetime.date): Data de fim do período
+        volume_diario (dict): Distribuição dos chamados de cada dia útil
+        tma (dict): Distribuição do TMA (minutos) de cada dia útil
+        tentativas (int): Quantidade de tentativas
+        pessoas_planejadas (int): Headcount planejado (padrão: o resultado de
+            calcular_metricas_operacionais com os valores médios)
+        semente (int): Semente para resultados reproduzíveis (None = aleatória)
+        processos (int): Processos para os shards (1 = no processo atual; None = número de CPUs)
+        tamanho_shard (int): Tentativas por shard
+        percentis (tuple): Percentis reportados
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+        jornada (jornada_trabalho.JornadaTrabalho): Jornada para os minutos disponíveis
+            (padrão: HORAS_POR_DIA em cada dia útil)
+        modo (str): 'diario' sorteia volume e TMA de cada dia útil; 'agregado'
+            sorteia diretamente o tempo total do período por uma normal com a
+            mesma média e variância (teorema central do limite: muito mais
+            rápido e adequado a períodos com muitos dias úteis)
+
+    Returns:
+        dict: Dicionário com tentativas, dias_uteis, minutos_disponiveis,
+        pessoas_planejadas, percentis (dict percentil -> pessoas), media,
+        desvio, minimo, maximo, prob_subdimensionamento (fração das tentativas
+        com mais pessoas necessárias que as planejadas), modo, semente, tempo_segundos
+        e tentativas_por_segundo
+    """
+    validar_distribuicao(volume_diario)
+    validar_distribuicao(tma)
+    if tentativas < 1 or tamanho_shard < 1:
+        raise ValueError("tentativas e tamanho_shard devem ser pelo menos 1")
+    if modo not in MODOS_SIMULACAO:
+        raise ValueError(f"Modo desconhecido: {modo} (use {', '.join(MODOS_SIMULACAO)})")
+
+    dias_uteis = calcular_dias_uteis_periodo(data_inicio, data_fim, calendario)
+    if jornada is None:
+        minutos_disponiveis = dias_uteis * HORAS_POR_DIA * MINUTOS_POR_HORA
+    else:
+        minutos_disponiveis = jornada.minutos_disponiveis(data_inicio, data_fim, calendario)
+    if dias_uteis == 0 or minutos_disponiveis == 0:
+        raise ValueError("Período sem dias úteis")
+
+    if pessoas_planejadas is None:
+        # Cenário determinístico com os valores médios das distribuições
+        pessoas_planejadas = calcular_metricas_operacionais(
+            round(momentos_distribuicao(volume_diario)[0] * dias_uteis), momentos_distribuicao(tma)[0],
+            dias_uteis, minutos_disponiveis
+        )['pessoas_necessarias']
+
+    # Uma semente por shard, derivada da semente principal
+    sequencia = np.random.SeedSequence(semente)
+    tamanhos = [min(tamanho_shard, tentativas - inicio) for inicio in range(0, tentativas, tamanho_shard)]
+    shards = [(filha, tamanho, dias_uteis, volume_diario, tma, minutos_disponiveis, modo)
+              for filha, tamanho in zip(sequencia.spawn(len(tamanhos)), tamanhos)]
+
+    inicio = time.perf_counter()
+    processos = processos or os.cpu_count()
+    if processos == 1 or len(shards) == 1:
+        histogramas = [_simular_shard(shard) for shard in shards]
+    else:
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            histogramas = list(executor.map(_simular_shard, shards))
+    tempo = time.perf_counter() - inicio
+
+    # Histogramas são somados exatamente, em qualquer ordem
+    histograma = np.zeros(max(h.size for h in histogramas), dtype=np.int64)
+    for parcial in histogramas:
+        histograma[:parcial.size] += parcial
+    acumulado = np.cumsum(histograma)
+    valores = np.arange(histograma.size)
+    media = float((valores * histograma).sum() / tentativas)
+    desvio = math.sqrt(max(float((valores ** 2 * histograma).sum() / tentativas) - media ** 2, 0.0))
+    ocupados = np.flatnonzero(histograma)
+
+    return {
+        'tentativas': tentativas,
+        'dias_uteis': dias_uteis,
+        'minutos_disponiveis': minutos_disponiveis,
+        'pessoas_planejadas': pessoas_planejadas,
+        'percentis': {percentil: _percentil_histograma(acumulado, tentativas, percentil)
+                      for percentil in percentis},
+        'media': media,
+        'desvio': desvio,
+        'minimo': int(ocupados[0]),
+        'maximo': int(ocupados[-1]),
+        'prob_subdimensionamento': float(histograma[pessoas_planejadas + 1:].sum() / tentativas),
+        'modo': modo,
+        'semente': sequencia.entropy,
+        'tempo_segundos': tempo,
+        'tentativas_por_segundo': tentativas / tempo if tempo > 0 else 0.0
+    }
+
+def main():
+    """Executa a simulação pela linha de comando"""
+    import argparse
+    from validacoes import validar_data_robusta
+
+    parser = argparse.ArgumentParser(description="Simulação de Monte Carlo do risco de dimensionamento")
+    parser.add_argument('--inicio', required=True, help="Data de início (DD/MM/AAAA)")
+    parser.add_argument('--fim', required=True, help="Data de fim (DD/MM/AAAA)")
+    parser.add_argument('--chamados', type=float, required=True, help="Total de chamados esperado no período")
+    parser.add_argument('--tma', type=float, required=True, help="TMA médio em minutos")
+    parser.add_argument('--cv-volume', type=float, default=0.2,
+                        help="Coeficiente de variação do volume diário (padrão: 0.2)")
+    parser.add_argument('--cv-tma', type=float, default=0.1, help="Coeficiente de variação do TMA diário (padrão: 0.1)")
+    parser.add_argument('--distribuicao', choices=('normal', 'lognormal'), default='lognormal',
+                        help="Distribuição do volume e do TMA (padrão: lognormal)")
+    parser.add_argument('--residuos', metavar='ARQUIVO',
+                        help="Arquivo com um resíduo relativo histórico do volume diário por linha "
+                             "(substitui --cv-volume)")
+    parser.add_argument('--modo', choices=MODOS_SIMULACAO, default='diario',
+                        help="diario: sorteia cada dia útil; agregado: sorteia o total do período (padrão: diario)")
+    parser.add_argument('--planejado', type=int, help="Headcount planejado (padrão: cálculo determinístico)")
+    parser.add_argument('--tentativas', type=int, default=1000000, help="Tentativas (padrão: 1.000.000)")
+    parser.add_argument('--semente', type=int, default=None, help="Semente para resultados reproduzíveis")
+    parser.add_argument('--processos', type=int, default=None, help="Processos (padrão: número de CPUs)")
+    parser.add_argument('--calendario', default=CALENDARIO_PADRAO,
+                        help="Sigla da UF ou código do calendário (padrão: Brazil)")
+    parser.add_argument('--jornada', metavar='ARQUIVO_JSON', help="Jornada de trabalho (ver jornada_trabalho.py)")
+    args = parser.parse_args()
+
+    datas = []
+    for texto in (args.inicio, args.fim):
+        valido, mensagem, data = validar_data_robusta(texto)
+        if not valido:
+            parser.error(mensagem)
+        datas.append(data)
+
+    try:
+        jornada = None
+        if args.jornada:
+            from jornada_trabalho import carregar_jornada
+            jornada = carregar_jornada(args.jornada)
+        dias_uteis = calcular_dias_uteis_periodo(datas[0], datas[1], args.calendario)
+        if dias_uteis == 0:
+            raise ValueError("Período sem dias úteis")
+        media_volume = args.chamados / dias_uteis
+        if args.residuos:
+            with open(args.residuos, 'r', encoding='utf-8') as arquivo:
+                residuos = [float(linha) for linha in arquivo if linha.strip()]
+            volume = {'tipo': 'residuos', 'media': media_volume, 'residuos': residuos}
+        else:
+            volume = {'tipo': args.distribuicao, 'media': media_volume, 'desvio': media_volume * args.cv_volume}
+        tma = {'tipo': args.distribuicao, 'media': args.tma, 'desvio': args.tma * args.cv_tma}
+        resultado = simular_risco_dimensionamento(
+            datas[0], datas[1], volume, tma, args.tentativas, args.planejado, args.semente,
+            args.processos, calendario=args.calendario, jornada=jornada, modo=args.modo
+        )
+    except (OSError, ValueError) as e:
+        parser.exit(1, f"Erro: {e}\n")
+
+    print("=== SIMULAÇÃO DE RISCO ===")
+    print(f"Tentativas: {resultado['tentativas']:,}, modo {resultado['modo']} ({resultado['tempo_segundos']:.2f} s, "
+          f"{resultado['tentativas_por_segundo']:,.0f} tentativas/s)")
+    print(f"Dias úteis: {resultado['dias_uteis']}")
+    print(f"Pessoas necessárias: média {resultado['media']:.2f}, desvio {resultado['desvio']:.2f}, "
+          f"de {resultado['minimo']} a {resultado['maximo']}")
+    for percentil, pessoas in resultado['percentis'].items():
+        print(f"  P{percentil}: {pessoas}")
+    print(f"Headcount planejado: {resultado['pessoas_planejadas']}")
+    print(f"Probabilidade de subdimensionamento: {resultado['prob_subdimensionamento']:.1%}")
+    print(f"Semente: {resultado['semente']}")
+
+if __name__ == "__main__":
+    main()
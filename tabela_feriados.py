@@ -0,0 +1,220 @@
+"""
+Módulo para gerar e carregar as tabelas binárias de feriados e dias úteis
+
+Cada tabela guarda o índice de dias úteis de um calendário em um
+arquivo compacto que é mapeado em memória (mmap) na carga, de modo que as
+consultas não precisam importar a workalendar nem recalcular os feriados.
+
+Formato (ordem de bytes nativa, registrada no cabeçalho):
+    cabeçalho       FORMATO_CABECALHO, completado com zeros até TAMANHO_CABECALHO
+    acumulado       int32 × (total_dias + 1)
+    dias_uteis      uint8 × total_dias
+    feriados        int32 × qtd_feriados (ordinais em ordem crescente)
+    nomes           para cada feriado: uint16 (tamanho) + nome em UTF-8
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from calendarios import CALENDARIO_PADRAO, CALENDARIOS, resolver_calendario
+from validacoes import LIMITES
+
+ASSINATURA = b'CALDUTIL'
+VERSAO_FORMATO = 1
+FORMATO_CABECALHO = '<8sHHHBxIII16s32s'
+TAMANHO_CABECALHO = 96
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+
+# Arquivo padrão do calendário nacional, ao lado dos módulos
+CAMINHO_PADRAO = os.path.join(DIRETORIO, 'feriados_brasil.bin')
+
+def caminho_tabela(calendario=CALENDARIO_PADRAO):
+    """
+    Caminho padrão da tabela de um calendário
+
+    Args:
+        calendario (str): Código ou sigla do calendário
+
+    Returns:
+        str: feriados_brasil.bin para o nacional, feriados_<código>.bin para os demais
+    """
+    codigo = resolver_calendario(calendario)
+    if codigo == CALENDARIO_PADRAO:
+        return CAMINHO_PADRAO
+    return os.path.join(DIRETORIO, f'feriados_{codigo}.bin')
+
+def _versao_workalendar():
+    """
+    Obtém a versão instalada da workalendar sem importar a biblioteca
+
+    Procura a pasta de metadados (workalendar-X.Y.Z.dist-info) ao lado do
+    pacote, evitando o custo de importar importlib.metadata na partida.
+
+    Returns:
+        str: Versão instalada ou '' se não for possível determinar
+    """
+    import importlib.util
+
+    try:
+        spec = importlib.util.find_spec('workalendar')
+    except (ImportError, ValueError):
+        return ''
+    if spec is None or not spec.origin:
+        return ''
+
+    pasta = os.path.dirname(os.path.dirname(spec.origin))
+    try:
+        nomes = os.listdir(pasta)
+    except OSError:
+        return ''
+    for nome in nomes:
+        base, extensao = os.path.splitext(nome)
+        if base.startswith('workalendar-') and extensao in ('.dist-info', '.egg-info'):
+            return base[len('workalendar-'):]
+    return ''
+
+def gerar_tabela(caminho=None, ano_inicio=None, ano_fim=None, calendario=CALENDARIO_PADRAO):
+    """
+    Gera o arquivo binário com os feriados e dias úteis de um calendário
+
+    Args:
+        caminho (str): Caminho do arquivo a ser gerado (padrão: caminho_tabela(calendario))
+        ano_inicio (int): Primeiro ano (padrão: LIMITES['ANO_MIN'])
+        ano_fim (int): Último ano (padrão: LIMITES['ANO_MAX'])
+        calendario (str): Código ou sigla do calendário
+
+    Returns:
+        int: Tamanho do arquivo gerado em bytes
+    """
+    from calendarios import criar_calendario
+    from calendario_utils import IndiceDiasUteis
+
+    codigo = resolver_calendario(calendario)
+    caminho = caminho_tabela(codigo) if caminho is None else caminho
+    ano_inicio = LIMITES['ANO_MIN'] if ano_inicio is None else ano_inicio
+    ano_fim = LIMITES['ANO_MAX'] if ano_fim is None else ano_fim
+    indice = IndiceDiasUteis.construir(criar_calendario(codigo), ano_inicio, ano_fim, codigo)
+
+    total_dias = len(indice.dias_uteis)
+    ordinais = indice.ordinais_feriados
+    cabecalho = struct.pack(
+        FORMATO_CABECALHO, ASSINATURA, VERSAO_FORMATO, ano_inicio, ano_fim,
+        1 if sys.byteorder == 'little' else 0,
+        indice.ordinal_inicio, total_dias, len(ordinais),
+        _versao_workalendar().encode('ascii'), codigo.encode('ascii')
+    )
+
+    nomes = bytearray()
+    for ordinal in ordinais:
+        nome = indice.nomes_feriados[ordinal].encode('utf-8')
+        nomes += struct.pack('<H', len(nome)) + nome
+
+    # Gravar em arquivo temporário e substituir, para não deixar tabela parcial
+    temporario = caminho + '.tmp'
+    with open(temporario, 'wb') as arquivo:
+        arquivo.write(cabecalho.ljust(TAMANHO_CABECALHO, b'\0'))
+        arquivo.write(array('i', indice.acumulado).tobytes())
+        arquivo.write(bytes(indice.dias_uteis))
+        arquivo.write(array('i', ordinais).tobytes())
+        arquivo.write(nomes)
+    os.replace(temporario, caminho)
+
+    return os.path.getsize(caminho)
+
+def carregar_tabela(caminho=None, calendario=CALENDARIO_PADRAO):
+    """
+    Carrega a tabela binária como um índice de dias úteis mapeado em memória
+
+    Retorna None quando o arquivo não existe, está corrompido ou está
+    desatualizado (outra versão do formato, outro calendário, outra faixa
+    de anos, outra ordem de bytes ou outra versão da workalendar), para que
+    o chamador use a biblioteca diretamente.
+
+    Args:
+        caminho (str): Caminho do arquivo da tabela (padrão: caminho_tabela(calendario))
+        calendario (str): Código ou sigla do calendário esperado
+
+    Returns:
+        IndiceDiasUteis: Índice carregado, ou None
+    """
+    from calendario_utils import IndiceDiasUteis
+
+    codigo = resolver_calendario(calendario)
+    caminho = caminho_tabela(codigo) if caminho is None else caminho
+
+    try:
+        with open(caminho, 'rb') as arquivo:
+            mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        (assinatura, versao, ano_inicio, ano_fim, little_endian, ordinal_inicio,
+         total_dias, qtd_feriados, versao_workalendar, calendario_tabela) = struct.unpack_from(FORMATO_CABECALHO, mapa)
+    except struct.error:
+        return None
+
+    versao_instalada = _versao_workalendar()
+    if (assinatura != ASSINATURA
+            or versao != VERSAO_FORMATO
+            or calendario_tabela.rstrip(b'\0').decode('ascii') != codigo
+            or (ano_inicio, ano_fim) != (LIMITES['ANO_MIN'], LIMITES['ANO_MAX'])
+            or bool(little_endian) != (sys.byteorder == 'little')
+            or (versao_instalada and versao_workalendar.rstrip(b'\0').decode('ascii') != versao_instalada)):
+        return None
+
+    buffer = memoryview(mapa)
+    inicio_acumulado = TAMANHO_CABECALHO
+    inicio_dias = inicio_acumulado + 4 * (total_dias + 1)
+    inicio_feriados = inicio_dias + total_dias
+    inicio_nomes = inicio_feriados + 4 * qtd_feriados
+    if len(buffer) < inicio_nomes:
+        return None
+
+    acumulado = buffer[inicio_acumulado:inicio_dias].cast('i')
+    dias_uteis = buffer[inicio_dias:inicio_feriados]
+    ordinais = buffer[inicio_feriados:inicio_nomes].cast('i')
+
+    nomes_feriados = {}
+    posicao = inicio_nomes
+    try:
+        for ordinal in ordinais:
+            (tamanho,) = struct.unpack_from('<H', mapa, posicao)
+            posicao += 2
+            nomes_feriados[ordinal] = bytes(buffer[posicao:posicao + tamanho]).decode('utf-8')
+            posicao += tamanho
+    except (struct.error, UnicodeDecodeError):
+        return None
+
+    return IndiceDiasUteis(ordinal_inicio, dias_uteis, acumulado, nomes_feriados,
+                           codigo_calendario=codigo)
+
+def main():
+    """Gera as tabelas binárias de feriados pela linha de comando"""
+    parser = argparse.ArgumentParser(description="Gera as tabelas binárias de feriados e dias úteis")
+    parser.add_argument('--calendario', nargs='+', default=[CALENDARIO_PADRAO],
+                        help="Códigos ou siglas dos calendários (padrão: Brazil)")
+    parser.add_argument('--todos', action='store_true', help="Gera as tabelas de todos os calendários")
+    parser.add_argument('--saida', help="Arquivo de saída (apenas com um calendário)")
+    args = parser.parse_args()
+
+    calendarios = list(CALENDARIOS) if args.todos else args.calendario
+    if args.saida and len(calendarios) > 1:
+        parser.error("--saida só pode ser usado com um calendário")
+
+    for calendario in calendarios:
+        try:
+            caminho = args.saida or caminho_tabela(calendario)
+        except ValueError as e:
+            parser.error(str(e))
+        tamanho = gerar_tabela(caminho, calendario=calendario)
+        print(f"Tabela gerada: {caminho} ({tamanho:,} bytes, "
+              f"anos {LIMITES['ANO_MIN']}-{LIMITES['ANO_MAX']})")
+
+if __name__ == "__main__":
+    main()
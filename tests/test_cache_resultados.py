@@ -0,0 +1,108 @@
+"""
+Testes do cache de análises de período
+"""
+
+import datetime
+import os
+
+import pytest
+
+import cache_resultados
+import calendario_utils
+from cache_resultados import CacheResultados
+
+# Fora da faixa do índice de dias úteis: passa pelo cache
+INICIO, FIM = datetime.date(1950, 1, 1), datetime.date(1950, 12, 31)
+
+@pytest.fixture
+def caminho(tmp_path):
+    anterior = cache_resultados._cache_padrao
+    yield str(tmp_path / 'cache.sqlite3')
+    cache_resultados._cache_padrao = anterior
+
+def test_resultado_igual_ao_calculo_direto(caminho):
+    cache_resultados.definir_cache(CacheResultados(caminho=caminho))
+    esperado = calendario_utils.analisar_periodo(INICIO, FIM)
+    assert cache_resultados.analisar_periodo(INICIO, FIM) == esperado
+    assert cache_resultados.analisar_periodo(INICIO, FIM) == esperado
+    assert cache_resultados.obter_cache().estatisticas()['acertos_memoria'] == 1
+
+def test_alterar_resultado_nao_afeta_o_cache(caminho):
+    cache_resultados.definir_cache(CacheResultados(caminho=caminho))
+    primeiro = cache_resultados.analisar_periodo(INICIO, FIM)
+    quantidade = len(primeiro['feriados'])
+    primeiro['feriados'].clear()
+    segundo = cache_resultados.analisar_periodo(INICIO, FIM)
+    segundo['feriados'].clear()
+    assert len(cache_resultados.analisar_periodo(INICIO, FIM)['feriados']) == quantidade
+
+def test_versoes_diferentes_compartilham_o_arquivo(caminho):
+    for versao in ('a', 'b'):
+        cache = CacheResultados(caminho=caminho, versao=versao)
+        cache.obter_ou_calcular('f', None, (1,), lambda: versao)
+        cache.fechar()
+
+    for versao in ('a', 'b'):
+        cache = CacheResultados(caminho=caminho, versao=versao)
+        assert cache.obter_ou_calcular('f', None, (1,), lambda: None) == versao
+        assert cache.estatisticas()['acertos_disco'] == 1
+        cache.fechar()
+
+def test_gravacao_em_lote(caminho):
+    cache = CacheResultados(caminho=caminho)
+    for i in range(cache_resultados.LOTE_GRAVACAO - 1):
+        cache.obter_ou_calcular('f', None, (i,), lambda: i)
+    consulta = "SELECT COUNT(*) FROM resultados"
+    assert cache._abrir().execute(consulta).fetchone()[0] == 0
+    cache.obter_ou_calcular('f', None, (-1,), lambda: -1)
+    assert cache._abrir().execute(consulta).fetchone()[0] == cache_resultados.LOTE_GRAVACAO
+    cache.fechar()
+
+@pytest.mark.parametrize('invalido', ['diretorio', 'dentro_de_arquivo'])
+def test_banco_inacessivel_usa_apenas_memoria(tmp_path, invalido):
+    arquivo = tmp_path / 'arquivo'
+    arquivo.write_text('')
+    # Um diretório não abre como banco; dentro de um arquivo não há como criar o diretório
+    caminho = str(tmp_path) if invalido == 'diretorio' else str(arquivo / 'cache.sqlite3')
+    anterior = cache_resultados._cache_padrao
+    try:
+        cache_resultados.definir_cache(CacheResultados(caminho=caminho))
+        esperado = calendario_utils.analisar_periodo(INICIO, FIM)
+        assert cache_resultados.analisar_periodo(INICIO, FIM) == esperado
+        assert cache_resultados.analisar_periodo(INICIO, FIM) == esperado
+        estatisticas = cache_resultados.obter_cache().estatisticas()
+        assert estatisticas['acertos_memoria'] == 1
+        assert estatisticas['erro_disco'] is not None
+        cache_resultados.obter_cache().fechar()
+    finally:
+        cache_resultados._cache_padrao = anterior
+
+def test_banco_padrao_fora_do_pacote():
+    pacote = os.path.dirname(os.path.abspath(cache_resultados.__file__))
+    assert os.path.dirname(cache_resultados.CAMINHO_PADRAO) != pacote
+
+def test_limite_de_linhas_e_poda_de_versoes(caminho):
+    antigo = CacheResultados(caminho=caminho, versao='antiga')
+    antigo.obter_ou_calcular('f', None, (0,), lambda: 0)
+    antigo.fechar()
+
+    cache = CacheResultados(caminho=caminho, versao='atual', limite_linhas=10)
+    for i in range(25):
+        cache.obter_ou_calcular('f', None, (i,), lambda: i)
+    cache.gravar()
+    consulta = "SELECT COUNT(*) FROM resultados"
+    assert cache._abrir().execute(consulta).fetchone()[0] == 10
+    # As mais recentes são mantidas
+    leitor = CacheResultados(caminho=caminho, versao='atual')
+    assert leitor.obter_ou_calcular('f', None, (24,), lambda: None) == 24
+    assert leitor.obter_ou_calcular('f', None, (0,), lambda: None) is None
+    leitor.fechar()
+
+    cache.limite_linhas = 100
+    antigo = CacheResultados(caminho=caminho, versao='antiga')
+    antigo.obter_ou_calcular('f', None, (0,), lambda: 0)
+    antigo.fechar()
+    assert cache.podar() == 1
+    versoes = cache._abrir().execute("SELECT DISTINCT versao FROM resultados").fetchall()
+    assert versoes == [('atual',)]
+    cache.fechar()
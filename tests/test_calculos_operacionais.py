@@ -0,0 +1,65 @@
+"""
+Testes das métricas operacionais: versão em lote contra a escalar
+"""
+
+import datetime
+import random
+
+import numpy as np
+import pytest
+
+from calendario_utils import calcular_dias_uteis_periodo
+from calculos_operacionais import calcular_metricas_operacionais, calcular_metricas_operacionais_lote
+
+def _comparar(chamados, tmas, dias, minutos=None):
+    lote = calcular_metricas_operacionais_lote(chamados, tmas, dias, minutos_disponiveis=minutos)
+    for i, (total, tma, dias_uteis) in enumerate(zip(chamados, tmas, dias)):
+        escalar = calcular_metricas_operacionais(total, tma, dias_uteis, None if minutos is None else minutos[i])
+        assert lote['pessoas_necessarias'][i] == escalar['pessoas_necessarias']
+        assert lote['horas_uteis_mes'][i] == escalar['horas_uteis_mes']
+        assert np.isclose(lote['tempo_total'][i], escalar['tempo_total'])
+        assert np.isclose(lote['capacidade_operacional'][i], escalar['capacidade_operacional'])
+
+def test_lote_igual_ao_escalar_com_tma_inteiro():
+    gerador = random.Random(1)
+    chamados = [gerador.randint(1, 1000000) for _ in range(2000)]
+    tmas = [gerador.randint(1, 120) for _ in range(2000)]
+    dias = [gerador.randint(1, 300) for _ in range(2000)]
+    _comparar(chamados, tmas, dias)
+
+def test_lote_igual_ao_escalar_com_tma_fracionario():
+    gerador = random.Random(2)
+    chamados = [gerador.randint(1, 1000000) for _ in range(2000)]
+    tmas = [round(gerador.uniform(0.5, 60), 3) for _ in range(2000)]
+    dias = [gerador.randint(1, 300) for _ in range(2000)]
+    minutos = [gerador.randint(60, 200000) for _ in range(2000)]
+    _comparar(chamados, tmas, dias)
+    _comparar(chamados, tmas, dias, minutos)
+
+def test_lote_por_datas():
+    inicio = datetime.date(2025, 1, 2)
+    fins = [inicio + datetime.timedelta(days=n) for n in (0, 6, 30, 364)]
+    lote = calcular_metricas_operacionais_lote(5000, 7.5, data_inicio=[inicio] * 4, data_fim=fins)
+    for i, fim in enumerate(fins):
+        dias_uteis = calcular_dias_uteis_periodo(inicio, fim)
+        assert lote['pessoas_necessarias'][i] == calcular_metricas_operacionais(5000, 7.5, dias_uteis)['pessoas_necessarias']
+
+def test_lote_igual_ao_escalar_com_todos_os_valores_fracionarios():
+    gerador = random.Random(3)
+    chamados = [round(gerador.uniform(1, 100000), 1) for _ in range(2000)]
+    tmas = [round(gerador.uniform(0.5, 60), 3) for _ in range(2000)]
+    dias = [round(gerador.uniform(0.5, 300), 1) for _ in range(2000)]
+    minutos = [round(gerador.uniform(60, 200000), 1) for _ in range(2000)]
+    _comparar(chamados, tmas, dias)
+    _comparar(chamados, tmas, dias, minutos)
+    _comparar([1000.5], [10], [20], [9000.5])
+    _comparar([100], [10], [5.9])
+
+@pytest.mark.parametrize('argumentos, nome', [
+    (([10, 10], [5, 0], [1, 1]), 'tma'),
+    (([10, 10], [5, 5], [1, 0]), 'dias_uteis'),
+    (([10, 10], [5, 5], [1, 1], None, None, [0, 420]), 'minutos_disponiveis'),
+])
+def test_divisao_por_zero_nomeia_o_operando(argumentos, nome):
+    with pytest.raises(ZeroDivisionError, match=f"^{nome} deve"):
+        calcular_metricas_operacionais_lote(*argumentos)
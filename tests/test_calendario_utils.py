@@ -0,0 +1,109 @@
+"""
+Testes do índice de dias úteis e das exceções da empresa
+"""
+
+import datetime
+import random
+
+import pytest
+
+from calendario_utils import obter_indice_dias_uteis
+
+def _reconstruir(indice, excecoes):
+    """Acumulado esperado, recalculado do zero a partir do mapa de origem e das exceções"""
+    dias_uteis = bytearray(indice.dias_uteis)
+    for data, util, _ in excecoes:
+        dias_uteis[data.toordinal() - indice.ordinal_inicio] = 1 if util else 0
+    acumulado = [0]
+    for dia in dias_uteis:
+        acumulado.append(acumulado[-1] + dia)
+    return list(dias_uteis), acumulado
+
+def _excecoes_aleatorias(indice, quantidade, semente):
+    gerador = random.Random(semente)
+    excecoes = []
+    for _ in range(quantidade):
+        data = indice.inicio + datetime.timedelta(days=gerador.randrange(len(indice.dias_uteis)))
+        util = gerador.random() < 0.5
+        excecoes.append((data, util, "Exceção"))
+    return excecoes
+
+def test_excecoes_uma_a_uma_iguais_a_reconstrucao():
+    origem = obter_indice_dias_uteis('Brazil')
+    excecoes = _excecoes_aleatorias(origem, 200, 1)
+    indice = origem.copiar()
+    for data, util, descricao in excecoes:
+        indice.definir_excecao(data, util, descricao, permitir_fim_de_semana=True)
+    dias_uteis, acumulado = _reconstruir(origem, excecoes)
+    assert list(indice.dias_uteis) == dias_uteis
+    assert list(indice.acumulado) == acumulado
+
+def test_excecoes_em_lote_iguais_a_reconstrucao():
+    origem = obter_indice_dias_uteis('Brazil')
+    excecoes = _excecoes_aleatorias(origem, 500, 2)
+    indice = origem.copiar()
+    assert indice.definir_excecoes(excecoes, permitir_fim_de_semana=True) == len(excecoes)
+    dias_uteis, acumulado = _reconstruir(origem, excecoes)
+    assert list(indice.dias_uteis) == dias_uteis
+    assert list(indice.acumulado) == acumulado
+    # A origem não é alterada
+    assert list(origem.acumulado) == _reconstruir(origem, [])[1]
+
+def test_folga_em_feriado_mantem_o_nome():
+    indice = obter_indice_dias_uteis('Brazil').copiar()
+    natal = datetime.date(2025, 12, 25)
+    nome = indice.nomes_feriados[natal.toordinal()]
+    indice.definir_excecao(natal, False, "Folga da empresa")
+    indice.definir_excecao(natal, False, "Recesso")
+    assert indice.nomes_feriados[natal.toordinal()] == f"{nome} / Recesso"
+    indice.definir_excecao(natal, True, "Feriado trabalhado")
+    assert not indice.eh_feriado(natal)
+
+def test_fim_de_semana_trabalhado_exige_permissao():
+    indice = obter_indice_dias_uteis('Brazil').copiar()
+    sabado = datetime.date(2025, 11, 29)
+    with pytest.raises(ValueError):
+        indice.definir_excecao(sabado, True, "Inventário")
+    with pytest.raises(ValueError):
+        indice.definir_excecoes([(datetime.date(2025, 12, 24), False, "Folga"), (sabado, True, "Inventário")])
+    # Nada foi aplicado
+    assert indice.excecoes == {}
+    indice.definir_excecao(sabado, True, "Inventário", permitir_fim_de_semana=True)
+    assert indice.eh_dia_util(sabado)
+
+def _contar_com_workalendar(cal, data_inicio, data_fim):
+    """Laço dia a dia original (referência)"""
+    dias_uteis = 0
+    feriados = []
+    data = data_inicio
+    while data <= data_fim:
+        if cal.is_holiday(data):
+            feriados.append(data)
+        elif data.weekday() < 5:
+            dias_uteis += 1
+        data += datetime.timedelta(days=1)
+    return dias_uteis, feriados
+
+@pytest.mark.parametrize('calendario', ['Brazil', 'SP'])
+def test_indice_igual_ao_laco_workalendar(calendario):
+    from calendario_utils import calcular_dias_uteis_periodo, mostrar_feriados_periodo
+    from calendarios import criar_calendario
+
+    cal = criar_calendario(calendario)
+    gerador = random.Random(3)
+    for _ in range(100):
+        data_inicio = datetime.date(2020, 1, 1) + datetime.timedelta(days=gerador.randrange(3650))
+        data_fim = data_inicio + datetime.timedelta(days=gerador.randrange(400))
+        dias_uteis, feriados = _contar_com_workalendar(cal, data_inicio, data_fim)
+        assert calcular_dias_uteis_periodo(data_inicio, data_fim, calendario) == dias_uteis
+        assert mostrar_feriados_periodo(data_inicio, data_fim, calendario) == feriados
+
+def test_dias_uteis_lote_igual_ao_escalar():
+    from calendario_utils import calcular_dias_uteis_periodo, calcular_dias_uteis_periodo_lote
+
+    gerador = random.Random(4)
+    inicios = [datetime.date(2000, 1, 1) + datetime.timedelta(days=gerador.randrange(36000)) for _ in range(2000)]
+    fins = [inicio + datetime.timedelta(days=gerador.randrange(800)) for inicio in inicios]
+    fins = [min(fim, datetime.date(2100, 12, 31)) for fim in fins]
+    lote = calcular_dias_uteis_periodo_lote(inicios, fins)
+    assert lote.tolist() == [calcular_dias_uteis_periodo(inicio, fim) for inicio, fim in zip(inicios, fins)]
@@ -0,0 +1,23 @@
+"""
+Testes da ingestão de chamados
+"""
+
+import datetime
+
+from ingestao_chamados import _converter_data, agregar_chamados
+
+def test_data_com_hora_reaproveita_o_cache():
+    _converter_data.cache_clear()
+    registros = [('fila', f"2025-01-05T{hora:02d}:{minuto:02d}:11", '5')
+                 for hora in range(24) for minuto in range(60)]
+    registros.append(('fila', '06/01/2025 08:00', '7'))
+    resultado = agregar_chamados(registros, periodo='dia')
+
+    assert resultado['grupos'][('fila', datetime.date(2025, 1, 5), datetime.date(2025, 1, 5))][:2] == [1440, 7200.0]
+    assert resultado['grupos'][('fila', datetime.date(2025, 1, 6), datetime.date(2025, 1, 6))][:2] == [1, 7.0]
+    informacoes = _converter_data.cache_info()
+    assert (informacoes.misses, informacoes.hits) == (2, 1439)
+
+def test_registros_ilegiveis_sao_descartados():
+    registros = [('fila', None, '5'), ('fila', datetime.date(2025, 1, 5), '5'), ('fila', '2025-13-01', '5')]
+    assert agregar_chamados(registros)['descartadas'] == 3
@@ -0,0 +1,45 @@
+"""
+Testes da jornada de trabalho ponderada
+"""
+
+import datetime
+
+import pytest
+
+from calendario_utils import aplicar_excecoes, calcular_dias_uteis_periodo, remover_excecoes
+from jornada_trabalho import JornadaTrabalho
+
+CALENDARIO = 'Brazil'
+
+@pytest.fixture
+def sem_excecoes():
+    """Garante o calendário sem exceções antes e depois do teste"""
+    remover_excecoes(CALENDARIO)
+    yield
+    remover_excecoes(CALENDARIO)
+
+def test_jornada_padrao_igual_a_dias_uteis(sem_excecoes):
+    jornada = JornadaTrabalho()
+    inicio = datetime.date(2024, 1, 1)
+    for deslocamento, duracao in ((0, 0), (0, 30), (45, 365), (100, 1000), (3, 6)):
+        data_inicio = inicio + datetime.timedelta(days=deslocamento)
+        data_fim = data_inicio + datetime.timedelta(days=duracao)
+        assert (jornada.minutos_disponiveis(data_inicio, data_fim, CALENDARIO)
+                == calcular_dias_uteis_periodo(data_inicio, data_fim, CALENDARIO) * 420)
+
+def test_semana_de_quatro_dias(sem_excecoes):
+    jornada = JornadaTrabalho([8, 8, 8, 8, 0, 0, 0])
+    assert jornada.minutos_disponiveis(datetime.date(2024, 3, 4), datetime.date(2024, 3, 10), CALENDARIO) == 1920
+
+def test_recesso_sem_horas(sem_excecoes):
+    recesso = (datetime.date(2024, 12, 23), datetime.date(2024, 12, 31), [0] * 7)
+    jornada = JornadaTrabalho(periodos=[recesso])
+    assert jornada.minutos_disponiveis(datetime.date(2024, 12, 23), datetime.date(2024, 12, 31), CALENDARIO) == 0
+
+def test_feriado_trabalhado_recebe_horas_dia_trabalhado(sem_excecoes):
+    jornada = JornadaTrabalho([8, 8, 8, 8, 0, 0, 0], horas_dia_trabalhado=6)
+    # 15/11/2024 (sexta, Proclamação da República): feriado trabalhado sem horas na sexta
+    aplicar_excecoes([(datetime.date(2024, 11, 15), True, "Feriado trabalhado")], CALENDARIO)
+    assert jornada.minutos_do_dia(datetime.date(2024, 11, 15), CALENDARIO) == 360
+    # Demais sextas seguem sem horas
+    assert jornada.minutos_do_dia(datetime.date(2024, 11, 22), CALENDARIO) == 0
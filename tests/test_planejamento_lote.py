@@ -0,0 +1,74 @@
+"""
+Testes do modo em lote: arquivo inteiro contra o processamento linha a linha
+"""
+
+import csv
+import random
+
+from planejamento_lote import COLUNAS_SAIDA, processar_arquivo_csv, processar_linha, validar_arquivo_csv
+from validacoes import validar_dados_completos
+
+def _gravar_entrada(caminho, linhas):
+    with open(caminho, 'w', encoding='utf-8', newline='') as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(['fila', 'total_chamados', 'tma', 'data_inicio', 'data_fim', 'calendario'])
+        escritor.writerows(linhas)
+
+def _linhas_aleatorias(quantidade):
+    gerador = random.Random(1)
+    linhas = []
+    for i in range(quantidade):
+        dia = gerador.randint(1, 28)
+        linhas.append([
+            f"fila{i % 5}",
+            gerador.choice(['', 'abc', '0', str(gerador.randint(1, 50000))]),
+            gerador.choice(['', '0', str(gerador.randint(1, 60))]),
+            gerador.choice([f"{dia:02d}/01/2025", '31/02/2025', '']),
+            gerador.choice([f"{dia:02d}/03/2025", '01/01/2024', f"{dia:02d}/01/2025"]),
+            gerador.choice(['', 'SP', 'XX'])
+        ])
+    return linhas
+
+def test_arquivo_igual_ao_processamento_linha_a_linha(tmp_path):
+    linhas = _linhas_aleatorias(500)
+    entrada, saida = tmp_path / 'entrada.csv', tmp_path / 'saida.csv'
+    _gravar_entrada(entrada, linhas)
+    resumo = processar_arquivo_csv(str(entrada), str(saida))
+
+    with open(saida, 'r', encoding='utf-8', newline='') as arquivo:
+        leitor = csv.reader(arquivo)
+        assert next(leitor) == COLUNAS_SAIDA
+        gravadas = list(leitor)
+
+    with open(entrada, 'r', encoding='utf-8', newline='') as arquivo:
+        esperadas = [[str(valor) for valor in processar_linha(numero, registro)]
+                     for numero, registro in enumerate(csv.DictReader(arquivo), start=2)]
+    assert gravadas == esperadas
+    assert resumo['total_linhas'] == len(linhas)
+
+def test_validacao_do_arquivo_igual_a_validacao_linha_a_linha(tmp_path):
+    linhas = _linhas_aleatorias(500)
+    entrada, erros = tmp_path / 'entrada.csv', tmp_path / 'erros.csv'
+    _gravar_entrada(entrada, linhas)
+    resumo = validar_arquivo_csv(str(entrada), str(erros))
+
+    validas = sum(1 for linha in linhas if validar_dados_completos(*linha[1:])[0])
+    assert resumo['linhas_validas'] == validas
+    assert resumo['linhas_com_erro'] == len(linhas) - validas
+
+def test_validacao_em_blocos_igual_a_validacao_inteira(tmp_path):
+    linhas = _linhas_aleatorias(500)
+    entrada = tmp_path / 'entrada.csv'
+    _gravar_entrada(entrada, linhas)
+    resumos, tabelas = [], []
+    for tamanho_bloco in (len(linhas), 64, 1):
+        erros = tmp_path / f'erros_{tamanho_bloco}.csv'
+        resumos.append(validar_arquivo_csv(str(entrada), str(erros), tamanho_bloco=tamanho_bloco))
+        with open(erros, 'r', encoding='utf-8', newline='') as arquivo:
+            tabelas.append(list(csv.reader(arquivo)))
+
+    for resumo in resumos:
+        resumo.pop('tempo_segundos')
+    assert resumos[1] == resumos[0] and resumos[2] == resumos[0]
+    assert tabelas[1] == tabelas[0] and tabelas[2] == tabelas[0]
+    assert resumos[0]['total_erros'] == len(tabelas[0]) - 1
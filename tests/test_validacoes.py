@@ -0,0 +1,84 @@
+"""
+Testes das validações em lote contra as validações linha a linha
+"""
+
+import random
+
+import numpy as np
+
+from validacoes import (
+    LIMITES,
+    validar_dados_completos,
+    validar_dados_lote,
+    validar_data_robusta,
+    validar_datas_lote,
+    validar_inteiros_lote,
+    validar_numero_inteiro
+)
+
+def _datas_aleatorias(quantidade, semente):
+    """Datas válidas e inválidas: dias e meses fora da faixa, formas curtas, lixo, vazios"""
+    gerador = random.Random(semente)
+    especiais = ['', ' ', 'abc', '31/02/2024', '29/02/2023', '29/02/2024', '00/01/2024', '1/1/2024',
+                 '01-01-2024', '01/13/2024', '١٢/٠١/٢٠٢٤', '01/01/1899', '01/01/2101', ' 01/01/2024 ',
+                 '1/01/2024', '01/1/2024', '001/01/2024', '01/01/24',
+                 # NULs finais são descartados pelo array de str, não pela validação escalar
+                 '4/06/2023\x00', '01/01/2024\x00', '\x00', '01/01/2024\x00\x00']
+    datas = []
+    for _ in range(quantidade):
+        sorteio = gerador.random()
+        if sorteio < 0.1:
+            datas.append(gerador.choice(especiais))
+        elif sorteio < 0.2:
+            datas.append(f"{gerador.randint(1, 31)}/{gerador.randint(1, 12)}/{gerador.randint(1890, 2110)}")
+        else:
+            datas.append(f"{gerador.randint(0, 32):02d}/{gerador.randint(0, 13):02d}/{gerador.randint(1890, 2110)}")
+    return datas
+
+def test_datas_lote_igual_a_validar_data_robusta():
+    datas = _datas_aleatorias(20000, 1)
+    validas, mensagens, convertidas = validar_datas_lote(datas, formato='ordinal')
+    for i, texto in enumerate(datas):
+        valido, mensagem, data = validar_data_robusta(texto)
+        assert validas[i] == valido, texto
+        assert mensagens[i] == mensagem, texto
+        assert convertidas[i] == (data.toordinal() if valido else 0), texto
+
+def test_datas_lote_datetime64():
+    validas, _, convertidas = validar_datas_lote(['25/12/2025', '32/12/2025'])
+    assert validas.tolist() == [True, False]
+    assert convertidas[0] == np.datetime64('2025-12-25')
+    assert np.isnat(convertidas[1])
+
+def test_inteiros_lote_igual_a_validar_numero_inteiro():
+    gerador = random.Random(2)
+    especiais = ['', ' ', '-1', '1.5', '1e3', '0', '007', '١٢', '9' * 20, ' 12', 'abc',
+                 '6\x00', '\x00', '12\x00\x00', '1\x002']
+    valores = [gerador.choice(especiais) if gerador.random() < 0.2 else str(gerador.randint(0, 2000000))
+               for _ in range(20000)]
+    validos, mensagens, numeros = validar_inteiros_lote(valores, "Campo", 1, 1000000)
+    for i, texto in enumerate(valores):
+        valido, mensagem, numero = validar_numero_inteiro(texto, "Campo", 1, 1000000)
+        assert (validos[i], mensagens[i], numeros[i]) == (valido, mensagem, numero if valido else 0), texto
+
+def test_dados_lote_igual_a_validar_dados_completos():
+    gerador = random.Random(3)
+    total = 20000
+    chamados = [gerador.choice(['', 'x', '0', '7\x00', str(gerador.randint(1, LIMITES['TOTAL_CHAMADOS_MAX'] + 10))])
+                for _ in range(total)]
+    tmas = [gerador.choice(['', '5', '0', str(gerador.randint(1, LIMITES['TMA_MAX'] + 10))]) for _ in range(total)]
+    inicios = _datas_aleatorias(total, 4)
+    fins = _datas_aleatorias(total, 5)
+    calendarios = [gerador.choice(['', 'SP', 'Brazil', 'XX']) for _ in range(total)]
+
+    resultado = validar_dados_lote(chamados, tmas, inicios, fins, calendarios)
+    erros = resultado['erros']
+    primeiro_erro = {}
+    for indice, mensagem in zip(erros['indice'].tolist(), erros['mensagem']):
+        primeiro_erro.setdefault(indice, mensagem)
+
+    for i in range(total):
+        valido, mensagem, _ = validar_dados_completos(chamados[i], tmas[i], inicios[i], fins[i], calendarios[i])
+        assert resultado['validas'][i] == valido
+        if not valido:
+            assert primeiro_erro[i] == mensagem
@@ -5,6 +5,8 @@ Módulo para validações robustas de entrada de dados
 import datetime
 import re
 
+from calendarios import CALENDARIO_PADRAO, resolver_calendario
+
 # Constantes para limites
 LIMITES = {
     'TOTAL_CHAMADOS_MIN': 1,
@@ -142,6 +144,228 @@ def validar_data_robusta(data_str):
     except Exception as e:
         return False, f"Erro ao validar data: {str(e)}", None
 
+def _textos_lote(valores):
+    """
+    Prepara uma coluna para validação vetorizada
+
+    Returns:
+        tuple: (valores originais indexáveis, array de str, máscara dos valores que não são texto)
+    """
+    import numpy as np
+    
+    valores = valores if isinstance(valores, np.ndarray) else list(valores)
+    total = len(valores)
+    if isinstance(valores, np.ndarray) and valores.dtype.kind == 'U':
+        return valores.reshape(-1), valores.reshape(-1), np.zeros(total, dtype=bool)
+    # Valores que não são texto seguem o caminho escalar (mesma mensagem de erro)
+    if set(map(type, valores)) <= {str}:
+        outros = np.zeros(total, dtype=bool)
+        com_nul = '\x00' in ''.join(valores)
+    else:
+        outros = np.fromiter((type(valor) is not str for valor in valores), dtype=bool, count=total)
+        com_nul = any(type(valor) is str and '\x00' in valor for valor in valores)
+    # O array de str descarta os NULs finais ('6\x00' viraria '6'): esses textos
+    # também seguem o caminho escalar, que os rejeita
+    if com_nul:
+        outros |= np.fromiter((type(valor) is str and '\x00' in valor for valor in valores),
+                              dtype=bool, count=total)
+    if not outros.any():
+        return valores, np.array(valores, dtype=str).reshape(-1), outros
+    textos = np.array(['' if fora else valor for valor, fora in zip(valores, outros)], dtype=str)
+    return valores, textos.reshape(-1), outros
+
+def _codigos_lote(textos, largura_minima):
+    """
+    Códigos dos caracteres de uma coluna de texto, menos '0'
+
+    Dígitos ASCII viram 0..9 e '/' vira -1; caracteres não ASCII viram 79
+    (não são dígito nem barra) e posições após o fim do texto, -48.
+
+    Returns:
+        tuple: (matriz int8 com pelo menos largura_minima colunas, comprimentos)
+    """
+    import numpy as np
+    
+    total = len(textos)
+    largura = max(textos.dtype.itemsize // 4, largura_minima)
+    codigos = np.full((total, largura), -48, dtype=np.int8)
+    if total and textos.dtype.itemsize:
+        utf32 = textos.view(np.uint32).reshape(total, -1)
+        codigos[:, :utf32.shape[1]] = np.minimum(utf32, 127).astype(np.int8) - 48
+    comprimentos = np.char.str_len(textos) if total else np.zeros(0, dtype=np.int64)
+    return codigos, comprimentos
+
+def validar_inteiros_lote(valores_str, nome_campo, min_valor=None, max_valor=None):
+    """
+    Versão vetorizada de validar_numero_inteiro para uma coluna inteira
+    
+    Textos de 1 a 15 dígitos ASCII são convertidos em bloco; os demais
+    (vazios, com outros caracteres, muito longos ou que não são texto)
+    passam por validar_numero_inteiro, de modo que as mensagens são as
+    mesmas linha a linha.
+    
+    Args:
+        valores_str (array-like): Valores a validar (lista ou array de str)
+        nome_campo (str): Nome do campo para mensagens de erro
+        min_valor (int): Valor mínimo permitido
+        max_valor (int): Valor máximo permitido
+        
+    Returns:
+        tuple: (numpy.ndarray, numpy.ndarray, numpy.ndarray) - (válidos como bool,
+        mensagens como object, valores como int64, 0 nos inválidos)
+    """
+    import numpy as np
+    
+    valores, textos, outros = _textos_lote(valores_str)
+    total = len(valores)
+    codigos, comprimentos = _codigos_lote(textos, 1)
+    largura = min(codigos.shape[1], 15)
+    
+    digitos = (codigos[:, :largura] >= 0) & (codigos[:, :largura] <= 9)
+    dentro = np.arange(largura) < comprimentos[:, None]
+    rapido = (~outros & (comprimentos >= 1) & (comprimentos <= 15)
+              & np.all(~dentro | digitos, axis=1))
+    
+    numeros = np.zeros(total, dtype=np.int64)
+    for coluna in range(largura):
+        numeros = np.where(dentro[:, coluna], numeros * 10 + codigos[:, coluna], numeros)
+    
+    abaixo = rapido & (numeros < min_valor) if min_valor is not None else np.zeros(total, dtype=bool)
+    acima = rapido & ~abaixo & (numeros > max_valor) if max_valor is not None else np.zeros(total, dtype=bool)
+    validos = rapido & ~abaixo & ~acima
+    
+    mensagens = np.array([
+        "Valor válido",
+        f"{nome_campo} deve ser maior ou igual a {min_valor}",
+        f"{nome_campo} deve ser menor ou igual a {max_valor}"
+    ], dtype=object)[(abaixo * 1 + acima * 2).astype(np.int8)]
+    
+    for posicao in np.flatnonzero(~rapido):
+        valido, mensagem, numero = validar_numero_inteiro(valores[posicao], nome_campo, min_valor, max_valor)
+        mensagens[posicao] = mensagem
+        if valido:
+            validos[posicao] = True
+            numeros[posicao] = numero
+    
+    return validos, mensagens, np.where(validos, numeros, 0)
+
+def validar_datas_lote(datas_str, formato='datetime64'):
+    """
+    Valida e converte uma coluna inteira de datas DD/MM/AAAA de uma só vez
+    
+    Versão vetorizada (NumPy) de validar_data_robusta, com as mesmas
+    mensagens por linha e sem exceções por linha: os textos no padrão
+    D/M/AAAA a DD/MM/AAAA (dígitos ASCII) são conferidos em bloco sobre os
+    códigos dos caracteres; apenas os demais (vazios, formato inválido,
+    valores que não são texto) passam por validar_data_robusta.
+    
+    Args:
+        datas_str (array-like): Datas no formato DD/MM/AAAA (lista ou array de str)
+        formato (str): 'datetime64' (datetime64[D], NaT nas inválidas) ou
+            'ordinal' (date.toordinal, 0 nas inválidas)
+        
+    Returns:
+        tuple: (numpy.ndarray, numpy.ndarray, numpy.ndarray) - (válidas como bool,
+        mensagens como object, datas no formato pedido)
+    """
+    import numpy as np
+    
+    if formato not in ('datetime64', 'ordinal'):
+        raise ValueError(f"Formato inválido: {formato}")
+    
+    valores, textos, outros = _textos_lote(datas_str)
+    total = len(valores)
+    codigos, comprimentos = _codigos_lote(textos, 10)
+    digitos = (codigos >= 0) & (codigos <= 9)
+    barras = codigos == -1
+    
+    dia = np.zeros(total, dtype=np.int32)
+    mes = np.zeros(total, dtype=np.int32)
+    ano = np.zeros(total, dtype=np.int32)
+    
+    # Caso comum, DD/MM/AAAA: posições fixas, sem indexação por linha
+    no_padrao = (
+        (comprimentos == 10) & ~outros & barras[:, 2] & barras[:, 5]
+        & digitos[:, [0, 1, 3, 4, 6, 7, 8, 9]].all(axis=1)
+    )
+    valores_digitos = codigos[:, :10].astype(np.int32)
+    dia[:] = valores_digitos[:, 0] * 10 + valores_digitos[:, 1]
+    mes[:] = valores_digitos[:, 3] * 10 + valores_digitos[:, 4]
+    ano[:] = (valores_digitos[:, 6] * 1000 + valores_digitos[:, 7] * 100
+              + valores_digitos[:, 8] * 10 + valores_digitos[:, 9])
+    
+    # D/M/AAAA, D/MM/AAAA e DD/M/AAAA: posições das barras por linha
+    curtas = np.flatnonzero(((comprimentos == 8) | (comprimentos == 9)) & ~outros)
+    if curtas.size:
+        sub_codigos = codigos[curtas, :9].astype(np.int64)
+        sub_digitos = digitos[curtas, :9]
+        sub_barras = barras[curtas, :9]
+        sub_comprimentos = comprimentos[curtas]
+        linhas = np.arange(curtas.size)
+        
+        barra_dia = np.where(sub_barras[:, 1], 1, 2)
+        barra_ano = sub_comprimentos - 5
+        tamanho_mes = barra_ano - barra_dia - 1
+        coluna = np.arange(9)
+        esperado_barra = (coluna == barra_dia[:, None]) | (coluna == barra_ano[:, None])
+        dentro = coluna < sub_comprimentos[:, None]
+        padrao_curto = (
+            (tamanho_mes >= 1) & (tamanho_mes <= 2)
+            & np.all(~dentro | np.where(esperado_barra, sub_barras, sub_digitos), axis=1)
+        )
+        
+        def numero(inicio, quantidade):
+            """Valor dos dígitos [inicio, inicio + quantidade) de cada linha curta"""
+            resultado = np.zeros(curtas.size, dtype=np.int64)
+            for deslocamento in range(4):
+                digito = sub_codigos[linhas, np.clip(inicio + deslocamento, 0, 8)]
+                resultado = np.where(deslocamento < quantidade, resultado * 10 + digito, resultado)
+            return resultado
+        
+        no_padrao[curtas] = padrao_curto
+        dia[curtas] = numero(0, barra_dia)
+        mes[curtas] = numero(barra_dia + 1, tamanho_mes)
+        ano[curtas] = numero(barra_ano + 1, 4)
+    
+    # Mesma ordem de verificação de validar_data_robusta
+    bissexto = (ano % 4 == 0) & ((ano % 100 != 0) | (ano % 400 == 0))
+    dias_no_mes = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])[np.clip(mes, 0, 12)]
+    dias_no_mes = dias_no_mes + ((mes == 2) & bissexto)
+    erro_dia = no_padrao & ((dia < 1) | (dia > 31))
+    erro_mes = no_padrao & ~erro_dia & ((mes < 1) | (mes > 12))
+    erro_ano = no_padrao & ~erro_dia & ~erro_mes & ((ano < LIMITES['ANO_MIN']) | (ano > LIMITES['ANO_MAX']))
+    erro_data = no_padrao & ~erro_dia & ~erro_mes & ~erro_ano & (dia > dias_no_mes)
+    validas = no_padrao & ~(erro_dia | erro_mes | erro_ano | erro_data)
+    
+    # Mensagens por código (0 = válida); montar por indexação é bem mais rápido
+    # que preencher um array de objetos
+    codigos_erro = (erro_dia * 1 + erro_mes * 2 + erro_ano * 3 + erro_data * 4).astype(np.int8)
+    mensagens = np.array([
+        "Data válida",
+        "Dia deve estar entre 1 e 31",
+        "Mês deve estar entre 1 e 12",
+        f"Ano deve estar entre {LIMITES['ANO_MIN']} e {LIMITES['ANO_MAX']}",
+        "Data inválida (ex: 31/02 não existe)"
+    ], dtype=object)[codigos_erro]
+    
+    # Fora do padrão: formato inválido, vazio ou não texto (poucas linhas, em geral)
+    for posicao in np.flatnonzero(~no_padrao):
+        valida, mensagem, data = validar_data_robusta(valores[posicao])
+        mensagens[posicao] = mensagem
+        if valida:
+            # Ex.: dígitos não ASCII aceitos por \d e int()
+            validas[posicao] = True
+            dia[posicao], mes[posicao], ano[posicao] = data.day, data.month, data.year
+    
+    # Datas a partir de ano/mês/dia (inválidas zeradas para uma data qualquer)
+    meses = (np.where(validas, ano, 1970) - 1970) * 12 + np.where(validas, mes, 1) - 1
+    datas = (meses.astype('datetime64[M]').astype('datetime64[D]')
+             + (np.where(validas, dia, 1) - 1).astype('timedelta64[D]'))
+    if formato == 'ordinal':
+        # date(1970, 1, 1).toordinal() == 719163
+        return validas, mensagens, np.where(validas, datas.astype(np.int64) + 719163, 0)
+    return validas, mensagens, np.where(validas, datas, np.datetime64('NaT', 'D'))
+
 def validar_periodo_datas(data_inicio, data_fim):
     """
     Valida se o período entre duas datas é válido
@@ -171,7 +395,23 @@ def validar_periodo_datas(data_inicio, data_fim):
     except Exception as e:
         return False, f"Erro ao validar período: {str(e)}"
 
-def validar_dados_completos(total_chamados_str, tma_str, data_inicio_str, data_fim_str):
+def validar_calendario(calendario_str):
+    """
+    Valida o código (ou sigla da UF) do calendário de feriados
+    
+    Args:
+        calendario_str (str): Código do calendário, sigla da UF ou vazio (nacional)
+        
+    Returns:
+        tuple: (bool, str, str) - (válido, mensagem, código do calendário)
+    """
+    try:
+        return True, "Calendário válido", resolver_calendario(calendario_str)
+    except ValueError as e:
+        return False, str(e), None
+
+def validar_dados_completos(total_chamados_str, tma_str, data_inicio_str, data_fim_str,
+                            calendario_str=None):
     """
     Valida todos os dados de entrada de uma vez
     
@@ -180,6 +420,7 @@ def validar_dados_completos(total_chamados_str, tma_str, data_inicio_str, data_f
         tma_str (str): Tempo médio de atendimento
         data_inicio_str (str): Data de início
         data_fim_str (str): Data de fim
+        calendario_str (str): Código do calendário (opcional; padrão: nacional)
         
     Returns:
         tuple: (bool, str, dict) - (válido, mensagem, dados_validados)
@@ -210,12 +451,18 @@ def validar_dados_completos(total_chamados_str, tma_str, data_inicio_str, data_f
         if not valido_periodo:
             return False, msg_periodo, None
             
+        # Validar calendário
+        valido_calendario, msg_calendario, calendario = validar_calendario(calendario_str)
+        if not valido_calendario:
+            return False, msg_calendario, None
+            
         # Retornar dados validados
         dados_validados = {
             'total_chamados': total_chamados,
             'tma': tma,
             'data_inicio': data_inicio,
-            'data_fim': data_fim
+            'data_fim': data_fim,
+            'calendario': calendario
         }
         
         return True, "Todos os dados são válidos", dados_validados
@@ -223,6 +470,161 @@ def validar_dados_completos(total_chamados_str, tma_str, data_inicio_str, data_f
     except Exception as e:
         return False, f"Erro inesperado na validação: {str(e)}", None
 
+# Regras da validação em lote (códigos da tabela de erros), na ordem dos campos
+REGRAS_VALIDACAO = (
+    'chamados_vazio', 'chamados_formato', 'chamados_minimo', 'chamados_maximo',
+    'tma_vazio', 'tma_formato', 'tma_minimo', 'tma_maximo',
+    'data_vazia', 'data_formato', 'data_dia', 'data_mes', 'data_ano', 'data_inexistente',
+    'periodo_invertido', 'periodo_longo', 'periodo_curto',
+    'calendario_desconhecido'
+)
+
+def _regra_inteiro(prefixo, mensagem):
+    """Código da regra a partir da mensagem de validar_numero_inteiro"""
+    if mensagem.endswith("não pode estar vazio"):
+        return f"{prefixo}_vazio"
+    if "maior ou igual" in mensagem:
+        return f"{prefixo}_minimo"
+    if "menor ou igual" in mensagem:
+        return f"{prefixo}_maximo"
+    return f"{prefixo}_formato"
+
+def _regra_data(mensagem):
+    """Código da regra a partir da mensagem de validar_data_robusta"""
+    if mensagem.startswith("Data não pode"):
+        return 'data_vazia'
+    if mensagem.startswith("Dia "):
+        return 'data_dia'
+    if mensagem.startswith("Mês "):
+        return 'data_mes'
+    if mensagem.startswith("Ano "):
+        return 'data_ano'
+    if mensagem.startswith("Data inválida"):
+        return 'data_inexistente'
+    return 'data_formato'
+
+def validar_dados_lote(total_chamados_str, tma_str, data_inicio_str, data_fim_str, calendario_str=None):
+    """
+    Valida colunas inteiras de dados de planejamento, reportando todas as violações
+    
+    Ao contrário de validar_dados_completos, que para no primeiro campo
+    inválido, aplica todas as regras de LIMITES a todas as linhas (máscaras
+    vetorizadas sobre as colunas) e monta uma tabela com cada violação. As
+    mensagens são as de validar_dados_completos; o período só é verificado
+    nas linhas com as duas datas válidas.
+    
+    Args:
+        total_chamados_str (array-like): Coluna do total de chamados
+        tma_str (array-like): Coluna do tempo médio de atendimento
+        data_inicio_str (array-like): Coluna da data de início (DD/MM/AAAA)
+        data_fim_str (array-like): Coluna da data de fim (DD/MM/AAAA)
+        calendario_str (array-like): Coluna do calendário (opcional; vazio = nacional)
+        
+    Returns:
+        dict: Dicionário com:
+            validas (numpy.ndarray): True nas linhas sem nenhuma violação
+            total_chamados, tma (numpy.ndarray): Valores convertidos (0 nos inválidos)
+            data_inicio, data_fim (numpy.ndarray): Datas datetime64[D] (NaT nas inválidas)
+            calendario (numpy.ndarray): Código do calendário (None nos inválidos), se informado
+            erros (dict): Tabela de erros em colunas (indice, campo, codigo, mensagem),
+                ordenada por linha e campo; indice é a posição da linha (a partir de 0)
+            contagem_por_regra (dict): Quantidade de violações de cada regra de REGRAS_VALIDACAO
+    """
+    import numpy as np
+    
+    partes = []  # (índices, campo, códigos, mensagens) por campo, na ordem dos campos
+    
+    def registrar(campo, validos, mensagens, regra, prefixo=''):
+        # Apenas as linhas com erro são percorridas em Python
+        indices = np.flatnonzero(~validos)
+        textos = mensagens[indices]
+        partes.append((indices, campo, [regra(mensagem) for mensagem in textos],
+                       np.array([prefixo + mensagem for mensagem in textos], dtype=object)))
+    
+    validos_chamados, mensagens, total_chamados = validar_inteiros_lote(
+        total_chamados_str, "Total de chamados", LIMITES['TOTAL_CHAMADOS_MIN'], LIMITES['TOTAL_CHAMADOS_MAX'])
+    registrar('total_chamados', validos_chamados, mensagens,
+              lambda mensagem: _regra_inteiro('chamados', mensagem))
+    
+    validos_tma, mensagens, tma = validar_inteiros_lote(
+        tma_str, "Tempo médio de atendimento", LIMITES['TMA_MIN'], LIMITES['TMA_MAX'])
+    registrar('tma', validos_tma, mensagens, lambda mensagem: _regra_inteiro('tma', mensagem))
+    
+    validos_inicio, mensagens, data_inicio = validar_datas_lote(data_inicio_str)
+    registrar('data_inicio', validos_inicio, mensagens, _regra_data, "Data de início: ")
+    
+    validos_fim, mensagens, data_fim = validar_datas_lote(data_fim_str)
+    registrar('data_fim', validos_fim, mensagens, _regra_data, "Data de fim: ")
+    
+    # Período: só nas linhas com as duas datas válidas, na ordem de validar_periodo_datas
+    datas_validas = validos_inicio & validos_fim
+    dias_periodo = np.where(datas_validas, (data_fim - data_inicio).astype(np.int64) + 1, 1)
+    invertido = datas_validas & (dias_periodo < 1)
+    longo = datas_validas & ~invertido & (dias_periodo > LIMITES['PERIODO_MAX_DIAS'])
+    curto = datas_validas & ~invertido & ~longo & (dias_periodo < LIMITES['PERIODO_MIN_DIAS'])
+    codigos_periodo = (invertido * 1 + longo * 2 + curto * 3).astype(np.int8)
+    regras_periodo = (None, 'periodo_invertido', 'periodo_longo', 'periodo_curto')
+    mensagens_periodo = np.array([
+        "Período válido",
+        "A data de fim deve ser posterior à data de início",
+        f"Período muito longo. Máximo de {LIMITES['PERIODO_MAX_DIAS']} dias",
+        f"Período muito curto. Mínimo de {LIMITES['PERIODO_MIN_DIAS']} dia"
+    ], dtype=object)[codigos_periodo]
+    validos_periodo = codigos_periodo == 0
+    indices = np.flatnonzero(~validos_periodo)
+    partes.append((indices, 'periodo', [regras_periodo[codigo] for codigo in codigos_periodo[indices]],
+                   mensagens_periodo[indices]))
+    validas = validos_chamados & validos_tma & datas_validas & validos_periodo
+    
+    resultado = {
+        'total_chamados': total_chamados,
+        'tma': tma,
+        'data_inicio': data_inicio,
+        'data_fim': data_fim
+    }
+    
+    # Calendário: poucos valores distintos, resolvidos uma vez cada
+    if calendario_str is not None:
+        distintos, inversos = np.unique(np.array(
+            ['' if valor is None else str(valor) for valor in calendario_str], dtype=str), return_inverse=True)
+        inversos = inversos.reshape(-1)
+        validos_distintos = np.zeros(len(distintos), dtype=bool)
+        mensagens_distintas = np.empty(len(distintos), dtype=object)
+        codigos_distintos = np.empty(len(distintos), dtype=object)
+        for i, texto in enumerate(distintos):
+            validos_distintos[i], mensagens_distintas[i], codigos_distintos[i] = validar_calendario(texto)
+        validos_calendario = validos_distintos[inversos]
+        calendarios = codigos_distintos[inversos]
+        indices = np.flatnonzero(~validos_calendario)
+        partes.append((indices, 'calendario', ['calendario_desconhecido'] * indices.size,
+                       mensagens_distintas[inversos[indices]]))
+        validas &= validos_calendario
+        resultado['calendario'] = calendarios
+    
+    # Tabela de erros ordenada por linha, mantendo a ordem dos campos (ordenação estável)
+    indices = np.concatenate([parte[0] for parte in partes]).astype(np.int64)
+    campos = np.concatenate([np.full(parte[0].size, parte[1], dtype=object) for parte in partes])
+    codigos = np.concatenate([np.array(parte[2], dtype=object) for parte in partes])
+    mensagens = np.concatenate([np.asarray(parte[3], dtype=object) for parte in partes])
+    ordem = np.argsort(indices, kind='stable')
+    
+    contagem = dict.fromkeys(REGRAS_VALIDACAO, 0)
+    regras, quantidades = np.unique(codigos.astype(str), return_counts=True) if codigos.size else ([], [])
+    for regra, quantidade in zip(regras, quantidades):
+        contagem[str(regra)] = int(quantidade)
+    
+    resultado.update({
+        'validas': validas,
+        'erros': {
+            'indice': indices[ordem],
+            'campo': campos[ordem],
+            'codigo': codigos[ordem],
+            'mensagem': mensagens[ordem]
+        },
+        'contagem_por_regra': contagem
+    })
+    return resultado
+
 def obter_mensagens_ajuda():
     """
     Retorna mensagens de ajuda para o usuário
@@ -234,5 +636,6 @@ def obter_mensagens_ajuda():
         'total_chamados': f"Digite um número entre {LIMITES['TOTAL_CHAMADOS_MIN']:,} e {LIMITES['TOTAL_CHAMADOS_MAX']:,}",
         'tma': f"Digite um número entre {LIMITES['TMA_MIN']} e {LIMITES['TMA_MAX']} minutos (máximo 24 horas)",
         'data': f"Use o formato DD/MM/AAAA (ano entre {LIMITES['ANO_MIN']} e {LIMITES['ANO_MAX']})",
-        'periodo': f"Período deve ter entre {LIMITES['PERIODO_MIN_DIAS']} e {LIMITES['PERIODO_MAX_DIAS']} dias"
+        'periodo': f"Período deve ter entre {LIMITES['PERIODO_MIN_DIAS']} e {LIMITES['PERIODO_MAX_DIAS']} dias",
+        'calendario': f"Sigla da UF (ex.: SP) ou código do calendário (ex.: BrazilSaoPauloCity); vazio = {CALENDARIO_PADRAO}"
     } 
\ No newline at end of file
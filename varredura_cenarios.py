@@ -0,0 +1,266 @@
+"""
+Módulo para varredura paralela de cenários (what-if) de headcount
+"""
+
+import argparse
+import datetime
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from calendario_utils import (
+    CALENDARIO_PADRAO,
+    IndiceDiasUteis,
+    calcular_dias_uteis_periodo,
+    definir_indice_dias_uteis,
+    obter_indice_dias_uteis
+)
+from calculos_operacionais import calcular_metricas_operacionais
+
+# Campos de cada linha de resultado da varredura
+CAMPOS_RESULTADO = (
+    'data_inicio', 'data_fim', 'tma', 'total_chamados', 'dias_uteis',
+    'tempo_total', 'horas_uteis_mes', 'capacidade_operacional', 'pessoas_necessarias'
+)
+
+# Estado de cada processo trabalhador (preenchido por _inicializar_trabalhador)
+_estado_trabalhador = {}
+
+def gerar_periodos_moveis(data_inicio, data_fim, tamanho_dias, passo_dias=1):
+    """
+    Gera períodos móveis de tamanho fixo dentro de um horizonte
+
+    Args:
+        data_inicio (datetime.date): Início do horizonte
+        data_fim (datetime.date): Fim do horizonte
+        tamanho_dias (int): Tamanho de cada período em dias
+        passo_dias (int): Deslocamento entre períodos consecutivos
+
+    Returns:
+        list: Lista de tuplas (data_inicio, data_fim)
+    """
+    periodos = []
+    inicio = data_inicio
+    duracao = datetime.timedelta(days=tamanho_dias - 1)
+    passo = datetime.timedelta(days=passo_dias)
+    while inicio + duracao <= data_fim:
+        periodos.append((inicio, inicio + duracao))
+        inicio += passo
+    return periodos
+
+def _calcular_faixa(periodos, tmas, volumes, inicio, fim, calendario=CALENDARIO_PADRAO):
+    """
+    Calcula os cenários de índice [inicio, fim) do produto periodos × tmas × volumes
+
+    Os cenários são enumerados na ordem período, TMA, volume, de modo que
+    o índice identifica o cenário sem precisar enviá-lo ao trabalhador.
+
+    Returns:
+        list: Linhas de resultado (tuplas na ordem de CAMPOS_RESULTADO)
+    """
+    por_periodo = len(tmas) * len(volumes)
+    resultados = []
+    periodo_atual = None
+    dias_uteis = 0
+
+    for posicao in range(inicio, fim):
+        i_periodo, resto = divmod(posicao, por_periodo)
+        i_tma, i_volume = divmod(resto, len(volumes))
+
+        if i_periodo != periodo_atual:
+            periodo_atual = i_periodo
+            data_inicio, data_fim = periodos[i_periodo]
+            dias_uteis = calcular_dias_uteis_periodo(data_inicio, data_fim, calendario)
+
+        tma = tmas[i_tma]
+        volume = volumes[i_volume]
+        if dias_uteis == 0:
+            resultados.append((data_inicio, data_fim, tma, volume, 0, None, None, None, None))
+            continue
+
+        metricas = calcular_metricas_operacionais(volume, tma, dias_uteis)
+        resultados.append((
+            data_inicio, data_fim, tma, volume, dias_uteis,
+            metricas['tempo_total'], metricas['horas_uteis_mes'],
+            metricas['capacidade_operacional'], metricas['pessoas_necessarias']
+        ))
+
+    return resultados
+
+def _publicar_indice(indice):
+    """
+    Copia as tabelas do índice de dias úteis para um bloco de memória compartilhada
+
+    Layout: acumulado (len(dias) + 1 itens) seguido do mapa de dias úteis.
+
+    Returns:
+        tuple: (SharedMemory, dict com os parâmetros para reabrir o índice)
+    """
+    acumulado = memoryview(indice.acumulado)
+    bytes_acumulado = acumulado.tobytes()
+    bytes_dias = bytes(indice.dias_uteis)
+    memoria = shared_memory.SharedMemory(create=True, size=len(bytes_acumulado) + len(bytes_dias))
+    memoria.buf[:len(bytes_acumulado)] = bytes_acumulado
+    memoria.buf[len(bytes_acumulado):len(bytes_acumulado) + len(bytes_dias)] = bytes_dias
+
+    parametros = {
+        'nome': memoria.name,
+        'typecode': acumulado.format,
+        'tamanho_acumulado': len(bytes_acumulado),
+        'total_dias': len(bytes_dias),
+        'ordinal_inicio': indice.ordinal_inicio,
+        'nomes_feriados': indice.nomes_feriados,
+        'calendario': indice.codigo_calendario
+    }
+    return memoria, parametros
+
+def _inicializar_trabalhador(parametros_indice, periodos, tmas, volumes):
+    """
+    Inicializa um processo trabalhador com o índice publicado em memória compartilhada
+    """
+    memoria = shared_memory.SharedMemory(name=parametros_indice['nome'])
+    tamanho = parametros_indice['tamanho_acumulado']
+    acumulado = memoria.buf[:tamanho].cast(parametros_indice['typecode'])
+    dias_uteis = memoria.buf[tamanho:tamanho + parametros_indice['total_dias']]
+
+    calendario = parametros_indice['calendario']
+    definir_indice_dias_uteis(IndiceDiasUteis(
+        parametros_indice['ordinal_inicio'], dias_uteis, acumulado,
+        parametros_indice['nomes_feriados'], codigo_calendario=calendario
+    ), calendario)
+
+    # Manter a referência para o bloco não ser fechado enquanto o processo vive
+    _estado_trabalhador['memoria'] = memoria
+    _estado_trabalhador['cenarios'] = (periodos, tmas, volumes)
+    _estado_trabalhador['calendario'] = calendario
+
+def _processar_fatia(faixa):
+    """Calcula uma fatia de cenários dentro de um processo trabalhador"""
+    periodos, tmas, volumes = _estado_trabalhador['cenarios']
+    return _calcular_faixa(periodos, tmas, volumes, faixa[0], faixa[1], _estado_trabalhador['calendario'])
+
+def executar_varredura_serial(periodos, tmas, volumes, calendario=CALENDARIO_PADRAO):
+    """
+    Executa a varredura de cenários no processo atual
+
+    Args:
+        periodos (list): Tuplas (data_inicio, data_fim)
+        tmas (list): TMAs em minutos
+        volumes (list): Totais de chamados
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+
+    Returns:
+        list: Linhas de resultado na ordem período, TMA, volume
+    """
+    total = len(periodos) * len(tmas) * len(volumes)
+    return _calcular_faixa(periodos, tmas, volumes, 0, total, calendario)
+
+def executar_varredura(periodos, tmas, volumes, processos=None, tamanho_fatia=50000,
+                       calendario=CALENDARIO_PADRAO):
+    """
+    Executa a varredura de cenários em paralelo, em um pool de processos
+
+    O índice de dias úteis é construído uma vez no processo principal e
+    publicado em memória compartilhada; os trabalhadores o usam diretamente,
+    sem recalcular os feriados. Os resultados são devolvidos na mesma ordem
+    de executar_varredura_serial.
+
+    Args:
+        periodos (list): Tuplas (data_inicio, data_fim)
+        tmas (list): TMAs em minutos
+        volumes (list): Totais de chamados
+        processos (int): Número de processos (padrão: número de CPUs)
+        tamanho_fatia (int): Quantidade de cenários por tarefa
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+
+    Returns:
+        list: Linhas de resultado na ordem período, TMA, volume
+    """
+    periodos, tmas, volumes = list(periodos), list(tmas), list(volumes)
+    total = len(periodos) * len(tmas) * len(volumes)
+    fatias = [(inicio, min(inicio + tamanho_fatia, total)) for inicio in range(0, total, tamanho_fatia)]
+
+    memoria, parametros = _publicar_indice(obter_indice_dias_uteis(calendario))
+    try:
+        with ProcessPoolExecutor(
+            max_workers=processos or os.cpu_count(),
+            initializer=_inicializar_trabalhador,
+            initargs=(parametros, periodos, tmas, volumes)
+        ) as executor:
+            resultados = []
+            # executor.map preserva a ordem das fatias
+            for parcial in executor.map(_processar_fatia, fatias):
+                resultados.extend(parcial)
+    finally:
+        memoria.close()
+        memoria.unlink()
+
+    return resultados
+
+def comparar_desempenho(periodos, tmas, volumes, processos=None, tamanho_fatia=50000,
+                        calendario=CALENDARIO_PADRAO):
+    """
+    Executa a varredura em série e em paralelo e compara os tempos
+
+    Args:
+        periodos (list): Tuplas (data_inicio, data_fim)
+        tmas (list): TMAs em minutos
+        volumes (list): Totais de chamados
+        processos (int): Número de processos do modo paralelo
+        tamanho_fatia (int): Quantidade de cenários por tarefa
+        calendario (str): Código do calendário (ver calendarios.CALENDARIOS)
+
+    Returns:
+        dict: Relatório com cenários, tempos, speedup e conferência dos resultados
+    """
+    # Construir o índice antes de medir, para comparar apenas a varredura
+    obter_indice_dias_uteis(calendario)
+
+    inicio = time.perf_counter()
+    serial = executar_varredura_serial(periodos, tmas, volumes, calendario)
+    tempo_serial = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    paralelo = executar_varredura(periodos, tmas, volumes, processos, tamanho_fatia, calendario)
+    tempo_paralelo = time.perf_counter() - inicio
+
+    return {
+        'cenarios': len(serial),
+        'processos': processos or os.cpu_count(),
+        'tempo_serial': tempo_serial,
+        'tempo_paralelo': tempo_paralelo,
+        'speedup': tempo_serial / tempo_paralelo if tempo_paralelo > 0 else 0.0,
+        'resultados_iguais': serial == paralelo
+    }
+
+def main():
+    """Executa uma varredura de exemplo e exibe o relatório de speedup"""
+    parser = argparse.ArgumentParser(description="Varredura paralela de cenários de headcount")
+    parser.add_argument('--ano', type=int, default=datetime.date.today().year,
+                        help="Ano do horizonte de períodos móveis")
+    parser.add_argument('--janela', type=int, default=30, help="Tamanho de cada período em dias")
+    parser.add_argument('--tma-max', type=int, default=1440, help="Maior TMA da varredura (de 1 até este valor)")
+    parser.add_argument('--volumes', type=int, nargs='+', default=[100, 500, 1000, 5000, 10000],
+                        help="Escada de volumes de chamados")
+    parser.add_argument('--processos', type=int, default=None, help="Número de processos")
+    parser.add_argument('--calendario', default=CALENDARIO_PADRAO,
+                        help="Código ou sigla do calendário (padrão: Brazil)")
+    args = parser.parse_args()
+
+    periodos = gerar_periodos_moveis(
+        datetime.date(args.ano, 1, 1), datetime.date(args.ano, 12, 31), args.janela
+    )
+    relatorio = comparar_desempenho(periodos, range(1, args.tma_max + 1), args.volumes, args.processos,
+                                    calendario=args.calendario)
+
+    print("=== VARREDURA DE CENÁRIOS ===")
+    print(f"Cenários: {relatorio['cenarios']:,}")
+    print(f"Processos: {relatorio['processos']}")
+    print(f"Tempo serial: {relatorio['tempo_serial']:.2f} s")
+    print(f"Tempo paralelo: {relatorio['tempo_paralelo']:.2f} s")
+    print(f"Speedup: {relatorio['speedup']:.2f}x")
+    print(f"Resultados idênticos: {'sim' if relatorio['resultados_iguais'] else 'NÃO'}")
+
+if __name__ == "__main__":
+    main()